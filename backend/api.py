@@ -1,30 +1,161 @@
+from app.startup import StartupReport
+
+startup_report = StartupReport("api")
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import joblib
-from rules_engine import combine_ml_and_rules
+from fastapi.security import OAuth2PasswordBearer
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from inference_executor import InferenceExecutor, ExecutorBusy
+from symptom_model import load_symptom_model
+from result_cache import TTLCache
+import geohash
+import json
+from doctor_store import DoctorStore
+from directory_reloader import DirectoryReloader
+from doctor_counts import DoctorCounts
+from app.metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.responses import DEFAULT_RESPONSE_CLASS
+from app.compression import add_compression
+from app.admission import AdmissionLimiter, add_admission_control
+import numpy as np
+import os
+import hashlib
+import threading
 import random
+import time
 from typing import List, Optional
 from datetime import datetime
 import sqlite3
-from passlib.context import CryptContext
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
-import requests
+import functools
 
 # Security setup
 # Security setup
 # Using pbkdf2_sha256 to avoid bcrypt binary issues on some Windows envs
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Built on first use: passlib is only needed by the password routes
+@functools.lru_cache(maxsize=None)
+def pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 GOOGLE_CLIENT_ID = "623160436329-7rpnpqd57c7ad658f3q5dt3d45cpbjvp.apps.googleusercontent.com" # User must replace this
 
 # --- Load ML Model ---
-try:
-    model = joblib.load("triage_model.pkl")
-except:
-    model = None # Fallback if model missing
+MODEL_PATH = "triage_model.pkl"
+
+def file_version(path: str) -> str:
+    """Short content hash used to tag caches with the artifact they were built from."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+# Both models are loaded by load_models() in the lifespan, not at import
+model = None # None if triage_model.pkl is missing
+model_version = None
+# MCQ disease/specialty classifier (train_symptom_model.py), loaded only with
+# SYMPTOM_MODEL_ENABLED=1; None -> deterministic mapper only
+symptom_model = None
+
+def load_models():
+    """Load the triage pipeline and MCQ classifier and start the inference executor (once)."""
+    global model, model_version, symptom_model, inference_executor
+    if model is None:
+        try:
+            import joblib # pulls in sklearn/pandas through the pickle
+            model = joblib.load(MODEL_PATH)
+            model_version = file_version(MODEL_PATH)
+        except Exception:
+            model = None # Fallback if model missing
+            model_version = None
+        triage_cache.set_version(model_version)
+    if symptom_model is None and SYMPTOM_MODEL_ENABLED:
+        symptom_model = load_symptom_model()
+    if model and inference_executor is None:
+        inference_executor = InferenceExecutor(
+            model, MODEL_PATH,
+            mode=TRIAGE_EXECUTOR,
+            max_workers=TRIAGE_EXECUTOR_WORKERS,
+            max_queue=TRIAGE_EXECUTOR_QUEUE
+        )
+
+def reload_model() -> bool:
+    """
+    Swap in triage_model.pkl if its content changed since it was loaded.
+    Drops the triage cache (new model_version) and replaces the inference
+    executor; calls already running on the old one finish there. Returns
+    whether a new model was loaded.
+    """
+    global model, model_version, inference_executor
+    try:
+        version = file_version(MODEL_PATH)
+    except OSError:
+        return False
+    if model is not None and version == model_version:
+        return False
+    import joblib
+    new_model = joblib.load(MODEL_PATH)
+    new_executor = InferenceExecutor(
+        new_model, MODEL_PATH,
+        mode=TRIAGE_EXECUTOR,
+        max_workers=TRIAGE_EXECUTOR_WORKERS,
+        max_queue=TRIAGE_EXECUTOR_QUEUE
+    )
+    old_executor = inference_executor
+    model, model_version, inference_executor = new_model, version, new_executor
+    triage_cache.set_version(version)
+    if old_executor:
+        old_executor.shutdown(wait=False, cancel_futures=False)
+    return True
 
-app = FastAPI(title="Smart Triage API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global inference_executor
+    with startup_report.phase("schema"):
+        init_db()
+    with startup_report.phase("models"):
+        load_models()
+    with startup_report.phase("doctor_directory"):
+        doctor_directory.start()
+    with startup_report.phase("doctor_accounts"):
+        start_account_recounts()
+    startup_report.finish()
+    app.state.startup_report = startup_report
+    yield
+    stop_account_recounts()
+    doctor_directory.stop()
+    if inference_executor:
+        inference_executor.shutdown()
+        inference_executor = None
+
+app = FastAPI(title="Smart Triage API", default_response_class=DEFAULT_RESPONSE_CLASS, lifespan=lifespan)
+
+# /api/admin/* needs an admin bearer token issued by app.main (role 'admin' in
+# its users table). app.auth/app.database (sqlalchemy, jose) are imported on
+# the first admin call, not with this module.
+admin_token = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+
+def require_admin(token: str = Depends(admin_token)):
+    from app import auth, database
+    with database.SessionLocal() as db:
+        return auth.require_admin_role(auth.user_from_token(token, db))
+
+ADMIN_ONLY = Depends(require_admin)
+
+# --- Admission Control ---
+# Shed load with a fast 503 instead of queueing in the threadpool. Added
+# before CORS so rejections still carry CORS headers.
+admission_limiters = add_admission_control(app, {
+    AdmissionLimiter.from_env("triage", 8, 32, 2.0): [("POST", "/triage")],
+    AdmissionLimiter.from_env("recommendations", 16, 64, 2.0): [("POST", "/api/symptom-recommendations")],
+    # Password hashing: every route that hashes or verifies shares the CPU budget
+    AdmissionLimiter.from_env("auth", 4, 16, 3.0): [
+        ("POST", "/api/patients/signup"),
+        ("POST", "/api/patients/signin"),
+        ("POST", "/api/doctors/signup"),
+        ("POST", "/api/auth/login"),
+    ],
+})
 
 # --- CORS ---
 app.add_middleware(
@@ -34,6 +165,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Recommendation payloads repeat whole doctor blocks; compress large bodies
+add_compression(app)
 
 # --- IN-MEMORY DATABASE ---
 # In a real app, use SQLite/PostgreSQL
@@ -61,8 +194,6 @@ def init_db():
     conn.commit()
     conn.close()
 
-init_db() # Run on startup
-
 # --- Data Models ---
 class TriageInput(BaseModel):
     symptoms_text: str
@@ -70,7 +201,9 @@ class TriageInput(BaseModel):
     fever: bool
     chest_pain: bool
     duration_days: int
-    doctor_counts: dict | None = None
+    city: Optional[str] = None  # Count only doctors in this city
+    # Deprecated: ignored, availability is counted server-side
+    doctor_counts: dict | None = Field(default=None, deprecated=True)
 
 class TriageOutput(BaseModel):
     specialty: str
@@ -115,45 +248,134 @@ class GoogleAuthRequest(BaseModel):
     token: str
     role: str # 'patient' or 'doctor'
 
+# --- Triage Result Cache ---
+# Intake forms submit the same canned phrases over and over, so the
+# (predict_proba + rules) result is cached by normalized input. Inference runs
+# on that same normalized input, so a cached result is exactly what the model
+# gives for its key. The cache is dropped when a changed model file is loaded
+# (POST /api/admin/model/reload). TRIAGE_CACHE_SIZE=0 disables it.
+TRIAGE_CACHE_SIZE = int(os.getenv("TRIAGE_CACHE_SIZE", "4096"))
+TRIAGE_CACHE_TTL = float(os.getenv("TRIAGE_CACHE_TTL", "3600"))
+# Share entries across nearby ages/durations (5-year age bands, coarse duration bands);
+# inference then sees the lower bound of each band
+TRIAGE_CACHE_BUCKET_NUMERIC = os.getenv("TRIAGE_CACHE_BUCKET_NUMERIC", "0") == "1"
+DURATION_BUCKETS = [0, 1, 2, 3, 7, 14, 30]
+
+triage_cache = TTLCache(maxsize=TRIAGE_CACHE_SIZE, ttl=TRIAGE_CACHE_TTL)
+
+# --- Inference Executor ---
+# Model inference runs on its own pool instead of FastAPI's shared threadpool.
+# TRIAGE_EXECUTOR=process gives each worker process its own copy of the model.
+TRIAGE_EXECUTOR = os.getenv("TRIAGE_EXECUTOR", "thread")
+TRIAGE_EXECUTOR_WORKERS = int(os.getenv("TRIAGE_EXECUTOR_WORKERS", "2"))
+TRIAGE_EXECUTOR_QUEUE = int(os.getenv("TRIAGE_EXECUTOR_QUEUE", "32"))
+
+inference_executor = None # started by load_models()
+
+# --- Triage Metrics ---
+# Per-stage latency of every /triage request. Cache hits only record response_build.
+TRIAGE_STAGES = ("feature_prep", "vectorize", "classify", "rules", "response_build")
+triage_stage_seconds = REGISTRY.histogram(
+    "triage_stage_seconds",
+    "Time spent in each /triage pipeline stage",
+    labelnames=("stage", "model_version", "path")
+)
+triage_requests_total = REGISTRY.counter(
+    "triage_requests_total",
+    "Triage requests by winning decision path and cache result",
+    labelnames=("model_version", "path", "cache")
+)
+REGISTRY.gauge("triage_cache_hits", "Triage result cache hits", lambda: triage_cache.hits)
+REGISTRY.gauge("triage_cache_misses", "Triage result cache misses", lambda: triage_cache.misses)
+REGISTRY.gauge("triage_executor_in_flight", "Inference calls running or queued",
+               lambda: inference_executor.in_flight if inference_executor else None)
+REGISTRY.gauge("triage_executor_rejected", "Inference calls rejected because the queue was full",
+               lambda: inference_executor.rejected if inference_executor else None)
+REGISTRY.gauge("triage_executor_errors", "Inference calls that raised",
+               lambda: inference_executor.errors if inference_executor else None)
+
+def decision_path(reason: str) -> str:
+    """'rule' if combine_ml_and_rules picked the rule match, else 'ml'."""
+    return "rule" if reason.startswith("Rule Prediction") else "ml"
+
+def triage_cache_key(data: TriageInput) -> tuple:
+    """Lowercased, whitespace-collapsed text plus the numeric features."""
+    text = " ".join(data.symptoms_text.lower().split())
+    age = data.age
+    duration = data.duration_days
+    if TRIAGE_CACHE_BUCKET_NUMERIC:
+        age = age // 5 * 5
+        duration = max((b for b in DURATION_BUCKETS if b <= duration), default=duration)
+    return (text, age, data.fever, data.chest_pain, duration)
+
 # --- Routes: Triage (Existing) ---
 @app.post("/triage", response_model=TriageOutput)
-def predict_specialty(data: TriageInput):
+async def predict_specialty(data: TriageInput):
     if not model:
         return TriageOutput(specialty="General Medicine", confidence=0.0, reason="Model not loaded", doctor_count=0)
 
-    # 1. Prepare Features
-    features = {
-        "symptoms_text": [data.symptoms_text],
-        "age": [data.age],
-        "fever": [1 if data.fever else 0],
-        "chest_pain": [1 if data.chest_pain else 0],
-        "duration_days": [data.duration_days]
-    }
-    
-    # 2. ML Prediction
-    probs = model.predict_proba(features)[0]
-    classes = model.classes_
-    best_idx = probs.argmax()
-    ml_specialty = classes[best_idx]
-    ml_confidence = float(probs[best_idx])
-    
-    # 3. Hybrid Logic
-    final_specialty, final_conf, reason = combine_ml_and_rules(
-        ml_specialty, ml_confidence, data.symptoms_text
-    )
+    cache_key = triage_cache_key(data)
+    cached = triage_cache.get(cache_key)
+    timings = {}
+    cache_status = "hit"
+    if cached is None:
+        cache_status = "miss"
+        # 1-3. Features, ML prediction and hybrid rules logic, on the inference executor
+        try:
+            cached, timings = await inference_executor.submit(*cache_key)
+        except ExecutorBusy:
+            raise HTTPException(
+                status_code=503,
+                detail="Triage service is busy, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+        triage_cache.set(cache_key, cached)
+
+    final_specialty, final_conf, reason = cached
+    build_start = time.perf_counter()
     
-    # 4. Check Availability
-    count = 0
-    if data.doctor_counts and final_specialty in data.doctor_counts:
-        count = data.doctor_counts[final_specialty]
+    # 4. Check Availability (the directory is loaded by the lifespan; load it
+    # off the event loop if this request got here first)
+    if doctor_directory.store is None:
+        await run_in_threadpool(get_doctor_store)
+    count = doctor_counts.count(final_specialty, data.city)
         
-    return TriageOutput(
+    output = TriageOutput(
         specialty=final_specialty,
         confidence=final_conf,
         reason=reason,
         doctor_count=count
     )
 
+    timings["response_build"] = time.perf_counter() - build_start
+    path = decision_path(reason)
+    for stage, seconds in timings.items():
+        triage_stage_seconds.observe(seconds, stage=stage, model_version=model_version, path=path)
+    triage_requests_total.inc(model_version=model_version, path=path, cache=cache_status)
+    return output
+
+@app.get("/triage/cache")
+def triage_cache_stats():
+    """Hit/miss counters for the /triage result cache."""
+    return triage_cache.stats()
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus text exposition of the triage metrics."""
+    return PlainTextResponse(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/api/admin/admission", dependencies=[ADMIN_ONLY])
+def admission_status():
+    """In-flight, queued, admitted and rejected requests per admission limiter."""
+    return {name: limiter.stats() for name, limiter in admission_limiters.items()}
+
+@app.get("/triage/executor")
+def triage_executor_stats():
+    """Queue depth and rejection counters for the inference executor."""
+    if not inference_executor:
+        return {"mode": None}
+    return inference_executor.stats()
+
 # --- Routes: Auth ---
 @app.post("/api/patients/signup")
 def patient_signup(data: PatientSignup):
@@ -167,7 +389,7 @@ def patient_signup(data: PatientSignup):
         raise HTTPException(status_code=400, detail="Username already exists")
     
     # Hash password and insert
-    hashed_pw = pwd_context.hash(data.password)
+    hashed_pw = pwd_context().hash(data.password)
     try:
         cursor.execute(
             "INSERT INTO patients (full_name, username, password_hash) VALUES (?, ?, ?)",
@@ -194,7 +416,7 @@ def patient_signin(data: PatientSignin):
     user = cursor.fetchone()
     conn.close()
     
-    if not user or not pwd_context.verify(data.password, user['password_hash']):
+    if not user or not pwd_context().verify(data.password, user['password_hash']):
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
     return {
@@ -275,6 +497,7 @@ def google_auth(data: GoogleAuthRequest):
                     "createdAt": datetime.now().isoformat()
                 }
                 users_db.append(new_doc)
+                doctor_counts.add_doctor(new_doc["specialty"])
                 user = new_doc
             
             return {"ok": True, "user": user, "role": "doctor"}
@@ -309,6 +532,7 @@ def doctor_signup(user: UserSignup):
         "createdAt": datetime.now().isoformat()
     }
     users_db.append(new_user)
+    doctor_counts.add_doctor(new_user["specialty"], new_user["location"])
     return {"access_token": f"fake-token-{new_user['id']}", "user": new_user}
 
 @app.post("/api/auth/login")
@@ -463,6 +687,46 @@ def map_answers_to_specialties(answers: dict) -> List[str]:
     
     return selected
 
+# The MCQ model is trained on symptom_dataset.csv, whose codebook gives q1-q10
+# different meanings from the questionnaire this endpoint serves (e.g. q10 is
+# pregnancy here, systemic symptoms there). Until it is retrained on answers
+# encoded like the questionnaire it stays off: SYMPTOM_MODEL_ENABLED=1 opts in.
+SYMPTOM_MODEL_ENABLED = os.getenv("SYMPTOM_MODEL_ENABLED", "0") == "1"
+# The MCQ model is used only when its top disease is at least this likely;
+# specialties below SYMPTOM_MODEL_MIN_SPECIALTY_PROB are not recommended.
+SYMPTOM_MODEL_MIN_CONFIDENCE = 0.5
+SYMPTOM_MODEL_MIN_SPECIALTY_PROB = 0.3
+# Answers that settle the specialty on their own: the mapper always decides these
+RED_FLAG_ANSWERS = {
+    ('q8', 'a'): 'Orthopedics',             # fracture/sprain/major injury
+    ('q9', 'a'): 'Psychiatry',              # severe mental health changes
+    ('q10', 'a'): 'Obstetrics/Gynecology',  # pregnant or unsure
+}
+
+def recommend_specialties(answers: dict):
+    """
+    Returns (specialties, source, diseases).
+    Uses the trained MCQ classifier when it is loaded and confident, otherwise
+    falls back to the deterministic map_answers_to_specialties scorer. Answer
+    sets with a RED_FLAG_ANSWERS answer always go to the mapper.
+    """
+    red_flag = any(answers.get(q) == a for q, a in RED_FLAG_ANSWERS)
+    if symptom_model is not None and not red_flag:
+        prediction = symptom_model.predict(answers)
+        diseases = prediction['diseases']
+        if diseases and diseases[0][2] >= SYMPTOM_MODEL_MIN_CONFIDENCE:
+            specialties = [
+                name for name, p in prediction['specialties']
+                if p >= SYMPTOM_MODEL_MIN_SPECIALTY_PROB
+            ][:3]
+            if specialties:
+                return specialties, 'model', [
+                    {'code': code, 'name': name, 'probability': round(p, 4)}
+                    for code, name, p in diseases
+                ]
+
+    return map_answers_to_specialties(answers), 'rules', []
+
 def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """Calculate distance in km between two lat/lng points."""
     from math import radians, sin, cos, sqrt, atan2
@@ -478,64 +742,256 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     
     return R * c
 
-def get_doctors_for_specialties(specialties: List[str], patient_lat: float = None, patient_lng: float = None, limit: int = 5) -> dict:
+# --- Doctor Directory ---
+# doctors.json compiled by doctor_store.py into a memory-mapped columnar store.
+# Without a compiled store (or if it is older than the JSON) the JSON is
+# compiled in memory instead of being re-parsed on every request.
+# A background watcher rebuilds the directory when either file changes and
+# swaps it in atomically; DOCTOR_RELOAD_INTERVAL=0 turns the watcher off.
+DOCTORS_JSON_PATH = os.path.join(os.path.dirname(__file__), 'doctors.json')
+DOCTOR_STORE_PATH = os.getenv("DOCTOR_STORE_PATH", os.path.join(os.path.dirname(__file__), 'doctors.mtds'))
+DOCTOR_RELOAD_INTERVAL = float(os.getenv("DOCTOR_RELOAD_INTERVAL", "5"))
+
+doctor_directory = DirectoryReloader(DOCTORS_JSON_PATH, DOCTOR_STORE_PATH, interval=DOCTOR_RELOAD_INTERVAL)
+REGISTRY.gauge("doctor_directory_doctors", "Doctors in the live directory snapshot",
+               lambda: len(doctor_directory.store) if doctor_directory.store is not None else None)
+REGISTRY.gauge("doctor_directory_reloads", "Doctor directory snapshots loaded", lambda: doctor_directory.reloads)
+REGISTRY.gauge("doctor_directory_reload_failures", "Doctor directory reloads that failed",
+               lambda: doctor_directory.failures)
+
+# Available doctors per specialty/city: recounted on every directory swap,
+# incremented on doctor signup here, and recounted from the app database
+# (app.main's /api/doctors/signup, loader links) by a background thread every
+# DOCTOR_ACCOUNT_RECOUNT_SECONDS (0: only once at startup). Requests only read
+# the counters.
+doctor_counts = DoctorCounts()
+doctor_counts.reset_signups(users_db)
+doctor_directory.add_listener(lambda store: doctor_counts.rebuild_directory(store))
+
+DOCTOR_ACCOUNT_RECOUNT_SECONDS = float(os.getenv("DOCTOR_ACCOUNT_RECOUNT_SECONDS", "30"))
+_recount_stop = threading.Event()
+_recount_thread = None
+
+def recount_doctor_accounts():
+    """Refresh the counts of doctors registered through app.main; skipped if the app DB is unavailable."""
+    # Imported here: sqlalchemy is only needed once the lifespan starts recounting
+    from sqlalchemy.exc import SQLAlchemyError
+    from app import database
+    from app.doctor_accounts import unlinked_counts
+    try:
+        with database.SessionLocal() as db:
+            rows = unlinked_counts(db)
+    except SQLAlchemyError:
+        return # app schema not created: keep the last counts
+    doctor_counts.reset_accounts(rows)
+
+def _recount_loop():
+    while not _recount_stop.wait(DOCTOR_ACCOUNT_RECOUNT_SECONDS):
+        recount_doctor_accounts()
+
+def start_account_recounts():
+    global _recount_thread
+    recount_doctor_accounts()
+    if DOCTOR_ACCOUNT_RECOUNT_SECONDS > 0 and _recount_thread is None:
+        _recount_stop.clear()
+        _recount_thread = threading.Thread(target=_recount_loop, name="doctor-account-recount", daemon=True)
+        _recount_thread.start()
+
+def stop_account_recounts():
+    global _recount_thread
+    _recount_stop.set()
+    if _recount_thread is not None:
+        _recount_thread.join(timeout=5)
+        _recount_thread = None
+
+def get_doctor_store() -> DoctorStore:
+    """The current directory snapshot; hold on to it for the whole request."""
+    return doctor_directory.current()
+
+@app.get("/api/admin/directory", dependencies=[ADMIN_ONLY])
+def directory_status():
+    """Version, size and load time of the live doctor directory."""
+    return doctor_directory.stats()
+
+@app.get("/api/admin/startup", dependencies=[ADMIN_ONLY])
+def startup_status():
+    """Per-phase startup timing of this worker (import, schema, models, directory)."""
+    report = getattr(app.state, "startup_report", None)
+    if report is None:
+        raise HTTPException(status_code=503, detail="Startup has not finished")
+    return report.as_dict()
+
+@app.get("/api/doctors/counts")
+def available_doctor_counts(city: Optional[str] = None):
     """
-    Load doctors from doctors.json and filter by specialty.
-    If patient location provided, sort by distance.
-    Returns dict with specialty as key and list of doctors as value.
+    Available doctors per specialty, optionally within one city: the
+    directory plus doctors registered through either app. Accounts created
+    through app.main show up within DOCTOR_ACCOUNT_RECOUNT_SECONDS.
     """
-    import json
-    import os
+    get_doctor_store()
+    return {"city": city, "counts": doctor_counts.by_specialty(city)}
+
+@app.post("/api/admin/model/reload", dependencies=[ADMIN_ONLY])
+def reload_triage_model():
+    """Load triage_model.pkl again if it changed; invalidates the /triage cache."""
+    reloaded = reload_model()
+    return {"reloaded": reloaded, "model_version": model_version}
+
+@app.post("/api/admin/directory/reload", dependencies=[ADMIN_ONLY])
+def reload_directory():
+    """Rebuild the doctor directory now instead of waiting for the watcher."""
+    reloaded = doctor_directory.check(force=True)
+    return {"reloaded": reloaded, **doctor_directory.stats()}
+
+# Specialty mapping for data that uses different names
+SPECIALTY_ALIASES = {
+    'Obstetrics/Gynecology': 'Gynecology',
+    'GP': 'General Practice',  # Map GP to General Practice
+}
+
+def matching_doctors(store: DoctorStore, specialty: str):
+    """Directory indices of the doctors listed for a specialty, in directory order."""
+    # Check if this specialty has an alias in the data
+    lookup_specialty = SPECIALTY_ALIASES.get(specialty, specialty)
     
-    # Load doctors data
-    doctors_file = os.path.join(os.path.dirname(__file__), 'doctors.json')
-    try:
-        with open(doctors_file, 'r') as f:
-            all_doctors = json.load(f)
-    except:
-        # Fallback to demo data if file not found
-        all_doctors = []
+    # Filter doctors by specialty (case-insensitive match), in directory order
+    matching = store.indices_for_specialty(lookup_specialty)
     
+    # If no match found and this is GP, show doctors from all specialties sorted by distance
+    # This provides a fallback when GP doctors aren't available
+    if not len(matching) and specialty == 'GP':
+        # For GP requests, show a mix of available doctors (prioritize general specialists)
+        # Take some from each specialty to give variety
+        general_specialties = ['ENT', 'Dermatology', 'Psychiatry']
+        matching = np.concatenate(
+            [store.indices_for_specialty(gen_spec)[:2] for gen_spec in general_specialties]  # Take 2 from each
+        )
+    return matching
+
+def get_doctors_for_specialties(specialties: List[str], patient_lat: float = None, patient_lng: float = None, limit: int = 5,
+                                candidates: dict = None, store: DoctorStore = None) -> dict:
+    """
+    Look up doctors in the directory store and filter by specialty.
+    If patient location provided, sort by distance.
+    `candidates` (specialty -> indices into `store`) narrows the search to
+    precomputed subsets, e.g. from nearby_candidates.
+    Returns dict with specialty as key and list of doctors as value.
+    """
+    store = store or get_doctor_store()
     results = {}
     
-    # Specialty mapping for data that uses different names
-    specialty_aliases = {
-        'Obstetrics/Gynecology': 'Gynecology',
-        'GP': 'General Practice',  # Map GP to General Practice
+    for specialty in specialties:
+        matching = candidates[specialty] if candidates is not None else matching_doctors(store, specialty)
+        
+        # If patient location provided, calculate distance and sort (doctors without coordinates last)
+        if patient_lat is not None and patient_lng is not None and len(matching):
+            nearest, distances = store.nearest(matching, patient_lat, patient_lng, limit)
+            results[specialty] = [
+                dict(store.doctor(i), distance_km=float(d)) for i, d in zip(nearest, distances)
+            ]
+        else:
+            # Limit to top N doctors
+            results[specialty] = [store.doctor(i) for i in matching[:limit]]
+    
+    return results
+
+# --- Recommendation Cache ---
+# The response depends only on the answers and the patient's location. What
+# is cached per (answers, geohash cell) is the expensive part: the
+# specialties and, per specialty, the doctors that can be among the nearest
+# RECOMMENDED_DOCTORS to some point of the cell. Distances and the final
+# ranking are computed from the patient's own coordinates on every request,
+# so cached responses are exact. The cache is dropped whenever the doctor
+# directory is reloaded. SYMPTOM_CACHE_SIZE=0 disables it.
+RECOMMENDED_DOCTORS = 5
+SYMPTOM_CACHE_SIZE = int(os.getenv("SYMPTOM_CACHE_SIZE", "8192"))
+SYMPTOM_CACHE_TTL = float(os.getenv("SYMPTOM_CACHE_TTL", "900"))
+SYMPTOM_CACHE_GEOHASH_PRECISION = int(os.getenv("SYMPTOM_CACHE_GEOHASH_PRECISION", "6"))
+
+recommendation_cache = TTLCache(maxsize=SYMPTOM_CACHE_SIZE, ttl=SYMPTOM_CACHE_TTL)
+doctor_directory.add_listener(lambda store: recommendation_cache.set_version(store.version))
+REGISTRY.gauge("recommendation_cache_hits", "Symptom recommendation cache hits",
+               lambda: recommendation_cache.hits)
+REGISTRY.gauge("recommendation_cache_misses", "Symptom recommendation cache misses",
+               lambda: recommendation_cache.misses)
+
+def location_cell(location: Optional[dict]) -> Optional[str]:
+    """Geohash cell of the patient location, or None if no usable location was sent."""
+    if not location:
+        return None
+    lat, lng = location.get('lat'), location.get('lng')
+    if lat is None or lng is None:
+        return None
+    return geohash.encode(float(lat), float(lng), SYMPTOM_CACHE_GEOHASH_PRECISION)
+
+def nearby_candidates(store: DoctorStore, specialties: List[str], cell: Optional[str], limit: int) -> dict:
+    """Per specialty, the doctors that can be among the `limit` nearest to a patient in `cell`."""
+    candidates = {}
+    for specialty in specialties:
+        matching = matching_doctors(store, specialty)
+        if cell is None:
+            candidates[specialty] = matching[:limit]
+        else:
+            candidates[specialty] = store.candidates_near(matching, *geohash.bounds(cell), limit)
+    return candidates
+
+def recommendation_plan(answers: dict, cell: Optional[str] = None) -> dict:
+    """Specialties for one answer set and the candidate doctors for a patient in `cell`."""
+    store = get_doctor_store()
+    # Map answers to specialties (MCQ model, deterministic algorithm as fallback)
+    specialties, source, diseases = recommend_specialties(answers)
+    return {
+        'store': store,
+        'specialties': specialties,
+        'source': source,
+        'diseases': diseases,
+        'candidates': nearby_candidates(store, specialties, cell, RECOMMENDED_DOCTORS),
     }
+
+def build_recommendations(answers: dict, patient_lat: float = None, patient_lng: float = None, plan: dict = None) -> dict:
+    """Specialties and nearest doctors for one answer set and location."""
+    # 1. Map answers to specialties, unless a cached plan already did
+    if plan is None:
+        specialties, source, diseases = recommend_specialties(answers)
+        doctors_by_specialty = get_doctors_for_specialties(specialties, patient_lat, patient_lng,
+                                                           limit=RECOMMENDED_DOCTORS)
+    else:
+        specialties, source, diseases = plan['specialties'], plan['source'], plan['diseases']
+        # 2. Rank the plan's candidates by distance from the patient's own location
+        doctors_by_specialty = get_doctors_for_specialties(specialties, patient_lat, patient_lng,
+                                                           limit=RECOMMENDED_DOCTORS,
+                                                           candidates=plan['candidates'], store=plan['store'])
     
+    # 3. Build recommendations response
+    recommendations = []
     for specialty in specialties:
-        # Check if this specialty has an alias in the data
-        lookup_specialty = specialty_aliases.get(specialty, specialty)
-        
-        # Filter doctors by specialty (case-insensitive match)
-        matching = [d for d in all_doctors if d.get('specialty', '').lower() == lookup_specialty.lower()]
-        
-        # If no match found and this is GP, show doctors from all specialties sorted by distance
-        # This provides a fallback when GP doctors aren't available
-        if not matching and specialty == 'GP':
-            # For GP requests, show a mix of available doctors (prioritize general specialists)
-            # Take some from each specialty to give variety
-            general_specialties = ['ENT', 'Dermatology', 'Psychiatry']
-            gp_fallback = []
-            for gen_spec in general_specialties:
-                gen_docs = [d for d in all_doctors if d.get('specialty', '').lower() == gen_spec.lower()]
-                gp_fallback.extend(gen_docs[:2])  # Take 2 from each
-            matching = gp_fallback
+        doctors = doctors_by_specialty.get(specialty, [])
         
-        # If patient location provided, calculate distance and sort
-        if patient_lat is not None and patient_lng is not None and matching:
-            for doc in matching:
-                if 'lat' in doc and 'lng' in doc:
-                    doc['distance_km'] = haversine_distance(patient_lat, patient_lng, doc['lat'], doc['lng'])
-                else:
-                    doc['distance_km'] = float('inf')
-            matching.sort(key=lambda x: x.get('distance_km', float('inf')))
+        # Format doctor data with Google Maps info
+        formatted_doctors = []
+        for doc in doctors:
+            formatted_doctors.append({
+                'name': doc.get('name', 'Unknown'),
+                'phone': doc.get('phone', 'N/A'),
+                'address': f"{doc.get('address', '')}, {doc.get('city', '')}, {doc.get('state', '')}".strip(', '),
+                'lat': doc.get('lat'),
+                'lng': doc.get('lng'),
+                'google_place_id': doc.get('google_place_id', ''),  # Will be empty for most, use lat/lng fallback
+                'distance_km': round(doc.get('distance_km', 0), 2) if 'distance_km' in doc else None
+            })
         
-        # Limit to top N doctors
-        results[specialty] = matching[:limit]
+        recommendations.append({
+            'specialty': specialty,
+            'doctors': formatted_doctors
+        })
     
-    return results
+    return {
+        'ok': True,
+        'specialties': specialties,
+        'source': source,
+        'diseases': diseases,
+        'recommendations': recommendations
+    }
 
 @app.post("/api/symptom-recommendations")
 def symptom_recommendations(data: SymptomRecommendationRequest):
@@ -548,54 +1004,36 @@ def symptom_recommendations(data: SymptomRecommendationRequest):
     Privacy: Only stores anonymized logs for debugging, not full answers.
     """
     try:
-        # 1. Map answers to specialties using deterministic algorithm
-        specialties = map_answers_to_specialties(data.answers)
+        # Load (or reload) the directory first so a swap invalidates the cache before lookup
+        get_doctor_store()
         
-        # 2. Get patient location
-        patient_lat = None
-        patient_lng = None
-        if data.patientLocation:
-            patient_lat = data.patientLocation.get('lat')
-            patient_lng = data.patientLocation.get('lng')
+        location = data.patientLocation or {}
+        if not recommendation_cache.enabled:
+            return build_recommendations(data.answers, location.get('lat'), location.get('lng'))
         
-        # 3. Find doctors for each specialty
-        doctors_by_specialty = get_doctors_for_specialties(specialties, patient_lat, patient_lng, limit=5)
+        cell = location_cell(data.patientLocation)
+        cache_key = (json.dumps(data.answers, sort_keys=True), cell)
+        plan = recommendation_cache.get(cache_key)
+        if plan is None:
+            plan = recommendation_plan(data.answers, cell)
+            recommendation_cache.set(cache_key, plan)
+        patient_lat, patient_lng = (float(location['lat']), float(location['lng'])) if cell else (None, None)
+        response = build_recommendations(data.answers, patient_lat, patient_lng, plan=plan)
         
-        # 4. Build recommendations response
-        recommendations = []
-        for specialty in specialties:
-            doctors = doctors_by_specialty.get(specialty, [])
-            
-            # Format doctor data with Google Maps info
-            formatted_doctors = []
-            for doc in doctors:
-                formatted_doctors.append({
-                    'name': doc.get('name', 'Unknown'),
-                    'phone': doc.get('phone', 'N/A'),
-                    'address': f"{doc.get('address', '')}, {doc.get('city', '')}, {doc.get('state', '')}".strip(', '),
-                    'lat': doc.get('lat'),
-                    'lng': doc.get('lng'),
-                    'google_place_id': doc.get('google_place_id', ''),  # Will be empty for most, use lat/lng fallback
-                    'distance_km': round(doc.get('distance_km', 0), 2) if 'distance_km' in doc else None
-                })
-            
-            recommendations.append({
-                'specialty': specialty,
-                'doctors': formatted_doctors
-            })
-        
-        # 5. Privacy: Log only anonymized data (specialty tags, not full answers)
+        # Privacy: Log only anonymized data (specialty tags, not full answers)
         # Example: Store only answer pattern hash or specialty for analytics
         # For this implementation, we don't store anything to DB
         
-        return {
-            'ok': True,
-            'specialties': specialties,
-            'recommendations': recommendations
-        }
+        return response
         
     except Exception as e:
         # Log error but don't expose internal details
         print(f"Error in symptom_recommendations: {str(e)}")
         raise HTTPException(status_code=500, detail="Unable to process recommendations")
 
+@app.get("/api/symptom-recommendations/cache")
+def recommendation_cache_stats():
+    """Hit/miss counters for the symptom recommendation cache."""
+    return recommendation_cache.stats()
+
+startup_report.imported()
@@ -0,0 +1,91 @@
+"""
+Provisioning of admin accounts.
+
+Neither signup route can create an admin (patients and doctors only), but
+the admin endpoints of both apps require a token with role "admin". Create
+the first admin, or promote an existing account, from the deploy host:
+
+    python -m app.admins create ops --name "Ops Team" --email ops@example.org
+    python -m app.admins promote dr_rao
+    python -m app.admins list
+
+`create` reads the password from ADMIN_PASSWORD, prompting when it is
+unset. Both commands write to DATABASE_URL, the same database the apps use.
+The admin then logs in through POST /api/auth/login like any other user.
+"""
+import argparse
+import getpass
+import os
+import sys
+
+from sqlalchemy.orm import Session
+
+from .auth import get_password_hash
+from .models import User
+
+ADMIN_ROLE = "admin"
+
+
+class AdminProvisioningError(ValueError):
+    pass
+
+
+def create_admin(db: Session, username: str, password: str, name=None, email=None) -> User:
+    """Add a new admin account. Refuses usernames that are already taken."""
+    if not password:
+        raise AdminProvisioningError("An admin account needs a password")
+    if db.query(User).filter(User.username == username).first():
+        raise AdminProvisioningError(f"User '{username}' already exists; use promote")
+    user = User(username=username, password_hash=get_password_hash(password), role=ADMIN_ROLE,
+                name=name or username, email=email)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def promote(db: Session, username: str) -> User:
+    """Give an existing account the admin role, keeping its password."""
+    user = db.query(User).filter(User.username == username).first()
+    if user is None:
+        raise AdminProvisioningError(f"No user named '{username}'")
+    user.role = ADMIN_ROLE
+    db.commit()
+    return user
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Provision admin accounts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create", help="create a new admin account")
+    create.add_argument("username")
+    create.add_argument("--name")
+    create.add_argument("--email")
+    commands.add_parser("promote", help="give an existing account the admin role").add_argument("username")
+    commands.add_parser("list", help="list admin accounts")
+    args = parser.parse_args(argv)
+
+    from .database import SessionLocal, init_schema
+    init_schema()
+    db = SessionLocal()
+    try:
+        if args.command == "create":
+            password = os.getenv("ADMIN_PASSWORD") or getpass.getpass(f"Password for {args.username}: ")
+            user = create_admin(db, args.username, password, args.name, args.email)
+            print(f"Created admin '{user.username}' (id {user.id})")
+        elif args.command == "promote":
+            user = promote(db, args.username)
+            print(f"'{user.username}' is now an admin")
+        else:
+            for user in db.query(User).filter(User.role == ADMIN_ROLE).order_by(User.id):
+                print(f"{user.id}\t{user.username}\t{user.email or ''}")
+    except AdminProvisioningError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
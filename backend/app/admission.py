@@ -0,0 +1,186 @@
+"""
+Admission control for expensive routes.
+
+Sync routes run in the shared threadpool, so under overload /triage,
+recommendations and password hashing just queue there until clients time
+out. AdmissionMiddleware gates them in the event loop instead, before a
+thread is taken:
+
+- up to `max_concurrent` requests of a limiter run at once;
+- up to `max_queue` more wait, first come first served, for at most
+  `queue_timeout` seconds;
+- anything beyond that, or still waiting at the deadline, gets an
+  immediate 503 with Retry-After.
+
+Several routes can share one limiter (all password-hashing routes share
+"auth", since they compete for the same CPU). Each limiter is configured
+from the environment, e.g. for "triage":
+
+    ADMISSION_TRIAGE_CONCURRENCY=8 ADMISSION_TRIAGE_QUEUE=32 ADMISSION_TRIAGE_TIMEOUT=2
+
+ADMISSION_ENABLED=0 turns the middleware off. Admissions, rejections (by
+reason) and queue wait times are exported through app.metrics.
+
+Limits are per process: with N workers the service admits N times as many.
+"""
+import asyncio
+import collections
+import json
+import os
+import time
+
+from .metrics import REGISTRY
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") == "1"
+RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+admission_admitted_total = REGISTRY.counter(
+    "admission_admitted_total", "Requests admitted by the admission limiter", labelnames=("limiter",)
+)
+admission_rejected_total = REGISTRY.counter(
+    "admission_rejected_total", "Requests shed with 503 by the admission limiter",
+    labelnames=("limiter", "reason")
+)
+admission_queue_seconds = REGISTRY.histogram(
+    "admission_queue_seconds", "Time admitted requests waited for a slot", labelnames=("limiter",)
+)
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted; reason is 'queue_full' or 'deadline'."""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionLimiter:
+    def __init__(self, name, max_concurrent, max_queue, queue_timeout):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._waiters = collections.deque()
+
+    @classmethod
+    def from_env(cls, name, max_concurrent, max_queue, queue_timeout):
+        prefix = f"ADMISSION_{name.upper()}_"
+        return cls(
+            name,
+            int(os.getenv(prefix + "CONCURRENCY", str(max_concurrent))),
+            int(os.getenv(prefix + "QUEUE", str(max_queue))),
+            float(os.getenv(prefix + "TIMEOUT", str(queue_timeout))),
+        )
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for w in self._waiters if not w.done())
+
+    async def acquire(self) -> float:
+        """Take a slot, waiting in line if needed. Returns seconds waited; raises Overloaded."""
+        if self.in_flight < self.max_concurrent and not self.queued:
+            self.in_flight += 1
+            self._admit(0.0)
+            return 0.0
+        if self.queued >= self.max_queue:
+            self._reject("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # Client went away while queued; hand on a slot we were just given
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            waiter.cancel()
+            raise
+        if not waiter.done():
+            waiter.cancel()
+            self._reject("deadline")
+        # release() handed its slot over: in_flight already counts us
+        waited = time.perf_counter() - start
+        self._admit(waited)
+        return waited
+
+    def release(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _admit(self, waited):
+        self.admitted += 1
+        admission_admitted_total.inc(limiter=self.name)
+        admission_queue_seconds.observe(waited, limiter=self.name)
+
+    def _reject(self, reason):
+        self.rejected += 1
+        admission_rejected_total.inc(limiter=self.name, reason=reason)
+        raise Overloaded(reason)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying `limits` ({(method, path): AdmissionLimiter}) to matching requests."""
+
+    def __init__(self, app, limits):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limiter = None
+        if scope["type"] == "http" and ADMISSION_ENABLED:
+            limiter = self.limits.get((scope["method"], scope["path"]))
+        if limiter is None:
+            return await self.app(scope, receive, send)
+
+        try:
+            await limiter.acquire()
+        except Overloaded as exc:
+            return await _send_overloaded(send, limiter, exc.reason)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+async def _send_overloaded(send, limiter, reason):
+    body = json.dumps({"detail": "Service is busy, please retry shortly",
+                       "limiter": limiter.name, "reason": reason}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(RETRY_AFTER_SECONDS).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def add_admission_control(app, routes):
+    """
+    Install AdmissionMiddleware on `app`. `routes` maps each limiter to the
+    (method, path) pairs it guards. Returns {name: limiter} for stats endpoints.
+    """
+    limits = {route: limiter for limiter, paths in routes.items() for route in paths}
+    app.add_middleware(AdmissionMiddleware, limits=limits)
+    return {limiter.name: limiter for limiter in routes}
@@ -0,0 +1,109 @@
+"""
+Demand analytics from an incrementally maintained rollup.
+
+Every request creation, status change, booking and cancellation adds 1 to
+a (UTC hour, specialty, city, event) counter in `demand_rollup`, inside the
+same transaction as the change itself. Reports read only the rollup, whose
+size grows with hours x specialties x cities rather than with traffic, and
+never run GROUP BYs over `requests` or `appointments`.
+
+The city is the request's `city`: RequestCreate.city, else the patient's
+signup `location` ("" when neither was given).
+"""
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from .models import DemandRollup
+
+EVENTS = ("created", "viewed", "rejected", "booked", "cancelled")
+BUCKETS = ("hour", "day", "week")
+GROUP_BY = ("specialty", "city")
+
+
+def hour_bucket(at: datetime) -> datetime:
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def truncate(at: datetime, bucket: str) -> datetime:
+    at = hour_bucket(at)
+    if bucket == "hour":
+        return at
+    at = at.replace(hour=0)
+    if bucket == "week":
+        at -= timedelta(days=at.weekday())
+    return at
+
+
+def _upsert(db: Session, values: dict):
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(DemandRollup).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["bucket", "specialty", "city", "event"],
+            set_={"count": DemandRollup.count + stmt.excluded.count}
+        )
+        db.execute(stmt)
+        return
+    # Other databases: update, insert if there was nothing to update
+    updated = db.query(DemandRollup).filter(
+        DemandRollup.bucket == values["bucket"],
+        DemandRollup.specialty == values["specialty"],
+        DemandRollup.city == values["city"],
+        DemandRollup.event == values["event"],
+    ).update({DemandRollup.count: DemandRollup.count + values["count"]}, synchronize_session=False)
+    if not updated:
+        db.add(DemandRollup(**values))
+
+
+def record(db: Session, event: str, specialty, city=None, at=None, count=1):
+    """Add `count` to the rollup row for this event. Committed with the caller's transaction."""
+    if event not in EVENTS:
+        raise ValueError(f"Unknown demand event '{event}'")
+    _upsert(db, {
+        "bucket": hour_bucket(at or datetime.utcnow()),
+        "specialty": specialty or "",
+        "city": (city or "").strip(),
+        "event": event,
+        "count": count,
+    })
+
+
+def demand(db: Session, start=None, end=None, bucket="hour", group_by=("specialty",), specialty=None, city=None):
+    """
+    Event counts per time bucket (and the requested dimensions), with the
+    booking conversion rate booked / created for each group.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket '{bucket}'")
+    group_by = [g for g in GROUP_BY if g in group_by]
+
+    query = db.query(DemandRollup)
+    if start is not None:
+        query = query.filter(DemandRollup.bucket >= hour_bucket(start))
+    if end is not None:
+        query = query.filter(DemandRollup.bucket < end)
+    if specialty:
+        query = query.filter(DemandRollup.specialty == specialty)
+    if city is not None:
+        query = query.filter(DemandRollup.city == city)
+
+    groups = OrderedDict()
+    for row in query.order_by(DemandRollup.bucket).all():
+        key = (truncate(row.bucket, bucket),) + tuple(getattr(row, g) for g in group_by)
+        counts = groups.setdefault(key, dict.fromkeys(EVENTS, 0))
+        counts[row.event] += row.count
+
+    series = []
+    for key, counts in sorted(groups.items()):
+        entry = {"bucket": key[0].isoformat()}
+        entry.update(zip(group_by, key[1:]))
+        entry.update(counts)
+        entry["conversion"] = round(counts["booked"] / counts["created"], 4) if counts["created"] else None
+        series.append(entry)
+    return series
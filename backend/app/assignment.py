@@ -0,0 +1,264 @@
+"""
+Request assignment: a per-specialty claim queue with leases.
+
+Instead of every doctor of a specialty listing (and racing for) every open
+request, a doctor pulls the next one with claim_next(). The claim is a
+single conditional UPDATE whose target row is picked by a subquery:
+
+    UPDATE requests SET status='claimed', claimed_by=:doctor, ...
+    WHERE id = (SELECT id FROM requests WHERE <claimable> ORDER BY ... LIMIT 1
+                FOR UPDATE SKIP LOCKED)
+
+On PostgreSQL SKIP LOCKED lets concurrent claimers step over each other's
+rows instead of queueing on them. SQLite has no row locks but runs the
+whole statement under its database write lock, so the same UPDATE is
+atomic there too.
+
+A claim is a lease: if the doctor neither accepts nor releases the request
+before lease_expires_at, it becomes claimable again. Each doctor holds at
+most one active claim, so requests are spread across the doctors who pull.
+
+Requests are handed out most severe first (app.severity), oldest first
+within a severity, straight off the ix_requests_queue index.
+
+Viewing, rejecting and booking are conditional UPDATEs too, so two
+doctors acting on the same request cannot both win.
+"""
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from . import analytics
+from .models import TriageRequest, User
+
+LEASE_SECONDS = int(os.getenv("REQUEST_LEASE_SECONDS", "300"))
+
+# 'pending' is what older rows were created with; it means the same as 'new'
+QUEUED_STATUSES = ("new", "pending")
+CLAIMED = "claimed"
+# States a doctor can book an appointment from: the request must be claimed
+# or viewed by that doctor first
+BOOKABLE_STATUSES = ("viewed", CLAIMED)
+
+
+def _specialty(specialty):
+    return func.lower(TriageRequest.specialty) == (specialty or "").lower()
+
+
+def _claimable(specialty):
+    return and_(_specialty(specialty), TriageRequest.status == "new")
+
+
+def queue_order():
+    """Most severe first, then arrival order - the column order of ix_requests_queue."""
+    return [TriageRequest.severity.desc(), TriageRequest.created_at, TriageRequest.id]
+
+
+def requeue(db: Session, specialty, now=None) -> int:
+    """Put expired claims (and legacy 'pending' rows) of a specialty back to 'new'."""
+    now = now or datetime.utcnow()
+    stmt = (
+        update(TriageRequest)
+        .where(
+            _specialty(specialty),
+            or_(
+                TriageRequest.status == "pending",
+                and_(TriageRequest.status == CLAIMED, TriageRequest.lease_expires_at < now),
+            ),
+        )
+        .values(status="new", claimed_by=None, claimed_at=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).rowcount
+
+
+def active_claim(db: Session, doctor: User, now=None):
+    """The request this doctor currently holds a live lease on, if any."""
+    now = now or datetime.utcnow()
+    return db.query(TriageRequest).filter(
+        TriageRequest.claimed_by == doctor.id,
+        TriageRequest.status == CLAIMED,
+        TriageRequest.lease_expires_at >= now,
+    ).first()
+
+
+def claim_next(db: Session, doctor: User, now=None):
+    """
+    Lease the next queued request of the doctor's specialty to them.
+    Returns the claimed request, the one they already hold, or None if the
+    queue is empty.
+    """
+    now = now or datetime.utcnow()
+    held = active_claim(db, doctor, now)
+    if held:
+        return held
+
+    # Requeue first so the pick below is a plain (specialty, status='new')
+    # index range read in priority order, with no sort
+    requeue(db, doctor.specialty, now)
+    next_id = (
+        select(TriageRequest.id)
+        .where(_claimable(doctor.specialty))
+        .order_by(*queue_order())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(TriageRequest)
+        .where(TriageRequest.id == next_id, _claimable(doctor.specialty))
+        .values(
+            status=CLAIMED,
+            claimed_by=doctor.id,
+            claimed_at=now,
+            lease_expires_at=now + timedelta(seconds=LEASE_SECONDS),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    claimed = db.execute(stmt).rowcount
+    db.commit()
+    if not claimed:
+        return None
+    return active_claim(db, doctor, now)
+
+
+def release(db: Session, request: TriageRequest, doctor: User) -> bool:
+    """Hand a claimed request back to the queue. False if the doctor does not hold it."""
+    stmt = (
+        update(TriageRequest)
+        .where(
+            TriageRequest.id == request.id,
+            TriageRequest.status == CLAIMED,
+            TriageRequest.claimed_by == doctor.id,
+        )
+        .values(status="new", claimed_by=None, claimed_at=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    released = db.execute(stmt).rowcount
+    db.commit()
+    db.refresh(request)
+    return bool(released)
+
+
+def mark_viewed(db: Session, request_id: int, doctor: User, now=None) -> bool:
+    """
+    Atomically move a request to 'viewed' for this doctor. Allowed while it
+    is queued, claimed by this doctor, or its lease has expired; viewing it
+    again is a no-op that still returns True. The 'viewed' demand event is
+    recorded in the same transaction, only when the status changed.
+    """
+    now = now or datetime.utcnow()
+    stmt = (
+        update(TriageRequest)
+        .where(
+            TriageRequest.id == request_id,
+            or_(
+                TriageRequest.status.in_(QUEUED_STATUSES),
+                and_(
+                    TriageRequest.status == CLAIMED,
+                    or_(TriageRequest.claimed_by == doctor.id, TriageRequest.lease_expires_at < now),
+                ),
+            ),
+        )
+        .values(status="viewed", doctor_id=doctor.id, claimed_by=doctor.id, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(stmt).rowcount:
+        specialty, city = db.query(TriageRequest.specialty, TriageRequest.city).filter(
+            TriageRequest.id == request_id
+        ).one()
+        analytics.record(db, "viewed", specialty, city, at=now)
+        db.commit()
+        return True
+    db.commit()
+    already = db.query(TriageRequest.id).filter(
+        TriageRequest.id == request_id,
+        TriageRequest.status == "viewed",
+        TriageRequest.doctor_id == doctor.id,
+    ).first()
+    return already is not None
+
+
+def reject(db: Session, request: TriageRequest, doctor: User, now=None) -> bool:
+    """
+    Atomically move a request to 'rejected'. Only the doctor holding the
+    claim or the one who viewed it may reject, and only while it is still
+    claimed/viewed. The 'rejected' demand event is recorded in the same
+    transaction. False if the request was not theirs to reject.
+    """
+    now = now or datetime.utcnow()
+    stmt = (
+        update(TriageRequest)
+        .where(
+            TriageRequest.id == request.id,
+            or_(
+                and_(TriageRequest.status == CLAIMED, TriageRequest.claimed_by == doctor.id),
+                and_(TriageRequest.status == "viewed", TriageRequest.doctor_id == doctor.id),
+            ),
+        )
+        .values(status="rejected", handled_by=doctor.id, handled_at=now, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    rejected = db.execute(stmt).rowcount
+    if rejected:
+        analytics.record(db, "rejected", request.specialty, request.city, at=now)
+    db.commit()
+    db.refresh(request)
+    return bool(rejected)
+
+
+def _bookable_by(doctor_id):
+    return or_(
+        and_(TriageRequest.status == CLAIMED, TriageRequest.claimed_by == doctor_id),
+        and_(TriageRequest.status == "viewed", TriageRequest.doctor_id == doctor_id),
+    )
+
+
+def can_book(request: TriageRequest, doctor_id: int, now=None) -> bool:
+    """
+    Whether this doctor may book from the request's current state: they hold
+    its claim or have viewed it. A pre-check only; book() decides.
+    """
+    if request.status == CLAIMED:
+        return request.claimed_by == doctor_id
+    if request.status == "viewed":
+        return request.doctor_id == doctor_id
+    return False
+
+
+def book(db: Session, request: TriageRequest, doctor: User, now=None) -> bool:
+    """
+    Atomically move a request this doctor claimed or viewed to 'booked' and
+    record the demand event. Does not commit: the caller adds the appointment
+    to the same transaction. False if the request was not bookable by them
+    (another doctor got there first, or it was never claimed or viewed).
+    """
+    now = now or datetime.utcnow()
+    stmt = (
+        update(TriageRequest)
+        .where(TriageRequest.id == request.id, _bookable_by(doctor.id))
+        .values(status="booked", doctor_id=doctor.id, handled_by=doctor.id, handled_at=now,
+                lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    if not db.execute(stmt).rowcount:
+        return False
+    analytics.record(db, "booked", request.specialty, request.city, at=now)
+    return True
+
+
+def inbox(db: Session, doctor: User, now=None):
+    """Requests currently assigned to this doctor: a live claim or ones they have viewed."""
+    now = now or datetime.utcnow()
+    return db.query(TriageRequest).filter(
+        or_(
+            and_(
+                TriageRequest.status == CLAIMED,
+                TriageRequest.claimed_by == doctor.id,
+                TriageRequest.lease_expires_at >= now,
+            ),
+            and_(TriageRequest.status == "viewed", TriageRequest.doctor_id == doctor.id),
+        )
+    ).order_by(*queue_order()).all()
@@ -0,0 +1,124 @@
+"""
+Asynchronous, batched audit trail.
+
+Request handlers call audit_log.emit(), which only puts a dict on a bounded
+in-memory queue. A background thread drains the queue and appends the
+events to `audit_events` with one multi-row INSERT per batch (up to
+AUDIT_BATCH_SIZE events, or whatever arrived within AUDIT_FLUSH_SECONDS).
+
+emit() never blocks: if the writer falls behind and the queue is full the
+event is dropped, counted and logged. stop() drains the queue before the
+process exits.
+"""
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+
+from .database import engine as default_engine
+from .models import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+AUDIT_FLUSH_SECONDS = float(os.getenv("AUDIT_FLUSH_SECONDS", "1.0"))
+
+_STOP = object()
+
+
+class AuditLog:
+    def __init__(self, engine=None, maxsize=AUDIT_QUEUE_SIZE, batch_size=AUDIT_BATCH_SIZE,
+                 flush_interval=AUDIT_FLUSH_SECONDS):
+        self.engine = engine or default_engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    def emit(self, action, actor_id=None, appointment_id=None, request_id=None, **details):
+        """Queue one audit event. Cheap and non-blocking."""
+        if self._thread is None:
+            self.start()
+        event = {
+            "at": datetime.utcnow(),
+            "action": action,
+            "actor_id": actor_id,
+            "appointment_id": appointment_id,
+            "request_id": request_id,
+            "details": {k: v.isoformat() if isinstance(v, datetime) else v for k, v in details.items()} or None,
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            logger.error("Audit queue full, dropped %s event (%d dropped so far)", action, self.dropped)
+
+    def _write(self, batch):
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(AuditEvent.__table__.insert(), batch)
+            self.written += len(batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("Failed to write %d audit events", len(batch))
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            items = [first]
+            # Take whatever else is already waiting, up to one batch
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in items:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write(batch)
+            for _ in items:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued event has been written (or failed)."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def stop(self, timeout=10.0):
+        """Write out what is queued, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+audit_log = AuditLog()
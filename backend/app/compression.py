@@ -0,0 +1,69 @@
+"""
+Response compression for both apps.
+
+CompressionMiddleware is Starlette's GZipMiddleware plus brotli: clients
+sending "Accept-Encoding: br" get brotli when the `brotli` package is
+installed, everyone else who accepts gzip gets gzip. Bodies smaller than
+COMPRESSION_MIN_SIZE bytes go out as-is (compressing a 200-byte token
+response costs more than it saves); COMPRESSION_MIN_SIZE=0 turns the
+middleware off. Streaming responses (exports) are compressed chunk by
+chunk.
+
+The defaults favour CPU over ratio: recommendation and listing payloads
+are repetitive JSON, which gzip level 5 / brotli quality 4 already shrink
+several-fold.
+"""
+import os
+
+from starlette.middleware.gzip import GZipMiddleware, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "5"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size, quality=BROTLI_QUALITY, **kwargs):
+        super().__init__(app, minimum_size, **kwargs)
+        self.quality = quality
+        self._compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=self.quality)
+        data = self._compressor.process(body)
+        return data + (self._compressor.flush() if more_body else self._compressor.finish())
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def __init__(self, app, minimum_size=COMPRESSION_MIN_SIZE, compresslevel=GZIP_LEVEL,
+                 brotli_quality=BROTLI_QUALITY, **kwargs):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel, **kwargs)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and brotli is not None and _accepts_brotli(scope):
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality,
+                                        exclude_content_types=self.exclude_content_types)
+            return await responder(scope, receive, send)
+        await super().__call__(scope, receive, send)
+
+
+def _accepts_brotli(scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == b"accept-encoding":
+            return any(token.split(b";")[0].strip() == b"br" for token in value.split(b","))
+    return False
+
+
+def add_compression(app):
+    """Install CompressionMiddleware on `app` unless COMPRESSION_MIN_SIZE is 0."""
+    if COMPRESSION_MIN_SIZE > 0:
+        app.add_middleware(CompressionMiddleware)
@@ -1,5 +1,6 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -15,6 +16,44 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Set to 0 once the schema is managed out of band (python -m app.startup --init-schema)
+AUTO_CREATE_SCHEMA = os.getenv("AUTO_CREATE_SCHEMA", "1") == "1"
+
+def init_schema(bind=None):
+    """Create missing tables, then add columns and indexes that existing tables lack."""
+    from . import models  # registers every table on Base.metadata
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    upgrade_schema(bind)
+
+def upgrade_schema(bind):
+    """
+    Bring tables created by an older version up to date. There are no
+    migrations: columns added to the models since are ADDed (nullable, or
+    with their server default; foreign keys are not added to existing
+    tables) and every model index is created IF NOT EXISTS. Columns are
+    never altered or dropped.
+    """
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names())
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=bind.dialect)}"
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                    if not column.nullable:
+                        ddl += " NOT NULL"
+                conn.execute(text(ddl))
+            for index in table.indexes:
+                # IF NOT EXISTS rather than checkfirst: SQLite reflection skips expression indexes
+                conn.execute(CreateIndex(index, if_not_exists=True))
+
 # Dependency for routes
 def get_db():
     db = SessionLocal()
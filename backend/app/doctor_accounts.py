@@ -0,0 +1,75 @@
+"""
+Links directory entries (`doctors`) to registered doctor accounts (`users`).
+
+Appointments, the load tracker and rank=load all key doctors by users.id,
+so a directory entry only carries load once doctors.user_id is set. Links
+are made:
+
+- at signup: to the entry named by DoctorSignup.directory_id, or else to
+  the only unlinked entry with the same name and specialty (the account's
+  location breaks ties between same-named entries in different cities);
+- by the bulk loader: from a `user_id` in the input records, then by the
+  same name/specialty match for every doctor account still unlinked.
+
+An entry is linked to at most one account and an account to at most one
+entry; ambiguous matches are left unlinked rather than guessed.
+"""
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .models import Doctor, User
+
+
+def _linked(db: Session, user: User) -> bool:
+    return db.query(Doctor.id).filter(Doctor.user_id == user.id).first() is not None
+
+
+def find_entry(db: Session, user: User):
+    """The unlinked directory entry matching this account's name and specialty, if exactly one does."""
+    if not user.name or not user.specialty:
+        return None
+    candidates = db.query(Doctor).filter(
+        Doctor.user_id.is_(None),
+        func.lower(Doctor.name) == user.name.lower(),
+        func.lower(Doctor.specialty) == user.specialty.lower(),
+    ).limit(50).all()
+    if len(candidates) > 1 and user.location:
+        candidates = [d for d in candidates if (d.city or "").lower() == user.location.lower()]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def link_account(db: Session, user: User, directory_id=None):
+    """
+    Link a doctor account to its directory entry. Returns the entry, or None
+    when there is no unambiguous unlinked match. Does not commit.
+    """
+    if user.role != "doctor" or _linked(db, user):
+        return None
+    if directory_id is not None:
+        entry = db.query(Doctor).filter(Doctor.id == directory_id, Doctor.user_id.is_(None)).first()
+    else:
+        entry = find_entry(db, user)
+    if entry is not None:
+        entry.user_id = user.id
+    return entry
+
+
+def link_unlinked(db: Session) -> int:
+    """Link every doctor account that has no directory entry yet. Returns links made; commits."""
+    linked_users = db.query(Doctor.user_id).filter(Doctor.user_id.isnot(None))
+    accounts = db.query(User).filter(User.role == "doctor", User.id.notin_(linked_users)).all()
+    made = 0
+    for user in accounts:
+        if link_account(db, user) is not None:
+            made += 1
+            db.flush()
+    db.commit()
+    return made
+
+
+def unlinked_counts(db: Session):
+    """(specialty, location, count) of doctor accounts without a directory entry."""
+    linked = select(Doctor.user_id).where(Doctor.user_id.isnot(None))
+    return db.query(User.specialty, User.location, func.count(User.id)).filter(
+        User.role == "doctor", User.id.notin_(linked)
+    ).group_by(User.specialty, User.location).all()
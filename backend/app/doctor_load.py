@@ -0,0 +1,111 @@
+"""
+In-memory upcoming-appointment load per doctor, and load-aware ranking.
+
+The tracker is primed once from the `appointments` table (CONFIRMED and not
+yet started) and then updated by the booking and cancellation routes, so
+ranking never queries the database. Start times are kept sorted per doctor,
+which lets appointments drop out of the count as they pass without any
+background job.
+
+The figures are per process: with several workers each one only sees its
+own bookings between restarts, which is good enough to spread referrals.
+"""
+import bisect
+import os
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from .models import Appointment
+
+# Each upcoming appointment counts as this many extra km in rank=load mode
+LOAD_PENALTY_KM = float(os.getenv("DOCTOR_LOAD_PENALTY_KM", "2.0"))
+# Re-rank this many times k nearest candidates
+LOAD_CANDIDATE_FACTOR = int(os.getenv("DOCTOR_LOAD_CANDIDATE_FACTOR", "4"))
+
+
+def _naive_utc(value):
+    """Appointments are stored as naive UTC; normalise aware datetimes to match."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class AppointmentLoad:
+    def __init__(self, clock=datetime.utcnow):
+        self._clock = clock
+        self._starts = {}  # doctor user id -> sorted upcoming start times
+        self._lock = threading.Lock()
+        self.primed = False
+
+    def prime(self, db: Session):
+        """Load upcoming CONFIRMED appointments from the database (once)."""
+        with self._lock:
+            if self.primed:
+                return
+            rows = db.query(Appointment.doctor_id, Appointment.start_time).filter(
+                Appointment.status == "CONFIRMED",
+                Appointment.start_time >= self._clock()
+            ).all()
+            starts = {}
+            for doctor_id, start_time in rows:
+                starts.setdefault(doctor_id, []).append(start_time)
+            for times in starts.values():
+                times.sort()
+            self._starts = starts
+            self.primed = True
+
+    def booked(self, doctor_id, start_time):
+        with self._lock:
+            bisect.insort(self._starts.setdefault(doctor_id, []), _naive_utc(start_time))
+
+    def cancelled(self, doctor_id, start_time):
+        start_time = _naive_utc(start_time)
+        with self._lock:
+            times = self._starts.get(doctor_id)
+            if not times:
+                return
+            i = bisect.bisect_left(times, start_time)
+            if i < len(times) and times[i] == start_time:
+                del times[i]
+
+    def load(self, doctor_id) -> int:
+        """Upcoming confirmed appointments of a doctor (users.id)."""
+        if doctor_id is None:
+            return 0
+        with self._lock:
+            times = self._starts.get(doctor_id)
+            if not times:
+                return 0
+            now = self._clock()
+            passed = bisect.bisect_left(times, now)
+            if passed:
+                # Forget appointments that have started
+                del times[:passed]
+            return len(times)
+
+    def reset(self):
+        with self._lock:
+            self._starts = {}
+            self.primed = False
+
+
+tracker = AppointmentLoad()
+
+
+def rank_by_load(doctors, k, penalty_km=LOAD_PENALTY_KM, load=None):
+    """
+    Re-rank doctor dicts (nearest first) by distance_km + penalty_km * load.
+    Adds `upcoming_appointments` to each; ties keep distance order.
+    """
+    load = load or tracker.load
+    scored = []
+    for position, doc in enumerate(doctors):
+        doc["upcoming_appointments"] = load(doc.get("user_id"))
+        distance = doc.get("distance_km")
+        if distance is None:
+            distance = 0.0
+        scored.append((distance + penalty_km * doc["upcoming_appointments"], position, doc))
+    scored.sort(key=lambda s: (s[0], s[1]))
+    return [doc for _, _, doc in scored[:k]]
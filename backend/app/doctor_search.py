@@ -0,0 +1,126 @@
+"""
+Nearest-doctor search over the `doctors` table.
+
+Same ranking as get_doctors_for_specialties in api.py (specialty aliases,
+GP fallback, haversine distance, ties in directory order, doctors without
+coordinates last), but the filtering happens in the database so the
+directory never has to fit in Python:
+
+1. select candidates of the specialty inside a lat/lng bounding box,
+   served by the (lower(specialty), lat, lng) index;
+2. compute exact haversine distances for those candidates only;
+3. if fewer than k candidates lie within the box radius, double the radius
+   and try again, until the box covers the whole globe.
+"""
+import math
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .models import Doctor
+
+EARTH_RADIUS_KM = 6371
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LNG = 111.320
+INITIAL_RADIUS_KM = 25.0
+MAX_RADIUS_KM = math.pi * EARTH_RADIUS_KM  # half the circumference covers everything
+
+# Keep in sync with SPECIALTY_ALIASES in api.py
+SPECIALTY_ALIASES = {
+    'Obstetrics/Gynecology': 'Gynecology',
+    'GP': 'General Practice',
+}
+GP_FALLBACK_SPECIALTIES = ['ENT', 'Dermatology', 'Psychiatry']
+GP_FALLBACK_PER_SPECIALTY = 2
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def bounding_box(lat, lng, radius_km):
+    """(min_lat, max_lat, min_lng, max_lng) enclosing a circle; full longitude range near the poles."""
+    dlat = radius_km / KM_PER_DEG_LAT
+    min_lat, max_lat = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    cos_lat = min(math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat)))
+    if cos_lat <= 0.01:
+        return min_lat, max_lat, -180.0, 180.0
+    dlng = radius_km / (KM_PER_DEG_LNG * cos_lat)
+    if dlng >= 180 or lng - dlng < -180 or lng + dlng > 180:
+        # Crossing the antimeridian: fall back to the latitude band alone
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, lng - dlng, lng + dlng
+
+
+def to_dict(doctor, distance_km=None):
+    doc = {
+        "id": doctor.id,
+        "name": doctor.name,
+        "specialty": doctor.specialty,
+        "clinic": doctor.clinic,
+        "address": doctor.address,
+        "city": doctor.city,
+        "state": doctor.state,
+        "pincode": doctor.pincode,
+        "phone": doctor.phone,
+        "lat": doctor.lat,
+        "lng": doctor.lng,
+        "user_id": doctor.user_id,
+    }
+    if distance_km is not None:
+        doc["distance_km"] = distance_km
+    return doc
+
+
+def _specialty_query(db: Session, specialty):
+    return db.query(Doctor).filter(func.lower(Doctor.specialty) == specialty.lower())
+
+
+def _distance(doctor, lat, lng):
+    if doctor.lat is None or doctor.lng is None:
+        return float("inf")
+    return haversine_km(lat, lng, doctor.lat, doctor.lng)
+
+
+def _nearest_with_coordinates(db: Session, specialty, lat, lng, k):
+    """Up to k (distance, doctor) pairs with coordinates, nearest first."""
+    radius = INITIAL_RADIUS_KM
+    while True:
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+        candidates = _specialty_query(db, specialty).filter(
+            Doctor.lat.between(min_lat, max_lat),
+            Doctor.lng.between(min_lng, max_lng),
+        ).all()
+        ranked = sorted(((_distance(d, lat, lng), d) for d in candidates), key=lambda p: (p[0], p[1].id))
+        # Anything outside the circle may be beaten by a doctor outside the box
+        within = [p for p in ranked if p[0] <= radius]
+        if len(within) >= k or radius >= MAX_RADIUS_KM:
+            return ranked[:k] if radius >= MAX_RADIUS_KM else within[:k]
+        radius *= 2
+
+
+def nearest_doctors(db: Session, specialty, lat=None, lng=None, k=5):
+    """The k doctors of `specialty` closest to (lat, lng), as dicts with distance_km."""
+    lookup = SPECIALTY_ALIASES.get(specialty, specialty)
+    has_location = lat is not None and lng is not None
+
+    if specialty == 'GP' and _specialty_query(db, lookup).first() is None:
+        fallback = []
+        for gen_spec in GP_FALLBACK_SPECIALTIES:
+            fallback.extend(_specialty_query(db, gen_spec).order_by(Doctor.id).limit(GP_FALLBACK_PER_SPECIALTY).all())
+        if not has_location:
+            return [to_dict(d) for d in fallback[:k]]
+        ranked = sorted(fallback, key=lambda d: _distance(d, lat, lng))
+        return [to_dict(d, _distance(d, lat, lng)) for d in ranked[:k]]
+
+    if not has_location:
+        return [to_dict(d) for d in _specialty_query(db, lookup).order_by(Doctor.id).limit(k).all()]
+
+    results = [to_dict(d, dist) for dist, d in _nearest_with_coordinates(db, lookup, lat, lng, k)]
+    if len(results) < k:
+        # Doctors without coordinates rank last, in directory order
+        missing = _specialty_query(db, lookup).filter((Doctor.lat.is_(None)) | (Doctor.lng.is_(None)))
+        results.extend(to_dict(d, float("inf")) for d in missing.order_by(Doctor.id).limit(k - len(results)).all())
+    return results
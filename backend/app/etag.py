@@ -0,0 +1,161 @@
+"""
+Version-based ETags for per-user list endpoints.
+
+Write paths bump version numbers (`changes.bump(db, "inbox", doctor_id)`)
+for every resource they touch. The versions live in the `change_versions`
+table, so every worker sees every write. ETagMiddleware maps a GET to the
+version keys of the resource it reads, using only the path and the user id
+in the bearer token, and builds the ETag from one primary-key lookup:
+
+- If-None-Match matches -> 304 straight away, without running the listing
+  query or serializing anything;
+- otherwise the request runs normally and the 200 carries the ETag.
+
+The inbox also depends on the clock (claim leases expire without a
+write), so its ETags additionally roll over every TIME_BUCKET_SECONDS.
+
+Bumps are committed with the write itself, or after it, never before:
+versions are read before the handler runs, so a write racing with the
+request can only make the next ETag differ (a spurious 200), never a
+wrong 304.
+"""
+import hashlib
+import os
+import time
+
+from jose import JWTError, jwt
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import database
+from .auth import ALGORITHM, SECRET_KEY
+from .models import ChangeVersion
+
+ETAG_ENABLED = os.getenv("ETAG_ENABLED", "1") == "1"
+EVERYTHING = ("*", 0)  # bumped by changes that can touch any resource (e.g. the sweeper)
+
+
+class ChangeVersions:
+    """Reads and bumps rows of change_versions through the caller's session."""
+
+    def _bump(self, db: Session, kind, owner_id):
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            stmt = insert(ChangeVersion).values(kind=kind, owner_id=owner_id, version=1)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["kind", "owner_id"],
+                set_={"version": ChangeVersion.version + 1}
+            ))
+            return
+        # Other databases: update, insert if there was nothing to update
+        updated = db.query(ChangeVersion).filter(
+            ChangeVersion.kind == kind, ChangeVersion.owner_id == owner_id
+        ).update({ChangeVersion.version: ChangeVersion.version + 1}, synchronize_session=False)
+        if not updated:
+            db.add(ChangeVersion(kind=kind, owner_id=owner_id, version=1))
+
+    def bump(self, db: Session, kind, *owner_ids):
+        """Add 1 to each owner's `kind` version. Committed with the caller's transaction."""
+        for owner_id in dict.fromkeys(owner_ids):
+            if owner_id is not None:
+                self._bump(db, kind, owner_id)
+
+    def bump_all(self, db: Session):
+        """Invalidate every ETag. Committed with the caller's transaction."""
+        self._bump(db, *EVERYTHING)
+
+    def versions(self, db: Session, kind, owner_id):
+        """(everything version, this owner's `kind` version)."""
+        rows = dict(db.query(ChangeVersion.kind, ChangeVersion.version).filter(or_(
+            and_(ChangeVersion.kind == kind, ChangeVersion.owner_id == owner_id),
+            and_(ChangeVersion.kind == EVERYTHING[0], ChangeVersion.owner_id == EVERYTHING[1]),
+        )).all())
+        return rows.get(EVERYTHING[0], 0), rows.get(kind, 0)
+
+
+changes = ChangeVersions()
+
+# GET path -> version kind, keyed by the caller's user id
+ROUTES = {
+    "/api/doctors/me/requests": "inbox",
+    "/api/appointments/doctor/me": "doctor_appointments",
+    "/api/appointments/patient/me": "patient_appointments",
+}
+# Kinds whose content also changes with the clock (claim leases running out
+# without a write): their ETags roll over every this many seconds
+TIME_BUCKET_SECONDS = {"inbox": 60}
+
+
+def _user_id(headers):
+    auth = headers.get("authorization", "")
+    if not auth.lower().startswith("bearer "):
+        return None
+    try:
+        payload = jwt.decode(auth[7:], SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("uid")
+
+
+def compute_etag(kind, user_id, query_string: bytes, now=None):
+    """The ETag of this user's listing, or None when the versions cannot be read."""
+    db = database.SessionLocal()
+    try:
+        epoch, version = changes.versions(db, kind, user_id)
+    except SQLAlchemyError:
+        return None
+    finally:
+        db.close()
+    query = hashlib.sha1(query_string).hexdigest()[:8] if query_string else "0"
+    bucket = TIME_BUCKET_SECONDS.get(kind)
+    tick = int((now or time.time()) // bucket) if bucket else 0
+    return f'W/"{user_id}-{epoch}-{version}-{tick}-{query}"'
+
+
+class ETagMiddleware:
+    """ASGI middleware answering conditional GETs of ROUTES from the change versions."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not ETAG_ENABLED:
+            return await self.app(scope, receive, send)
+        kind = ROUTES.get(scope["path"])
+        if kind is None:
+            return await self.app(scope, receive, send)
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        user_id = _user_id(headers)
+        if user_id is None:
+            return await self.app(scope, receive, send)
+
+        etag = await run_in_threadpool(compute_etag, kind, user_id, scope.get("query_string", b""))
+        if etag is None:
+            return await self.app(scope, receive, send)
+        if_none_match = headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [(b"etag", etag.encode("latin-1")), (b"cache-control", b"private, no-cache")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"cache-control", b"private, no-cache"),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,112 @@
+"""
+Streaming export of triage requests and appointments as NDJSON or CSV.
+
+Rows are read through a server-side cursor (stream_results) in batches of
+`batch_size` and written out batch by batch, so memory stays flat no
+matter how many rows match. Each export opens its own connection: the
+HTTP response is streamed after the request's DB session has been closed.
+
+Run from the backend directory:
+    python -m app.export requests --format csv --from 2025-01-01 --to 2025-02-01 > requests.csv
+    python -m app.export appointments --status CONFIRMED --status CANCELLED --out appts.ndjson
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from .database import engine
+from .models import Appointment, TriageRequest
+
+FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+DEFAULT_BATCH_SIZE = 5000
+
+# kind -> (model, column the date range applies to)
+EXPORTS = {
+    "requests": (TriageRequest, TriageRequest.created_at),
+    "appointments": (Appointment, Appointment.start_time),
+}
+
+
+def build_query(kind, start=None, end=None, statuses=None):
+    """SELECT of every column of `kind`, filtered to [start, end) and statuses, in id order."""
+    model, date_column = EXPORTS[kind]
+    stmt = select(*model.__table__.columns)
+    if start is not None:
+        stmt = stmt.where(date_column >= start)
+    if end is not None:
+        stmt = stmt.where(date_column < end)
+    if statuses:
+        stmt = stmt.where(model.status.in_(statuses))
+    return stmt.order_by(model.id)
+
+
+def _value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_batches(kind, start=None, end=None, statuses=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield (columns, rows) batches straight off a server-side cursor."""
+    stmt = build_query(kind, start, end, statuses)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+        columns = list(result.keys())
+        for rows in result.partitions():
+            yield columns, rows
+
+
+def stream(kind, fmt="ndjson", start=None, end=None, statuses=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield the export as text chunks, one chunk per batch (CSV starts with a header)."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'")
+    header_written = False
+    for columns, rows in iter_batches(kind, start, end, statuses, batch_size):
+        buf = io.StringIO()
+        if fmt == "ndjson":
+            for row in rows:
+                buf.write(json.dumps({c: _value(v) for c, v in zip(columns, row)}))
+                buf.write("\n")
+        else:
+            writer = csv.writer(buf)
+            if not header_written:
+                writer.writerow(columns)
+                header_written = True
+            for row in rows:
+                writer.writerow([json.dumps(v) if isinstance(v, (list, dict)) else _value(v) for v in row])
+        yield buf.getvalue()
+    if fmt == "csv" and not header_written:
+        # No rows: still emit the header
+        model, _ = EXPORTS[kind]
+        yield ",".join(c.name for c in model.__table__.columns) + "\r\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export triage requests or appointments")
+    parser.add_argument("kind", choices=sorted(EXPORTS))
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--from", dest="start", type=datetime.fromisoformat,
+                        help="inclusive lower bound (created_at for requests, start_time for appointments)")
+    parser.add_argument("--to", dest="end", type=datetime.fromisoformat, help="exclusive upper bound")
+    parser.add_argument("--status", action="append", help="repeat to export several statuses")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--out", help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    out = open(args.out, "w", newline="", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for chunk in stream(args.kind, args.format, args.start, args.end, args.status, args.batch_size):
+            out.write(chunk)
+    finally:
+        if args.out:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Bulk loader for the doctor directory.
+
+Loads doctors.json (a JSON array) or NDJSON / gzipped NDJSON from
+generate_doctors.py into the `doctors` table:
+
+- rows are inserted in chunks with a single executemany per chunk (or
+  COPY FROM STDIN on PostgreSQL), one transaction per chunk; --replace
+  swaps the whole directory in one transaction instead;
+- secondary indexes are dropped before the load and rebuilt once at the
+  end (also when the load fails), instead of being maintained row by row;
+- without --replace, records whose id is already in the table update that
+  entry (keeping its account link unless the record has one) rather than
+  failing the chunk;
+- afterwards directory entries are linked to doctor accounts
+  (app.doctor_accounts): links from `user_id` in the records are kept, and
+  with --replace so are the previous links of ids that are loaded again.
+
+Records keep their own `id` when they have one; records without one get
+the next id from the table.
+
+Run from the backend directory:
+    python -m app.load_doctors doctors.json --replace
+    python -m app.load_doctors data/doctors.ndjson.gz --batch-size 50000
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import time
+
+from sqlalchemy import bindparam, func, select, text, update
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from .database import engine, Base
+from .doctor_accounts import link_unlinked
+from .models import Doctor, User
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["id", "name", "specialty", "clinic", "address", "city", "state", "pincode", "phone", "lat", "lng", "user_id"]
+METHODS = ("auto", "copy", "executemany")
+
+
+def iter_records(path):
+    """
+    Yield doctor dicts from a file. NDJSON is streamed line by line; a plain
+    JSON array is parsed in one go, so use NDJSON for very large directories.
+    """
+    if path.endswith(".gz"):
+        f = gzip.open(path, "rt", encoding="utf-8")
+    else:
+        f = open(path, "r", encoding="utf-8")
+    with f:
+        if ".ndjson" in path or ".jsonl" in path:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def to_row(record):
+    """Table row for one record; the directory's own id is kept when the record has one."""
+    row = {
+        "name": record.get("name"),
+        "specialty": record.get("specialty"),
+        "clinic": record.get("clinic"),
+        "address": record.get("address"),
+        "city": record.get("city"),
+        "state": record.get("state"),
+        "pincode": str(record["pincode"]) if record.get("pincode") is not None else None,
+        "phone": record.get("phone"),
+        "lat": record.get("lat"),
+        "lng": record.get("lng"),
+        "user_id": record.get("user_id"),
+    }
+    if record.get("id") is not None:
+        row["id"] = record["id"]
+    return row
+
+
+def chunked(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def insert_executemany(conn, rows):
+    conn.execute(Doctor.__table__.insert(), rows)
+
+
+def insert_copy(conn, rows):
+    """PostgreSQL COPY FROM STDIN (CSV) on the connection's own transaction."""
+    columns = [c for c in COLUMNS if c in rows[0]]
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(["" if row[c] is None else row[c] for c in columns])
+    buf.seek(0)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY doctors ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+            buf
+        )
+    finally:
+        cursor.close()
+
+
+def existing_ids(conn, ids, chunk_size=1000):
+    """The subset of `ids` already in `doctors` (looked up in chunks to stay under bind limits)."""
+    found = set()
+    for start in range(0, len(ids), chunk_size):
+        found.update(conn.execute(
+            select(Doctor.id).where(Doctor.id.in_(ids[start:start + chunk_size]))
+        ).scalars())
+    return found
+
+
+def update_existing(conn, rows):
+    """Overwrite directory entries in place; an entry's account link is kept unless the record has one."""
+    table = Doctor.__table__
+    fields = [c for c in COLUMNS if c not in ("id", "user_id")]
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(**{c: bindparam(f"b_{c}") for c in fields},
+                user_id=func.coalesce(bindparam("b_user_id"), table.c.user_id))
+    )
+    conn.execute(stmt, [{f"b_{c}": row[c] for c in COLUMNS} for row in rows])
+
+
+def insert_batch(conn, insert, batch, upsert=False):
+    """
+    Insert one chunk. Rows with and without an id go in separate statements
+    (executemany and COPY need the same columns on every row). With `upsert`,
+    ids already in the table (or repeated in the chunk, last one wins) update
+    their entry instead of failing the chunk. Returns whether any row carried
+    its own id.
+    """
+    rows = [to_row(r) for r in batch]
+    with_id = [r for r in rows if "id" in r]
+    without_id = [r for r in rows if "id" not in r]
+    if upsert and with_id:
+        with_id = list({r["id"]: r for r in with_id}.values())
+        found = existing_ids(conn, [r["id"] for r in with_id])
+        if found:
+            update_existing(conn, [r for r in with_id if r["id"] in found])
+        new = [r for r in with_id if r["id"] not in found]
+    else:
+        new = with_id
+    for group in (new, without_id):
+        if group:
+            insert(conn, group)
+    return bool(with_id)
+
+
+# IF [NOT] EXISTS instead of checkfirst: SQLite reflection does not report
+# expression indexes such as ix_doctors_specialty_lat_lng
+def drop_indexes(conn):
+    for index in Doctor.__table__.indexes:
+        conn.execute(DropIndex(index, if_exists=True))
+
+
+def create_indexes(conn):
+    for index in Doctor.__table__.indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def restore_links(conn, previous):
+    """Re-apply {doctor id: user id} links from before a --replace to ids that were loaded again."""
+    if not previous:
+        return
+    table = Doctor.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("doctor_id"), table.c.user_id.is_(None))
+        .values(user_id=bindparam("account_id"))
+    )
+    conn.execute(stmt, [{"doctor_id": d, "account_id": u} for d, u in previous.items()])
+
+
+def load(path, batch_size=10000, method="auto", replace=False):
+    """
+    Load a directory file into `doctors`. Returns the number of records loaded.
+
+    Without `replace` every chunk is committed on its own and existing ids are
+    updated in place. With `replace` the
+    delete, the inserts and the index rebuild are a single transaction, so
+    readers keep seeing the previous directory until the new one is complete
+    (and a failed load leaves it untouched). On PostgreSQL the indexes are
+    then kept in place rather than dropped: DROP INDEX would lock readers out
+    for the whole load.
+    """
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, Doctor.__table__])
+    is_postgres = engine.dialect.name == "postgresql"
+    if method == "auto":
+        method = "copy" if is_postgres else "executemany"
+    if method == "copy" and not is_postgres:
+        raise ValueError("COPY is only available on PostgreSQL")
+    insert = insert_copy if method == "copy" else insert_executemany
+
+    start = time.perf_counter()
+    rows = 0
+    any_id = False
+    if replace:
+        with engine.begin() as conn:
+            previous = dict(conn.execute(
+                select(Doctor.id, Doctor.user_id).where(Doctor.user_id.isnot(None))
+            ).all())
+            conn.execute(Doctor.__table__.delete())
+            if not is_postgres:
+                drop_indexes(conn)
+            for batch in chunked(iter_records(path), batch_size):
+                any_id = insert_batch(conn, insert, batch) or any_id
+                rows += len(batch)
+                logger.info("Loaded %d doctors", rows)
+            create_indexes(conn)
+            restore_links(conn, previous)
+    else:
+        # Indexes are restored however the load ends; chunks already
+        # committed stay loaded
+        try:
+            with engine.begin() as conn:
+                drop_indexes(conn)
+            for batch in chunked(iter_records(path), batch_size):
+                with engine.begin() as conn:
+                    any_id = insert_batch(conn, insert, batch, upsert=True) or any_id
+                rows += len(batch)
+                logger.info("Loaded %d doctors", rows)
+        finally:
+            with engine.begin() as conn:
+                create_indexes(conn)
+
+    with Session(engine) as db:
+        matched = link_unlinked(db)
+    logger.info("Matched %d doctor accounts to directory entries", matched)
+
+    if is_postgres:
+        with engine.begin() as conn:
+            if any_id:
+                conn.execute(text(
+                    "SELECT setval(pg_get_serial_sequence('doctors', 'id'), COALESCE(MAX(id), 1)) FROM doctors"
+                ))
+            conn.execute(text("ANALYZE doctors"))
+
+    logger.info("Loaded %d doctors via %s in %.2fs", rows, method, time.perf_counter() - start)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load the doctor directory into the database")
+    parser.add_argument("path", help="doctors.json, .ndjson or .ndjson.gz")
+    parser.add_argument("--batch-size", type=int, default=10000, help="rows per transaction")
+    parser.add_argument("--method", choices=METHODS, default="auto",
+                        help="auto uses COPY on PostgreSQL and executemany elsewhere")
+    parser.add_argument("--replace", action="store_true",
+                        help="replace existing doctors atomically (one transaction)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    start = time.perf_counter()
+    rows = load(args.path, args.batch_size, args.method, args.replace)
+    with engine.connect() as conn:
+        total = conn.execute(select(func.count()).select_from(Doctor.__table__)).scalar()
+    print(f"Loaded {rows} doctors in {time.perf_counter() - start:.2f}s ({total} in table)")
+
+
+if __name__ == "__main__":
+    main()
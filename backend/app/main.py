@@ -1,13 +1,50 @@
+from .startup import StartupReport
+
+startup_report = StartupReport("app.main")
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .database import engine, Base
-from .routers import auth, patients, doctors, requests, appointments
+from fastapi.responses import PlainTextResponse
+from .database import AUTO_CREATE_SCHEMA, init_schema
+from .audit import audit_log
+from .sweeper import sweeper
+from .etag import ETagMiddleware
+from .compression import add_compression
+from .admission import AdmissionLimiter, add_admission_control
+from .metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .responses import DEFAULT_RESPONSE_CLASS
+from .routers import auth, patients, doctors, requests, appointments, admin, analytics
+
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AUTO_CREATE_SCHEMA:
+        with startup_report.phase("schema"):
+            init_schema()
+    with startup_report.phase("sweeper"):
+        sweeper.start()
+    startup_report.finish()
+    app.state.startup_report = startup_report
+    yield
+    sweeper.stop()
+    # Write out queued audit events before the process exits
+    audit_log.stop()
 
-app = FastAPI(title="Smart Triage API")
+app = FastAPI(title="Smart Triage API", default_response_class=DEFAULT_RESPONSE_CLASS, lifespan=lifespan)
 
+# Innermost: fast 503s for password hashing under overload, still wrapped by CORS
+app.state.admission_limiters = add_admission_control(app, {
+    AdmissionLimiter.from_env("auth", 4, 16, 3.0): [
+        ("POST", "/api/auth/login"),
+        ("POST", "/api/patients/signup"),
+        ("POST", "/api/doctors/signup"),
+    ],
+})
+
+# Answers unchanged inbox/appointment listings with 304 after one version lookup;
+# added before CORS so its 304s still get the CORS headers
+app.add_middleware(ETagMiddleware)
 # Allow Frontend access (CORS)
 app.add_middleware(
     CORSMiddleware,
@@ -15,10 +52,22 @@ app.add_middleware(
     allow_credentials=False, # We use Bearer tokens (headers), not cookies, so this is safe and allows '*' origin
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"], # Pagination cursor of appointment listings, conditional GETs
 )
+# Outermost: gzip/brotli for bodies above COMPRESSION_MIN_SIZE
+add_compression(app)
 
 app.include_router(auth.router)
 app.include_router(patients.router)
 app.include_router(doctors.router)
 app.include_router(requests.router)
 app.include_router(appointments.router)
+app.include_router(admin.router)
+app.include_router(analytics.router)
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus text exposition of the process-wide registry."""
+    return PlainTextResponse(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+startup_report.imported()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Float, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from datetime import datetime as dt
 from .database import Base
@@ -9,7 +9,7 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True)
     password_hash = Column(String, nullable=True) # Nullable for Gmail-only
-    role = Column(String) # 'patient' or 'doctor'
+    role = Column(String) # 'patient', 'doctor' or 'admin' (python -m app.admins)
     name = Column(String)
     email = Column(String, nullable=True)
     
@@ -27,15 +27,30 @@ class TriageRequest(Base):
     symptom = Column(String)
     specialty = Column(String)
     answers_json = Column(JSON) # Stores list of answers
-    status = Column(String, default="new") # new, viewed, accepted, rejected, booked
+    status = Column(String, default="new") # new, claimed, viewed, accepted, rejected, booked
     doctor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     handled_by = Column(Integer, ForeignKey("users.id"), nullable=True) # Doctor who handled it
     handled_at = Column(DateTime, nullable=True) # When handled
     created_at = Column(DateTime, default=dt.utcnow)
+    severity = Column(Integer, default=0, server_default="0", nullable=False) # app.severity score, higher is more urgent
+    city = Column(String, nullable=True) # Patient's city when the request was made (demand analytics)
+
+    # Claim queue (app.assignment): doctor holding the lease and when it runs out
+    claimed_by = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    claimed_at = Column(DateTime, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
 
     patient = relationship("User", foreign_keys=[patient_id])
     doctor = relationship("User", foreign_keys=[doctor_id])
     handler = relationship("User", foreign_keys=[handled_by])
+    claimer = relationship("User", foreign_keys=[claimed_by])
+
+    __table_args__ = (
+        # Next-request lookup: one specialty's queue, most severe first, then arrival order
+        Index("ix_requests_queue", func.lower(specialty), status, severity.desc(), created_at, id),
+        # Sweeper: open requests older than the cutoff
+        Index("ix_requests_status_created", status, created_at),
+    )
 
 class Appointment(Base):
     __tablename__ = "appointments"
@@ -47,7 +62,7 @@ class Appointment(Base):
     start_time = Column(DateTime, index=True)  # ISO timestamp in UTC
     end_time = Column(DateTime)  # ISO timestamp in UTC
     mode = Column(String, default="in_person")  # video, in_person, phone
-    status = Column(String, default="PENDING")  # PENDING, CONFIRMED, CANCELLED
+    status = Column(String, default="PENDING")  # PENDING, CONFIRMED, CANCELLED, COMPLETED, EXPIRED
     notes = Column(Text, nullable=True)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=True)  # Doctor who created
     created_at = Column(DateTime, default=dt.utcnow)
@@ -56,3 +71,86 @@ class Appointment(Base):
     doctor = relationship("User", foreign_keys=[doctor_id])
     patient = relationship("User", foreign_keys=[patient_id])
     creator = relationship("User", foreign_keys=[created_by])
+
+    __table_args__ = (
+        # Sweeper: active appointments that have ended
+        Index("ix_appointments_status_end", status, end_time),
+        # Calendar listings: one doctor's / patient's appointments in time order
+        Index("ix_appointments_doctor_start", doctor_id, start_time, id),
+        Index("ix_appointments_patient_start", patient_id, start_time, id),
+    )
+
+class AppointmentArchive(Base):
+    """Finished appointments moved out of `appointments` by app.sweeper (same columns, no FKs)."""
+    __tablename__ = "appointments_archive"
+
+    id = Column(Integer, primary_key=True)
+    request_id = Column(Integer, nullable=True)
+    doctor_id = Column(Integer, index=True)
+    patient_id = Column(Integer, index=True)
+    start_time = Column(DateTime)
+    end_time = Column(DateTime)
+    mode = Column(String)
+    status = Column(String)
+    notes = Column(Text, nullable=True)
+    created_by = Column(Integer, nullable=True)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, default=dt.utcnow)
+
+class Doctor(Base):
+    """Doctor directory entry (doctors.json / generate_doctors.py), bulk-loaded by app.load_doctors."""
+    __tablename__ = "doctors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String)
+    specialty = Column(String, index=True)
+    clinic = Column(String, nullable=True)
+    address = Column(String, nullable=True)
+    city = Column(String, index=True)
+    state = Column(String, nullable=True)
+    pincode = Column(String, nullable=True)
+    phone = Column(String, nullable=True)
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
+    # Registered account of this doctor, if any (appointments.doctor_id refers to users.id)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+
+    __table_args__ = (
+        # Nearest-doctor search: case-insensitive specialty match + latitude band (app.doctor_search)
+        Index("ix_doctors_specialty_lat_lng", func.lower(specialty), lat, lng),
+    )
+
+class DemandRollup(Base):
+    """Hourly request/booking counters per specialty and city, maintained by app.analytics."""
+    __tablename__ = "demand_rollup"
+
+    id = Column(Integer, primary_key=True)
+    bucket = Column(DateTime, nullable=False) # Start of the UTC hour
+    specialty = Column(String, nullable=False)
+    city = Column(String, nullable=False, default="")
+    event = Column(String, nullable=False) # created, viewed, rejected, booked, cancelled
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("bucket", "specialty", "city", "event", name="uq_demand_rollup_key"),
+    )
+
+class AuditEvent(Base):
+    """Append-only audit trail written in batches by app.audit."""
+    __tablename__ = "audit_events"
+
+    id = Column(Integer, primary_key=True)
+    at = Column(DateTime, nullable=False, index=True) # When the action happened (UTC)
+    action = Column(String, nullable=False, index=True) # e.g. BOOK_APPOINTMENT, CANCEL_APPOINTMENT
+    actor_id = Column(Integer, nullable=True) # User who performed it
+    appointment_id = Column(Integer, nullable=True, index=True)
+    request_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)
+
+class ChangeVersion(Base):
+    """Per-user resource versions behind app.etag's ETags, shared by every worker."""
+    __tablename__ = "change_versions"
+
+    kind = Column(String, primary_key=True) # inbox, doctor_appointments, patient_appointments; "*" = every resource
+    owner_id = Column(Integer, primary_key=True) # User whose listing changed (0 for "*")
+    version = Column(Integer, nullable=False, default=0)
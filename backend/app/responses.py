@@ -0,0 +1,47 @@
+"""
+Fast JSON rendering for both apps.
+
+FastJSONResponse renders with orjson when it is installed (and
+JSON_RENDERER is not "stdlib"), otherwise with the same compact json.dumps
+as Starlette's JSONResponse. Use DEFAULT_RESPONSE_CLASS as an app's
+default_response_class: it is wrapped in Default(...) so routes with a
+response_model keep FastAPI's pydantic-core fast path, and only routes that
+return plain dicts/lists (recommendations, inboxes, directory lookups) go
+through render().
+
+orjson writes NaN/Infinity as null where the stdlib renderer raises.
+"""
+import json
+import os
+
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+JSON_RENDERER = os.getenv("JSON_RENDERER", "orjson" if orjson is not None else "stdlib")
+if JSON_RENDERER == "orjson" and orjson is None:
+    JSON_RENDERER = "stdlib"
+
+
+def dumps_stdlib(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def dumps_orjson(content) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+dumps = dumps_orjson if JSON_RENDERER == "orjson" else dumps_stdlib
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+DEFAULT_RESPONSE_CLASS = Default(FastJSONResponse)
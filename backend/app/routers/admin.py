@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Optional
+from .. import models, auth, export
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+@router.get("/export/{kind}")
+def export_rows(
+    kind: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    status: Optional[List[str]] = Query(None),
+    batch_size: int = Query(export.DEFAULT_BATCH_SIZE, ge=100, le=50000),
+    current_user: models.User = Depends(auth.get_current_admin)
+):
+    """
+    Stream every request or appointment matching the filters as NDJSON or CSV.
+    `from`/`to` apply to created_at for requests and start_time for appointments.
+    """
+    if kind not in export.EXPORTS:
+        raise HTTPException(status_code=404, detail="Unknown export")
+
+    filename = f"{kind}.{format}"
+    return StreamingResponse(
+        export.stream(kind, format, start, end, status, batch_size),
+        media_type=export.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/startup")
+def startup_report(request: Request, current_user: models.User = Depends(auth.get_current_admin)):
+    """Per-phase startup timing of this worker (import, schema, background jobs)."""
+    report = getattr(request.app.state, "startup_report", None)
+    if report is None:
+        raise HTTPException(status_code=503, detail="Startup has not finished")
+    return report.as_dict()
+
+@router.get("/admission")
+def admission_status(request: Request, current_user: models.User = Depends(auth.get_current_admin)):
+    """In-flight, queued, admitted and rejected requests per admission limiter."""
+    return {name: limiter.stats() for name, limiter in request.app.state.admission_limiters.items()}
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+from .. import database, models, auth, analytics
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+@router.get("/demand")
+def demand(
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    bucket: str = Query("hour", pattern="^(hour|day|week)$"),
+    group_by: str = Query("specialty", description="comma-separated: specialty, city"),
+    specialty: Optional[str] = None,
+    city: Optional[str] = None,
+    current_user: models.User = Depends(auth.get_current_admin),
+    db: Session = Depends(database.get_db)
+):
+    """Requests created/viewed/rejected/booked/cancelled per time bucket, read from the demand rollup."""
+    dimensions = [g.strip() for g in group_by.split(",") if g.strip()]
+    series = analytics.demand(db, start, end, bucket, dimensions, specialty, city)
+    return {"bucket": bucket, "group_by": [g for g in analytics.GROUP_BY if g in dimensions], "series": series}
@@ -1,18 +1,25 @@
 """
 Appointment booking router with transactional double-booking prevention.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 from datetime import datetime
+import base64
 import logging
 from typing import Optional
-from .. import database, schemas, models, auth
+from .. import database, schemas, models, auth, assignment, analytics
+from ..doctor_load import tracker as appointment_load
+from ..audit import audit_log
+from ..etag import changes
 
 router = APIRouter(prefix="/api/appointments", tags=["appointments"])
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
 
 def validate_booking_request(
     data: schemas.BookAppointmentRequest,
@@ -60,8 +67,10 @@ def validate_booking_request(
         
         if not req:
             errors.append("Request not found")
-        elif req.status not in ["new", "viewed"]:
-            errors.append(f"Request status is '{req.status}', cannot book from this state")
+        elif req.status not in assignment.BOOKABLE_STATUSES:
+            errors.append(f"Request status is '{req.status}', claim or view it before booking")
+        elif doctor_id and not assignment.can_book(req, doctor_id):
+            errors.append("Request is assigned to another doctor")
     
     # 4. Verify patient exists
     try:
@@ -142,6 +151,14 @@ def book_appointment(
     
     try:
         # Start transaction
+        # Take the request first: a conditional UPDATE, so of two doctors
+        # racing past validation only one gets it
+        if req and not assignment.book(db, req, current_user):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Request was already booked or is no longer assigned to you"
+            )
+
         # Check for overlapping appointments (AC3 - double-booking prevention)
         if check_overlapping_appointments(doctor_id, data.startTime, data.endTime, db):
             # Conflict: slot already taken
@@ -166,20 +183,25 @@ def book_appointment(
         db.flush()  # Flush to get the ID before commit
         appointment_id = appointment.id
         
-        # Update request status to BOOKED
+        changes.bump(db, "doctor_appointments", doctor_id)
+        changes.bump(db, "patient_appointments", patient_id)
         if req:
-            req.status = "booked"
-            req.handled_by = current_user.id
-            req.handled_at = datetime.utcnow()
-        
+            changes.bump(db, "inbox", req.doctor_id, req.claimed_by)
+
         # Commit transaction
         db.commit()
+        appointment_load.booked(doctor_id, data.startTime)
         
-        # Log audit trail
-        logger.info(
-            f"BOOK_APPOINTMENT: doctor_id={doctor_id}, patient_id={patient_id}, "
-            f"request_id={request_id}, appointment_id={appointment_id}, "
-            f"start_time={data.startTime}, end_time={data.endTime}"
+        # Log audit trail (queued, written in the background)
+        audit_log.emit(
+            "BOOK_APPOINTMENT",
+            actor_id=current_user.id,
+            appointment_id=appointment_id,
+            request_id=request_id,
+            doctor_id=doctor_id,
+            patient_id=patient_id,
+            start_time=data.startTime,
+            end_time=data.endTime
         )
         
         return {
@@ -194,7 +216,7 @@ def book_appointment(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Error booking appointment: {str(e)}")
+        logger.error("Error booking appointment: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to book appointment. Please try again."
@@ -228,44 +250,101 @@ def get_appointment(
     return appt
 
 
+def encode_cursor(appt: models.Appointment) -> str:
+    """Opaque position after `appt` in (start_time, id) order."""
+    raw = f"{appt.start_time.isoformat()}|{appt.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        start, appt_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(start), int(appt_id)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def list_appointments(
+    owner_column,
+    owner_id: int,
+    db: Session,
+    response: Response,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: int,
+    cursor: Optional[str]
+):
+    """
+    One page of active appointments in (start_time, id) order, read off the
+    (owner, start_time, id) index. Sets X-Next-Cursor when there is more.
+    """
+    query = db.query(models.Appointment).filter(
+        owner_column == owner_id,
+        models.Appointment.status.in_(["PENDING", "CONFIRMED"])
+    )
+    if start is not None:
+        query = query.filter(models.Appointment.start_time >= start)
+    if end is not None:
+        query = query.filter(models.Appointment.start_time < end)
+    if cursor:
+        after_start, after_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            models.Appointment.start_time > after_start,
+            and_(models.Appointment.start_time == after_start, models.Appointment.id > after_id)
+        ))
+
+    # Fetch one extra row to know whether another page exists
+    appts = query.order_by(models.Appointment.start_time, models.Appointment.id).limit(limit + 1).all()
+    if len(appts) > limit:
+        appts = appts[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(appts[-1])
+    return appts
+
+
 @router.get("/doctor/me", response_model=list[schemas.AppointmentResponse])
 def get_doctor_appointments(
+    response: Response,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: models.User = Depends(auth.get_current_user),
     db: Session = Depends(database.get_db)
 ):
-    """Get all appointments for the current doctor."""
+    """
+    Active appointments of the current doctor, paginated.
+    Pass the X-Next-Cursor response header as `cursor` for the next page.
+    """
     if current_user.role != "doctor":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only doctors can view appointments"
         )
     
-    appts = db.query(models.Appointment).filter(
-        models.Appointment.doctor_id == current_user.id,
-        models.Appointment.status.in_(["PENDING", "CONFIRMED"])
-    ).order_by(models.Appointment.start_time).all()
-    
-    return appts
+    return list_appointments(models.Appointment.doctor_id, current_user.id, db, response, start, end, limit, cursor)
 
 
 @router.get("/patient/me", response_model=list[schemas.AppointmentResponse])
 def get_patient_appointments(
+    response: Response,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: models.User = Depends(auth.get_current_user),
     db: Session = Depends(database.get_db)
 ):
-    """Get all appointments for the current patient."""
+    """
+    Active appointments of the current patient, paginated.
+    Pass the X-Next-Cursor response header as `cursor` for the next page.
+    """
     if current_user.role != "patient":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only patients can view appointments"
         )
     
-    appts = db.query(models.Appointment).filter(
-        models.Appointment.patient_id == current_user.id,
-        models.Appointment.status.in_(["PENDING", "CONFIRMED"])
-    ).order_by(models.Appointment.start_time).all()
-    
-    return appts
+    return list_appointments(models.Appointment.patient_id, current_user.id, db, response, start, end, limit, cursor)
 
 
 @router.patch("/{appointment_id}/cancel")
@@ -298,12 +377,21 @@ def cancel_appointment(
             detail="Appointment is already cancelled"
         )
     
+    was_confirmed = appt.status == "CONFIRMED"
     appt.status = "CANCELLED"
+    specialty = appt.request.specialty if appt.request else (appt.doctor.specialty if appt.doctor else None)
+    analytics.record(db, "cancelled", specialty, appt.request.city if appt.request else None)
+    changes.bump(db, "doctor_appointments", appt.doctor_id)
+    changes.bump(db, "patient_appointments", appt.patient_id)
     db.commit()
+    if was_confirmed:
+        appointment_load.cancelled(appt.doctor_id, appt.start_time)
     
-    logger.info(
-        f"CANCEL_APPOINTMENT: appointment_id={appointment_id}, "
-        f"cancelled_by={current_user.id}"
+    audit_log.emit(
+        "CANCEL_APPOINTMENT",
+        actor_id=current_user.id,
+        appointment_id=appointment_id,
+        request_id=appt.request_id
     )
     
     return {"message": "Appointment cancelled successfully"}
@@ -14,5 +14,5 @@ def login(creds: schemas.LoginRequest, db: Session = Depends(database.get_db)):
             detail="Incorrect username or password",
         )
     
-    access_token = auth.create_access_token(data={"sub": user.username, "role": user.role})
+    access_token = auth.create_access_token(data={"sub": user.username, "uid": user.id, "role": user.role})
     return {"access_token": access_token, "token_type": "bearer", "user": user}
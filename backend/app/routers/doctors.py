@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+import math
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
-from .. import database, schemas, models, auth
+from typing import List, Optional
+from .. import database, schemas, models, auth, doctor_search, doctor_load, doctor_accounts, assignment
+from . import requests
 
 router = APIRouter(prefix="/api/doctors", tags=["doctors"])
 
@@ -23,10 +25,13 @@ def doctor_signup(data: schemas.DoctorSignup, db: Session = Depends(database.get
         email=data.email
     )
     db.add(new_user)
+    db.flush()
+    # Tie the account to its directory entry so rank=load sees its bookings
+    doctor_accounts.link_account(db, new_user, data.directory_id)
     db.commit()
     db.refresh(new_user)
 
-    access_token = auth.create_access_token(data={"sub": new_user.username, "role": "doctor"})
+    access_token = auth.create_access_token(data={"sub": new_user.username, "uid": new_user.id, "role": "doctor"})
     return {"access_token": access_token, "token_type": "bearer", "user": new_user}
 
 @router.post("/signup/gmail", response_model=schemas.Token)
@@ -45,9 +50,34 @@ def doctor_gmail_signup(data: schemas.GmailSignup, db: Session = Depends(databas
     db.commit()
     db.refresh(new_user)
     
-    access_token = auth.create_access_token(data={"sub": new_user.username, "role": "doctor"})
+    access_token = auth.create_access_token(data={"sub": new_user.username, "uid": new_user.id, "role": "doctor"})
     return {"access_token": access_token, "token_type": "bearer", "user": new_user}
 
+@router.get("/nearby")
+def nearby_doctors(
+    specialty: str,
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    k: int = Query(5, ge=1, le=50),
+    rank: str = Query("distance", pattern="^(distance|load)$"),
+    db: Session = Depends(database.get_db)
+):
+    """
+    Nearest k directory doctors of a specialty, ranked like /api/symptom-recommendations.
+    rank=load blends distance with each doctor's upcoming confirmed appointments.
+    """
+    if rank == "load":
+        doctor_load.tracker.prime(db)
+        candidates = doctor_search.nearest_doctors(db, specialty, lat, lng, k * doctor_load.LOAD_CANDIDATE_FACTOR)
+        doctors = doctor_load.rank_by_load(candidates, k)
+    else:
+        doctors = doctor_search.nearest_doctors(db, specialty, lat, lng, k)
+    for doc in doctors:
+        if "distance_km" in doc:
+            dist = doc["distance_km"]
+            doc["distance_km"] = round(dist, 2) if math.isfinite(dist) else None
+    return {"specialty": specialty, "doctors": doctors}
+
 @router.get("/me/requests", response_model=List[schemas.RequestResponse])
 def get_my_requests(
     current_user: models.User = Depends(auth.get_current_user),
@@ -56,25 +86,6 @@ def get_my_requests(
     if current_user.role != "doctor":
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Filter: Status pending AND Specialty matches (contains)
-    # Using ILIKE for case-insensitive partial match
-    search_pattern = f"%{current_user.specialty}%"
-    
-    reqs = db.query(models.TriageRequest).filter(
-        models.TriageRequest.status == "pending",
-        models.TriageRequest.specialty.ilike(search_pattern)
-    ).all()
-
-    # Map to response (need to fetch patient name)
-    results = []
-    for r in reqs:
-        results.append({
-            "id": r.id,
-            "symptom": r.symptom,
-            "specialty": r.specialty,
-            "status": r.status,
-            "created_at": r.created_at,
-            "answers": r.answers_json,
-            "patient_name": r.patient.name if r.patient else "Unknown"
-        })
-    return results
+    # Requests assigned to this doctor through the claim queue (POST /api/requests/claim)
+    reqs = assignment.inbox(db, current_user)
+    return [requests.to_response(r) for r in reqs]
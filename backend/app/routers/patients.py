@@ -18,13 +18,14 @@ def patient_signup(data: schemas.PatientSignup, db: Session = Depends(database.g
         password_hash=auth.get_password_hash(data.password),
         name=data.name,
         role="patient",
-        email=data.email
+        email=data.email,
+        location=data.location
     )
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
 
-    access_token = auth.create_access_token(data={"sub": new_user.username, "role": "patient"})
+    access_token = auth.create_access_token(data={"sub": new_user.username, "uid": new_user.id, "role": "patient"})
     return {"access_token": access_token, "token_type": "bearer", "user": new_user}
 
 @router.post("/signup/gmail", response_model=schemas.Token)
@@ -51,5 +52,5 @@ def patient_gmail_signup(data: schemas.GmailSignup, db: Session = Depends(databa
     db.commit()
     db.refresh(new_user)
 
-    access_token = auth.create_access_token(data={"sub": new_user.username, "role": "patient"})
+    access_token = auth.create_access_token(data={"sub": new_user.username, "uid": new_user.id, "role": "patient"})
     return {"access_token": access_token, "token_type": "bearer", "user": new_user}
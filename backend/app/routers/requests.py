@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
-from .. import database, schemas, models, auth
+from .. import database, schemas, models, auth, assignment, severity, analytics
+from ..etag import changes
 
 router = APIRouter(prefix="/api/requests", tags=["requests"])
 
@@ -14,23 +15,80 @@ def create_request(
     if current_user.role != "patient":
         raise HTTPException(status_code=403, detail="Only patients can create requests")
 
+    city = (data.city or current_user.location or "").strip() or None
     new_req = models.TriageRequest(
         patient_id=current_user.id,
         symptom=data.symptom,
         specialty=data.specialty,
         answers_json=data.answers,
-        status="pending"
+        status="new",
+        severity=severity.score(data.answers, data.chest_pain, data.fever),
+        city=city
     )
     db.add(new_req)
+    analytics.record(db, "created", data.specialty, city)
     db.commit()
     db.refresh(new_req)
 
     return {
         **new_req.__dict__,
         "patient_name": current_user.name,
-        "answers": new_req.answers_json
+        "answers": new_req.answers_json,
+        "severity_level": severity.level(new_req.severity)
     }
 
+def to_response(r: models.TriageRequest) -> dict:
+    return {
+        "id": r.id,
+        "symptom": r.symptom,
+        "specialty": r.specialty,
+        "status": r.status,
+        "created_at": r.created_at,
+        "answers": r.answers_json,
+        "patient_name": r.patient.name if r.patient else "Unknown",
+        "severity": r.severity or 0,
+        "severity_level": severity.level(r.severity or 0)
+    }
+
+@router.post("/claim", response_model=schemas.RequestResponse, responses={204: {"description": "Queue is empty"}})
+def claim_request(
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(database.get_db)
+):
+    """
+    Lease the next queued request of the doctor's specialty.
+    Returns the request already held if the doctor has a live claim.
+    """
+    if current_user.role != "doctor":
+        raise HTTPException(status_code=403, detail="Only doctors can claim requests")
+
+    req = assignment.claim_next(db, current_user)
+    changes.bump(db, "inbox", current_user.id)
+    db.commit()
+    if not req:
+        return Response(status_code=204)
+    return to_response(req)
+
+@router.post("/{req_id}/release")
+def release_request(
+    req_id: int,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(database.get_db)
+):
+    """Give a claimed request back to the queue."""
+    if current_user.role != "doctor":
+        raise HTTPException(status_code=403, detail="Only doctors can release requests")
+
+    req = db.query(models.TriageRequest).filter(models.TriageRequest.id == req_id).first()
+    if not req:
+        raise HTTPException(status_code=404, detail="Request not found")
+
+    if not assignment.release(db, req, current_user):
+        raise HTTPException(status_code=409, detail="Request is not claimed by you")
+    changes.bump(db, "inbox", current_user.id)
+    db.commit()
+    return {"message": "Request released", "request_id": req.id, "status": req.status}
+
 @router.post("/{req_id}/accept")
 def accept_request(
     req_id: int,
@@ -49,13 +107,13 @@ def accept_request(
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    if req.status not in ["new", "viewed"]:
+    # Conditional update: only one doctor can win a request that is still open
+    previous_claimer = req.claimed_by
+    if not assignment.mark_viewed(db, req_id, current_user):
         raise HTTPException(status_code=409, detail="Request already handled")
-
-    # Mark as viewed/accepted (doctor is viewing it)
-    req.status = "viewed"
-    req.doctor_id = current_user.id
+    changes.bump(db, "inbox", current_user.id, previous_claimer)
     db.commit()
+    db.refresh(req)
 
     return {
         "message": "Request viewed by doctor",
@@ -76,6 +134,9 @@ def reject_request(
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    req.status = "rejected"
+    # Conditional update: only the doctor holding or viewing an open request may reject it
+    if not assignment.reject(db, req, current_user):
+        raise HTTPException(status_code=409, detail="Request is not open or not assigned to you")
+    changes.bump(db, "inbox", current_user.id)
     db.commit()
     return {"message": "Request rejected"}
@@ -30,6 +30,7 @@ class PatientSignup(BaseModel):
     username: Optional[str] = None
     password: str
     email: Optional[EmailStr] = None
+    location: Optional[str] = None # City, default for the city of their requests
 
 class GmailSignup(BaseModel):
     name: str
@@ -42,12 +43,17 @@ class DoctorSignup(BaseModel):
     specialty: str
     location: str
     email: Optional[EmailStr] = None
+    directory_id: Optional[int] = None # doctors.id of this doctor's directory entry, if known
 
 # --- Requests ---
 class RequestCreate(BaseModel):
     symptom: str
     specialty: str
     answers: List[str]
+    # /triage inputs, raise the request's severity when present
+    chest_pain: bool = False
+    fever: bool = False
+    city: Optional[str] = None # Defaults to the patient's signup location
 
 class RequestResponse(BaseModel):
     id: int
@@ -57,6 +63,8 @@ class RequestResponse(BaseModel):
     created_at: datetime
     patient_name: str # Enriched field
     answers: List[str]
+    severity: int = 0
+    severity_level: Optional[str] = None
 
     class Config:
         from_attributes = True
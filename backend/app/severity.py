@@ -0,0 +1,45 @@
+"""
+Severity score for triage requests.
+
+Server-side port of calculateSeverity() in index.html, so the score that
+orders the request queue matches the level the patient was shown. The
+/triage chest-pain and fever flags add to the answer score when the client
+sends them along with the request.
+"""
+from typing import List, Optional
+
+# (question index, answer text, points) - keep in sync with calculateSeverity()
+ANSWER_WEIGHTS = [
+    (0, 'Chest / breathing / heart', 1),
+    (1, 'Sharp / stabbing', 2),
+    (2, 'Yes — high fever (>38°C)', 2),
+    (3, 'Yes — rash or visible lesion', 1),
+    (4, 'Yes — hearing loss / ear pain / voice change / difficulty swallowing', 1),
+    (5, 'Yes — severe or sudden', 3),
+    (6, 'Severe abdominal pain / vomiting / blood', 3),
+    (7, 'Yes — recent fracture/sprain/major injury', 2),
+    (8, 'Severe changes — suicidal thoughts / inability to function', 3),
+    (9, 'Yes / unsure', 1),
+]
+CHEST_PAIN_POINTS = 2
+FEVER_POINTS = 1
+
+# Minimum score for each level, highest first
+LEVELS = [(6, 'Critical'), (4, 'High'), (2, 'Moderate'), (0, 'Low')]
+
+
+def score(answers: Optional[List[str]], chest_pain: bool = False, fever: bool = False) -> int:
+    answers = answers or []
+    total = sum(points for i, answer, points in ANSWER_WEIGHTS if i < len(answers) and answers[i] == answer)
+    if chest_pain:
+        total += CHEST_PAIN_POINTS
+    if fever:
+        total += FEVER_POINTS
+    return total
+
+
+def level(value: int) -> str:
+    for minimum, name in LEVELS:
+        if value >= minimum:
+            return name
+    return LEVELS[-1][1]
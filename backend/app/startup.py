@@ -0,0 +1,76 @@
+"""
+Startup phase timing for both apps.
+
+Each app creates a StartupReport when its module starts importing, marks
+the end of the import, and times every lifespan step with phase():
+
+    startup_report = StartupReport("app")
+    ...
+    startup_report.imported()
+    ...
+    with startup_report.phase("schema"):
+        init_schema()
+    startup_report.finish()
+
+finish() logs one line per phase and the total; as_dict() is served by the
+admin endpoints (and recorded by benchmark_suite.py) so cold-start
+regressions show up per phase rather than as one opaque number.
+
+Create the schema once, e.g. from a deploy step, instead of at every
+worker start (then run the workers with AUTO_CREATE_SCHEMA=0):
+    python -m app.startup --init-schema
+"""
+import argparse
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    def __init__(self, name):
+        self.name = name
+        self._start = time.perf_counter()
+        self.phases = {}  # phase -> seconds, in the order they ran
+        self.ready = False
+
+    def imported(self):
+        """Record the time since construction as the 'import' phase."""
+        self.phases["import"] = time.perf_counter() - self._start
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def finish(self):
+        self.ready = True
+        breakdown = ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases.items())
+        logger.info("%s ready in %.1fms (%s)", self.name, self.total() * 1000, breakdown)
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "ready": self.ready,
+            "total_ms": round(self.total() * 1000, 3),
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="One-off startup tasks")
+    parser.add_argument("--init-schema", action="store_true", help="create missing tables and exit")
+    args = parser.parse_args()
+    if args.init_schema:
+        from .database import engine, init_schema
+        init_schema()
+        print(f"Schema ready on {engine.url.render_as_string(hide_password=True)}")
+    else:
+        parser.print_help()
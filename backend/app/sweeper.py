@@ -0,0 +1,168 @@
+"""
+Background sweeper that retires stale requests and finished appointments.
+
+Without it requests stay open and past appointments stay CONFIRMED forever,
+so every status-filtered query (inbox, claim queue, overlap check,
+calendars) scans a working set that only grows. Every SWEEPER_INTERVAL_SECONDS
+the sweeper:
+
+- expires requests still new/pending/claimed/viewed REQUEST_TTL_HOURS after
+  creation;
+- marks CONFIRMED appointments that ended APPOINTMENT_GRACE_MINUTES ago as
+  COMPLETED, and never-confirmed PENDING ones as EXPIRED;
+- optionally (ARCHIVE_AFTER_DAYS > 0) moves finished appointments older
+  than that into `appointments_archive`.
+
+All changes are UPDATE/DELETE ... WHERE id IN (<batch of ids>) statements
+of at most SWEEPER_BATCH_SIZE rows, each committed on its own, so no
+sweep holds long locks against the booking path. Running it in several
+workers at once is harmless: every statement re-checks its conditions.
+
+Run once by hand:
+    python -m app.sweeper
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from .database import engine as default_engine
+from .etag import changes
+from .models import Appointment, AppointmentArchive, TriageRequest
+
+logger = logging.getLogger(__name__)
+
+SWEEPER_INTERVAL_SECONDS = float(os.getenv("SWEEPER_INTERVAL_SECONDS", "300"))
+SWEEPER_BATCH_SIZE = int(os.getenv("SWEEPER_BATCH_SIZE", "1000"))
+REQUEST_TTL_HOURS = float(os.getenv("REQUEST_TTL_HOURS", "72"))
+APPOINTMENT_GRACE_MINUTES = float(os.getenv("APPOINTMENT_GRACE_MINUTES", "60"))
+ARCHIVE_AFTER_DAYS = float(os.getenv("ARCHIVE_AFTER_DAYS", "0"))
+
+OPEN_REQUEST_STATUSES = ("new", "pending", "claimed", "viewed")
+FINISHED_APPOINTMENT_STATUSES = ("COMPLETED", "EXPIRED", "CANCELLED")
+ARCHIVE_COLUMNS = [c.name for c in Appointment.__table__.columns]
+
+
+class Sweeper:
+    def __init__(self, engine=None, interval=SWEEPER_INTERVAL_SECONDS, batch_size=SWEEPER_BATCH_SIZE,
+                 request_ttl=timedelta(hours=REQUEST_TTL_HOURS),
+                 appointment_grace=timedelta(minutes=APPOINTMENT_GRACE_MINUTES),
+                 archive_after=timedelta(days=ARCHIVE_AFTER_DAYS) if ARCHIVE_AFTER_DAYS > 0 else None,
+                 clock=datetime.utcnow):
+        self.engine = engine or default_engine
+        self.interval = interval
+        self.batch_size = batch_size
+        self.request_ttl = request_ttl
+        self.appointment_grace = appointment_grace
+        self.archive_after = archive_after
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_run = None
+        self.totals = {"requests_expired": 0, "appointments_completed": 0,
+                       "appointments_expired": 0, "appointments_archived": 0}
+
+    def _update_in_batches(self, table, where, values):
+        """UPDATE `table` SET values for rows matching `where`, batch_size ids at a time."""
+        total = 0
+        while True:
+            with self.engine.begin() as conn:
+                ids = select(table.c.id).where(*where).limit(self.batch_size).scalar_subquery()
+                count = conn.execute(update(table).where(table.c.id.in_(ids), *where).values(**values)).rowcount
+            total += count
+            if count < self.batch_size:
+                return total
+
+    def expire_requests(self, now):
+        table = TriageRequest.__table__
+        return self._update_in_batches(
+            table,
+            [table.c.status.in_(OPEN_REQUEST_STATUSES), table.c.created_at < now - self.request_ttl],
+            {"status": "expired", "claimed_by": None, "lease_expires_at": None},
+        )
+
+    def finish_appointments(self, now):
+        table = Appointment.__table__
+        cutoff = now - self.appointment_grace
+        completed = self._update_in_batches(
+            table, [table.c.status == "CONFIRMED", table.c.end_time < cutoff], {"status": "COMPLETED"}
+        )
+        expired = self._update_in_batches(
+            table, [table.c.status == "PENDING", table.c.end_time < cutoff], {"status": "EXPIRED"}
+        )
+        return completed, expired
+
+    def archive_appointments(self, now):
+        """Move finished appointments that ended before the archive cutoff to appointments_archive."""
+        if not self.archive_after:
+            return 0
+        table = Appointment.__table__
+        archive = AppointmentArchive.__table__
+        where = [table.c.status.in_(FINISHED_APPOINTMENT_STATUSES), table.c.end_time < now - self.archive_after]
+        total = 0
+        while True:
+            with self.engine.begin() as conn:
+                ids = conn.execute(select(table.c.id).where(*where).order_by(table.c.id).limit(self.batch_size)).scalars().all()
+                if ids:
+                    rows = select(*[table.c[name] for name in ARCHIVE_COLUMNS]).where(table.c.id.in_(ids))
+                    conn.execute(insert(archive).from_select(ARCHIVE_COLUMNS, rows))
+                    conn.execute(delete(table).where(table.c.id.in_(ids)))
+            total += len(ids)
+            if len(ids) < self.batch_size:
+                return total
+
+    def run_once(self):
+        """One full sweep. Returns the number of rows changed per kind."""
+        now = self._clock()
+        start = time.perf_counter()
+        requests_expired = self.expire_requests(now)
+        completed, expired = self.finish_appointments(now)
+        archived = self.archive_appointments(now)
+        result = {
+            "requests_expired": requests_expired,
+            "appointments_completed": completed,
+            "appointments_expired": expired,
+            "appointments_archived": archived,
+        }
+        for key, value in result.items():
+            self.totals[key] += value
+        self.last_run = now
+        if any(result.values()):
+            # Statuses changed under every listing's feet
+            with Session(self.engine) as db:
+                changes.bump_all(db)
+                db.commit()
+            logger.info("Sweep finished in %.3fs: %s", time.perf_counter() - start, result)
+        return result
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Sweep failed")
+
+    def start(self):
+        """Start sweeping every `interval` seconds (interval <= 0 disables it)."""
+        if self.interval and self.interval > 0 and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sweeper", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+
+
+sweeper = Sweeper()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    print(sweeper.run_once())
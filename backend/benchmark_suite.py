@@ -0,0 +1,416 @@
+"""
+Offline microbenchmark and in-process load-test suite.
+
+Microbenchmarks the hot helpers of the triage API and drives a seeded,
+synthetic workload through both FastAPI apps (api:app and app.main:app)
+with the in-process TestClient, so no server, network or external
+service is needed. Results (p50/p95/p99 latency and throughput) are
+written as JSON and can be compared against a previous run.
+
+Run:
+    python benchmark_suite.py --out bench.json
+    python benchmark_suite.py --out new.json --compare bench.json
+
+Both apps run against throw-away SQLite databases in a temporary working
+directory; if triage_model.pkl has not been trained yet, a model is fitted
+on triage_dataset.csv for the run.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SPECIALTIES = ["Cardiology", "Dermatology", "Orthopedics", "Neurology", "ENT", "Psychiatry"]
+SYMPTOM_PHRASES = [
+    "severe chest pain while walking and shortness of breath",
+    "itchy red rash on arms",
+    "knee pain and swelling after a fall",
+    "throbbing headache with dizziness",
+    "sore throat and ear pain",
+    "feeling anxious and low mood for weeks",
+    "mild fever and body ache",
+    "back pain and stiffness in the morning",
+]
+
+
+# --- Statistics ---
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, elapsed=None, scale=1e6, unit="us"):
+    """Latency summary of a list of durations in seconds."""
+    values = sorted(samples)
+    total = elapsed if elapsed is not None else sum(values)
+    return {
+        "n": len(values),
+        f"p50_{unit}": round(percentile(values, 50) * scale, 3),
+        f"p95_{unit}": round(percentile(values, 95) * scale, 3),
+        f"p99_{unit}": round(percentile(values, 99) * scale, 3),
+        f"mean_{unit}": round(sum(values) / len(values) * scale, 3) if values else 0.0,
+        "throughput_per_sec": round(len(values) / total, 2) if total else 0.0,
+    }
+
+
+def time_calls(fn, args_list, repeat):
+    samples = []
+    for i in range(repeat):
+        args = args_list[i % len(args_list)]
+        start = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+# --- Environment ---
+
+def prepare_environment(workdir):
+    """
+    Point both apps at throw-away state before they are imported: api.py keeps
+    patients in ./medi_triage.db and loads ./triage_model.pkl, app.main reads
+    DATABASE_URL at import time.
+    """
+    model_src = os.path.join(BACKEND_DIR, "triage_model.pkl")
+    model_dst = os.path.join(workdir, "triage_model.pkl")
+    if os.path.exists(model_src):
+        shutil.copy(model_src, model_dst)
+    else:
+        import joblib
+        import pandas as pd
+        from triage_pipeline import build_pipeline, prepare_training_frame
+        X, y = prepare_training_frame(pd.read_csv(os.path.join(BACKEND_DIR, "triage_dataset.csv")))
+        model = build_pipeline("tfidf")
+        model.fit(X, y)
+        joblib.dump(model, model_dst)
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench_app.db')}"
+    os.chdir(workdir)
+
+
+def random_answers(rng):
+    return {f"q{i}": rng.choice("abc") for i in range(1, 11)}
+
+
+def random_location(rng):
+    # Around the cities used by generate_doctors.py
+    lat, lng = rng.choice([(12.97, 77.59), (19.07, 72.87), (28.70, 77.10), (22.57, 88.36), (13.08, 80.27)])
+    return {"lat": lat + rng.uniform(-0.05, 0.05), "lng": lng + rng.uniform(-0.05, 0.05)}
+
+
+def triage_payload(rng):
+    return {
+        "symptoms_text": rng.choice(SYMPTOM_PHRASES),
+        "age": rng.randint(5, 85),
+        "fever": rng.random() < 0.3,
+        "chest_pain": rng.random() < 0.2,
+        "duration_days": rng.randint(0, 14),
+    }
+
+
+# --- Microbenchmarks ---
+
+def run_micro(api_module, rng, repeat):
+    from rules_engine import combine_ml_and_rules
+    from triage_pipeline import make_feature_frame
+
+    results = {}
+
+    answers = [(random_answers(rng),) for _ in range(64)]
+    results["map_answers_to_specialties"] = summarize(
+        time_calls(api_module.map_answers_to_specialties, answers, repeat))
+
+    rules_args = [(rng.choice(SPECIALTIES), rng.random(), rng.choice(SYMPTOM_PHRASES)) for _ in range(64)]
+    results["combine_ml_and_rules"] = summarize(time_calls(combine_ml_and_rules, rules_args, repeat))
+
+    lookup_args = []
+    for _ in range(32):
+        loc = random_location(rng)
+        lookup_args.append((rng.sample(SPECIALTIES, 2), loc["lat"], loc["lng"]))
+    results["get_doctors_for_specialties"] = summarize(
+        time_calls(api_module.get_doctors_for_specialties, lookup_args, max(1, repeat // 10)))
+
+    results.update(run_serialization(api_module, rng, repeat))
+
+    if api_module.model is not None:
+        frames = []
+        for _ in range(32):
+            p = triage_payload(rng)
+            frames.append((make_feature_frame(p["symptoms_text"], p["age"], p["fever"],
+                                              p["chest_pain"], p["duration_days"]),))
+        results["predict_proba"] = summarize(
+            time_calls(api_module.model.predict_proba, frames, max(1, repeat // 10)))
+
+    return results
+
+
+def run_serialization(api_module, rng, repeat):
+    """Before/after cost of rendering recommendation payloads: stdlib json vs orjson, plus gzip."""
+    import gzip
+    from app import compression, responses
+
+    payloads = []
+    for _ in range(16):
+        loc = random_location(rng)
+        payloads.append((api_module.build_recommendations(random_answers(rng), loc["lat"], loc["lng"]),))
+    n = max(1, repeat // 4)
+
+    results = {"json_render_stdlib": summarize(time_calls(responses.dumps_stdlib, payloads, n))}
+    if responses.orjson is not None:
+        results["json_render_orjson"] = summarize(time_calls(responses.dumps_orjson, payloads, n))
+
+    bodies = [(responses.dumps(p),) for (p,) in payloads]
+    results["gzip_compress"] = summarize(time_calls(
+        lambda body: gzip.compress(body, compresslevel=compression.GZIP_LEVEL), bodies, n))
+    raw = sum(len(b) for (b,) in bodies)
+    packed = sum(len(gzip.compress(b, compresslevel=compression.GZIP_LEVEL)) for (b,) in bodies)
+    results["recommendation_payload"] = {
+        "renderer": responses.JSON_RENDERER,
+        "mean_bytes": raw // len(bodies),
+        "mean_gzip_bytes": packed // len(bodies),
+    }
+    return results
+
+
+# --- Load ---
+
+class LoadRecorder:
+    def __init__(self):
+        self.samples = {}
+        self.statuses = {}
+
+    def call(self, op, fn, *args, **kwargs):
+        start = time.perf_counter()
+        response = fn(*args, **kwargs)
+        self.samples.setdefault(op, []).append(time.perf_counter() - start)
+        codes = self.statuses.setdefault(op, {})
+        codes[str(response.status_code)] = codes.get(str(response.status_code), 0) + 1
+        return response
+
+    def report(self, elapsed):
+        ops = {}
+        for op, samples in self.samples.items():
+            ops[op] = summarize(samples, scale=1e3, unit="ms")
+            ops[op]["status_codes"] = self.statuses[op]
+        total = sum(len(s) for s in self.samples.values())
+        return {"operations": ops, "requests": total, "elapsed_s": round(elapsed, 3),
+                "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0}
+
+
+def run_load_api(client, rng, n_requests, concurrency):
+    """Legacy api:app: patient signup, triage and symptom recommendations."""
+    recorder = LoadRecorder()
+    start = time.perf_counter()
+
+    n_signups = max(1, n_requests // 20)
+    for i in range(n_signups):
+        recorder.call("patient_signup", client.post, "/api/patients/signup", json={
+            "full_name": f"Bench Patient {i}", "username": f"bench_patient_{i}", "password": "bench-pass"})
+
+    ops = []
+    for _ in range(n_requests):
+        if rng.random() < 0.5:
+            ops.append(("triage", "/triage", triage_payload(rng)))
+        else:
+            ops.append(("recommendations", "/api/symptom-recommendations",
+                        {"answers": random_answers(rng), "patientLocation": random_location(rng)}))
+
+    def issue(op):
+        name, path, body = op
+        recorder.call(name, client.post, path, json=body)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(issue, ops))
+
+    return recorder.report(time.perf_counter() - start)
+
+
+def run_load_app(client, rng, n_requests, concurrency):
+    """app.main:app: signups, request creation, inbox polls and bookings."""
+    from app import database, models
+
+    recorder = LoadRecorder()
+    start = time.perf_counter()
+
+    n_doctors = max(1, n_requests // 50)
+    n_patients = max(1, n_requests // 25)
+    doctors, patients = [], []
+    for i in range(n_doctors):
+        r = recorder.call("doctor_signup", client.post, "/api/doctors/signup", json={
+            "name": f"Bench Doctor {i}", "username": f"bench_doctor_{i}", "password": "bench-pass",
+            "specialty": SPECIALTIES[i % len(SPECIALTIES)], "location": "Bengaluru"})
+        body = r.json()
+        doctors.append({"id": body["user"]["id"], "specialty": body["user"]["specialty"],
+                        "headers": {"Authorization": f"Bearer {body['access_token']}"}, "slot": 0})
+    for i in range(n_patients):
+        r = recorder.call("patient_signup", client.post, "/api/patients/signup", json={
+            "name": f"Bench Patient {i}", "username": f"bench_patient_{i}", "password": "bench-pass"})
+        body = r.json()
+        patients.append({"id": body["user"]["id"], "headers": {"Authorization": f"Bearer {body['access_token']}"}})
+
+    # Booking targets are seeded directly so every booking gets its own
+    # request, already viewed by the doctor who books it (booking requires a
+    # claim or view), independent of the requests created during the run.
+    db = database.SessionLocal()
+    bookable = []
+    for _ in range(max(1, n_requests // 10)):
+        doctor = rng.choice(doctors)
+        req = models.TriageRequest(patient_id=rng.choice(patients)["id"], symptom="bench",
+                                   specialty=doctor["specialty"], answers_json=[], status="viewed",
+                                   doctor_id=doctor["id"], claimed_by=doctor["id"])
+        db.add(req)
+        db.flush()
+        bookable.append((req.id, doctor))
+    db.commit()
+    db.close()
+
+    slot_base = datetime.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    ops = []
+    for _ in range(n_requests):
+        roll = rng.random()
+        if roll < 0.4:
+            patient = rng.choice(patients)
+            ops.append(("create_request", patient, rng.choice(SPECIALTIES)))
+        elif roll < 0.9 or not bookable:
+            ops.append(("inbox_poll", rng.choice(doctors), None))
+        else:
+            request_id, doctor = bookable.pop()
+            slot = slot_base + timedelta(minutes=30 * doctor["slot"])
+            doctor["slot"] += 1
+            ops.append(("book_appointment", doctor, (request_id, rng.choice(patients)["id"], slot)))
+
+    def issue(op):
+        name, actor, extra = op
+        if name == "create_request":
+            recorder.call(name, client.post, "/api/requests", headers=actor["headers"], json={
+                "symptom": rng.choice(SYMPTOM_PHRASES), "specialty": extra, "answers": ["a"] * 10})
+        elif name == "inbox_poll":
+            recorder.call(name, client.get, "/api/doctors/me/requests", headers=actor["headers"])
+        else:
+            request_id, patient_id, slot = extra
+            recorder.call(name, client.post, "/api/appointments/book", headers=actor["headers"], json={
+                "requestId": str(request_id), "doctorId": str(actor["id"]), "patientId": str(patient_id),
+                "startTime": slot.isoformat(), "endTime": (slot + timedelta(minutes=30)).isoformat()})
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(issue, ops))
+
+    return recorder.report(time.perf_counter() - start)
+
+
+# --- Comparison ---
+
+def compare(current, baseline, threshold):
+    """Print p50/p95 changes against a previous results file; returns regressions."""
+    regressions = []
+
+    def walk(section, cur, base, keys):
+        for name, stats in cur.items():
+            if name not in base:
+                continue
+            for key in keys:
+                if key not in stats or not base[name].get(key):
+                    continue
+                change = (stats[key] - base[name][key]) / base[name][key] * 100
+                flag = "  REGRESSION" if change > threshold else ""
+                print(f"{section:>6} {name:<32} {key:<8} {base[name][key]:>12} -> {stats[key]:>12} ({change:+.1f}%){flag}")
+                if flag:
+                    regressions.append(f"{section}.{name}.{key}")
+
+    walk("micro", current.get("micro", {}), baseline.get("micro", {}), ("p50_us", "p95_us"))
+    for app_name in ("api", "app"):
+        walk(app_name, current.get("load", {}).get(app_name, {}).get("operations", {}),
+             baseline.get("load", {}).get(app_name, {}).get("operations", {}), ("p50_ms", "p95_ms"))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for the triage APIs")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=2000, help="iterations per microbenchmark")
+    parser.add_argument("--requests", type=int, default=500, help="requests per app in the load phase")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--compare", default=None, help="previous results JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="%% slowdown reported as a regression")
+    args = parser.parse_args()
+
+    out_path = os.path.abspath(args.out)
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+
+    workdir = tempfile.mkdtemp(prefix="medi-triage-bench-")
+    sys.path.insert(0, BACKEND_DIR)
+    prepare_environment(workdir)
+
+    from fastapi.testclient import TestClient
+    import api
+    from app import main as app_main
+    main_app = app_main.app
+
+    # One lifespan per app: records the cold-start breakdown and loads the
+    # triage model the microbenchmarks call directly
+    print("Starting both apps...")
+    with TestClient(api.app), TestClient(main_app):
+        pass
+
+    results = {
+        "meta": {
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "model_version": api.model_version,
+        },
+        "startup": {"api": api.startup_report.as_dict(), "app": app_main.startup_report.as_dict()},
+    }
+
+    try:
+        if not args.skip_micro:
+            print("Running microbenchmarks...")
+            results["micro"] = run_micro(api, random.Random(args.seed), args.repeat)
+
+        if not args.skip_load:
+            print("Running load against api:app...")
+            with TestClient(api.app) as client:
+                api_load = run_load_api(client, random.Random(args.seed), args.requests, args.concurrency)
+            print("Running load against app.main:app...")
+            with TestClient(main_app) as client:
+                app_load = run_load_app(client, random.Random(args.seed), args.requests, args.concurrency)
+            results["load"] = {"api": api_load, "app": app_load}
+    finally:
+        os.chdir(BACKEND_DIR)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved as '{out_path}'")
+
+    if compare_path:
+        with open(compare_path) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
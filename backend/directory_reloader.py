@@ -0,0 +1,142 @@
+"""
+Background reload of the doctor directory.
+
+A daemon thread polls doctors.json (and the compiled store next to it) and,
+when either changes, builds a new DoctorStore off the request path and
+swaps it in with a single reference assignment. Requests keep using the
+snapshot they already hold until the swap; a failed load keeps the old one.
+
+A change is detected from (mtime, size) first and confirmed with a content
+hash, so touching the file or re-copying identical data does not rebuild.
+"""
+import logging
+import os
+import threading
+import time
+
+from doctor_store import DoctorStore, file_digest, load_doctor_store
+
+logger = logging.getLogger(__name__)
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DirectoryReloader:
+    def __init__(self, json_path, store_path=None, interval=5.0, loader=load_doctor_store):
+        self.json_path = json_path
+        self.store_path = store_path
+        self.interval = interval
+        self.loader = loader
+        self.store = None
+        self.loaded_at = None
+        self.load_seconds = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_error = None
+        self._fingerprint = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def version(self):
+        return self.store.version if self.store is not None else None
+
+    def add_listener(self, callback):
+        """Call `callback(store)` after every swap, e.g. to drop derived caches."""
+        self._listeners.append(callback)
+
+    def current(self) -> DoctorStore:
+        """The live snapshot, loading it synchronously if nothing is loaded yet."""
+        store = self.store
+        if store is None:
+            self.check()
+            store = self.store if self.store is not None else DoctorStore.empty()
+        return store
+
+    def _current_fingerprint(self):
+        return _stat(self.json_path), _stat(self.store_path)
+
+    def check(self, force=False):
+        """Reload if the files changed. Returns True when a new snapshot was swapped in."""
+        with self._lock:
+            fingerprint = self._current_fingerprint()
+            if not force and self._fingerprint is not None and fingerprint == self._fingerprint:
+                return False
+
+            json_changed = self._fingerprint is None or fingerprint[0] != self._fingerprint[0]
+            store_changed = self._fingerprint is None or fingerprint[1] != self._fingerprint[1]
+            if not force and self.store is not None and json_changed and not store_changed \
+                    and fingerprint[0] is not None and file_digest(self.json_path) == self.version:
+                # Same content, new mtime
+                self._fingerprint = fingerprint
+                return False
+
+            start = time.perf_counter()
+            try:
+                store = self.loader(self.json_path, self.store_path)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                # Remember the broken files so they are not re-read every poll
+                self._fingerprint = fingerprint
+                logger.exception("Doctor directory reload failed; keeping version %s", self.version)
+                return False
+
+            self.store = store
+            self._fingerprint = fingerprint
+            self.load_seconds = time.perf_counter() - start
+            self.loaded_at = time.time()
+            self.reloads += 1
+            self.last_error = None
+            logger.info("Loaded doctor directory %s (%d doctors) in %.3fs",
+                        store.version, len(store), self.load_seconds)
+
+        for callback in self._listeners:
+            try:
+                callback(store)
+            except Exception:
+                logger.exception("Doctor directory reload listener failed")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Doctor directory watcher error")
+
+    def start(self):
+        """Load the directory now and, if interval > 0, start polling for changes."""
+        self.check()
+        if self.interval and self.interval > 0 and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="doctor-directory-reloader", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def stats(self):
+        store = self.store
+        return {
+            "version": self.version,
+            "doctors": len(store) if store is not None else 0,
+            "loaded_at": self.loaded_at,
+            "load_seconds": self.load_seconds,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "watching": self._thread is not None,
+            "interval_seconds": self.interval,
+        }
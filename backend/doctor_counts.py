@@ -0,0 +1,99 @@
+"""
+Server-side available-doctor counts per specialty (and per city).
+
+Counts come from three sources that are kept separately so each can be
+refreshed without touching the others:
+
+- the doctor directory, recounted from the store's specialty/city code
+  columns whenever a new snapshot is swapped in;
+- doctors who signed up through this API (api.py), counted incrementally;
+- doctor accounts of the app database (app.main's /api/doctors/signup)
+  that are not linked to a directory entry, recounted periodically with
+  reset_accounts(). Linked accounts are already in the directory counts.
+
+Lookups are case-insensitive and cost one dict access.
+"""
+import threading
+from collections import Counter
+
+import numpy as np
+
+
+def _key(value):
+    return (value or "").strip().lower()
+
+
+class DoctorCounts:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._directory = Counter()  # (specialty, city) and (specialty, None) -> count
+        self._signups = Counter()
+        self._accounts = Counter()
+        self._names = {}  # lowercased specialty -> display name
+        self.directory_version = None
+
+    def rebuild_directory(self, store):
+        """Recount the directory snapshot. Used as a DirectoryReloader listener."""
+        counts = Counter()
+        if len(store):
+            pairs = store.records["specialty"].astype(np.int64) * len(store.cities) + store.records["city"]
+            for pair, n in zip(*np.unique(pairs, return_counts=True)):
+                specialty, city = divmod(int(pair), len(store.cities))
+                name = store.specialties[specialty]
+                specialty, city = _key(name), _key(store.cities[city])
+                self._names.setdefault(specialty, name)
+                counts[(specialty, city)] += int(n)
+                counts[(specialty, None)] += int(n)
+        with self._lock:
+            self._directory = counts
+            self.directory_version = store.version
+
+    def add_doctor(self, specialty, city=None):
+        """Count one newly registered doctor."""
+        name, specialty = specialty, _key(specialty)
+        with self._lock:
+            self._names.setdefault(specialty, name)
+            self._signups[(specialty, None)] += 1
+            if city:
+                self._signups[(specialty, _key(city))] += 1
+
+    def reset_signups(self, users):
+        """Recount registered doctors from a list of user dicts."""
+        counts = Counter()
+        for user in users:
+            if user.get("role") != "doctor":
+                continue
+            specialty = _key(user.get("specialty"))
+            self._names.setdefault(specialty, user.get("specialty"))
+            counts[(specialty, None)] += 1
+            if user.get("location"):
+                counts[(specialty, _key(user["location"]))] += 1
+        with self._lock:
+            self._signups = counts
+
+    def reset_accounts(self, rows):
+        """Replace the app-database account counts with (specialty, city, count) rows."""
+        counts = Counter()
+        for specialty, city, n in rows:
+            if not specialty:
+                continue
+            name, specialty = specialty, _key(specialty)
+            self._names.setdefault(specialty, name)
+            counts[(specialty, None)] += n
+            if city:
+                counts[(specialty, _key(city))] += n
+        with self._lock:
+            self._accounts = counts
+
+    def count(self, specialty, city=None) -> int:
+        key = (_key(specialty), _key(city) if city else None)
+        return self._directory.get(key, 0) + self._signups.get(key, 0) + self._accounts.get(key, 0)
+
+    def by_specialty(self, city=None) -> dict:
+        """{specialty: count} for every specialty with at least one doctor."""
+        city = _key(city) if city else None
+        with self._lock:
+            merged = Counter({k: v for k, v in self._directory.items() if k[1] == city})
+            merged.update({k: v for k, v in self._signups.items() if k[1] == city})
+            merged.update({k: v for k, v in self._accounts.items() if k[1] == city})
+        return {self._names.get(specialty) or specialty: n for (specialty, _), n in sorted(merged.items()) if n}
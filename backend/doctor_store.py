@@ -0,0 +1,300 @@
+"""
+Compact columnar doctor directory.
+
+doctors.json is compiled once into a single binary file that the API opens
+with a memory map instead of parsing JSON:
+
+    magic (8 bytes) | header length (uint32) | JSON header
+    records   - NumPy structured array: lat/lng (float64), specialty/city
+                codes (uint16) and string-table ids for the text fields
+    offsets   - uint64 start offset of every interned string (+ end sentinel)
+    strings   - UTF-8 blob of the interned strings
+
+Each doctor costs 48 bytes in the records array, repeated strings (cities,
+clinic names, states) are stored once, and worker processes opening the
+same file share its pages through the OS page cache.
+
+Build:
+    python doctor_store.py doctors.json doctors.mtds
+"""
+import gzip
+import hashlib
+import json
+import math
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"MTDS\x00\x01\x00\x00"
+EARTH_RADIUS_KM = 6371
+
+# Free-text fields kept in the interned string table
+STRING_FIELDS = ("name", "clinic", "address", "state", "pincode", "phone", "google_place_id")
+
+RECORD_DTYPE = np.dtype([
+    ("lat", "<f8"),
+    ("lng", "<f8"),
+    ("specialty", "<u2"),
+    ("city", "<u2"),
+] + [(field, "<u4") for field in STRING_FIELDS])
+
+
+def iter_records(path):
+    """Doctor dicts from a JSON array, NDJSON or gzipped NDJSON file."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        if ".ndjson" in path or ".jsonl" in path:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def file_digest(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:12]
+
+
+class _Interner:
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def __call__(self, value):
+        value = "" if value is None else str(value)
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.ids[value] = idx
+            self.values.append(value)
+        return idx
+
+
+def build_arrays(records):
+    """Compile doctor dicts into (records, offsets, blob, specialties, cities)."""
+    strings = _Interner()
+    specialties = _Interner()
+    cities = _Interner()
+    rows = []
+    for doc in records:
+        lat = doc.get("lat")
+        lng = doc.get("lng")
+        rows.append((
+            float("nan") if lat is None else float(lat),
+            float("nan") if lng is None else float(lng),
+            specialties(doc.get("specialty", "")),
+            cities(doc.get("city", "")),
+        ) + tuple(strings(doc.get(field)) for field in STRING_FIELDS))
+
+    if len(specialties.values) > 0xFFFF or len(cities.values) > 0xFFFF:
+        raise ValueError("Too many distinct specialties or cities for 16-bit codes")
+
+    records_arr = np.array(rows, dtype=RECORD_DTYPE)
+    encoded = [s.encode("utf-8") for s in strings.values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return records_arr, offsets, blob, specialties.values, cities.values
+
+
+def _align(n, to=8):
+    return (n + to - 1) // to * to
+
+
+def write_store(path, records_arr, offsets, blob, specialties, cities, source_version=None):
+    """Write the arrays to `path` atomically (temp file + rename)."""
+    header = {
+        "count": int(len(records_arr)),
+        "dtype": RECORD_DTYPE.descr,
+        "specialties": specialties,
+        "cities": cities,
+        "string_count": int(len(offsets) - 1),
+        "source_version": source_version,
+    }
+    # Offsets depend on the header size, so lay the header out with placeholders first
+    header.update(records_offset=0, offsets_offset=0, strings_offset=0)
+    header_bytes = json.dumps(header).encode("utf-8") + b" " * 64
+    records_offset = _align(len(MAGIC) + 4 + len(header_bytes))
+    offsets_offset = _align(records_offset + records_arr.nbytes)
+    strings_offset = offsets_offset + offsets.nbytes
+    header.update(records_offset=records_offset, offsets_offset=offsets_offset, strings_offset=strings_offset)
+    final = json.dumps(header).encode("utf-8")
+    header_bytes = final + b" " * (len(header_bytes) - len(final))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\x00" * (records_offset - f.tell()))
+        f.write(records_arr.tobytes())
+        f.write(b"\x00" * (offsets_offset - f.tell()))
+        f.write(offsets.tobytes())
+        f.write(blob.tobytes())
+    os.replace(tmp_path, path)
+
+
+def build_store(source_path, store_path):
+    """Compile a doctors.json / NDJSON file into a store file. Returns the doctor count."""
+    arrays = build_arrays(iter_records(source_path))
+    write_store(store_path, *arrays, source_version=file_digest(source_path))
+    return len(arrays[0])
+
+
+def haversine_km(lat, lng, lats, lngs):
+    """Vectorised form of api.haversine_distance."""
+    lat1, lng1 = math.radians(lat), math.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+class DoctorStore:
+    def __init__(self, records, offsets, blob, specialties, cities, version=None):
+        self.records = records
+        self.offsets = offsets
+        self.blob = blob
+        self.specialties = list(specialties)
+        self.cities = list(cities)
+        self.version = version
+        self._specialty_codes = {}
+        for code, name in enumerate(self.specialties):
+            self._specialty_codes.setdefault(name.lower(), code)
+        self._by_specialty = {}
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a store file written by write_store."""
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a doctor store file")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len))
+        count = header["count"]
+        dtype = np.dtype([tuple(field) for field in header["dtype"]])
+        records = np.memmap(path, dtype=dtype, mode="r", offset=header["records_offset"], shape=(count,)) \
+            if count else np.zeros(0, dtype=dtype)
+        offsets = np.memmap(path, dtype="<u8", mode="r", offset=header["offsets_offset"],
+                            shape=(header["string_count"] + 1,))
+        size = int(offsets[-1])
+        blob = np.memmap(path, dtype=np.uint8, mode="r", offset=header["strings_offset"], shape=(size,)) \
+            if size else np.zeros(0, dtype=np.uint8)
+        return cls(records, offsets, blob, header["specialties"], header["cities"], header.get("source_version"))
+
+    @classmethod
+    def from_json(cls, path):
+        """Build the store in memory straight from doctors.json (no store file needed)."""
+        records, offsets, blob, specialties, cities = build_arrays(iter_records(path))
+        return cls(records, offsets, blob, specialties, cities, file_digest(path))
+
+    @classmethod
+    def empty(cls):
+        return cls(np.zeros(0, dtype=RECORD_DTYPE), np.zeros(1, dtype="<u8"), np.zeros(0, dtype=np.uint8), [], [])
+
+    def __len__(self):
+        return len(self.records)
+
+    def string(self, idx):
+        start, end = int(self.offsets[idx]), int(self.offsets[idx + 1])
+        return bytes(self.blob[start:end]).decode("utf-8")
+
+    def indices_for_specialty(self, specialty):
+        """Indices of doctors with this specialty (case-insensitive), in directory order."""
+        code = self._specialty_codes.get(specialty.lower())
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        idx = self._by_specialty.get(code)
+        if idx is None:
+            idx = np.flatnonzero(self.records["specialty"] == code)
+            self._by_specialty[code] = idx
+        return idx
+
+    def nearest(self, indices, lat, lng, limit):
+        """
+        The `limit` closest of `indices` to (lat, lng) as (indices, distances_km).
+        Ties keep directory order and doctors without coordinates sort last,
+        matching a stable sort on distance_km.
+        """
+        rows = self.records[indices]
+        dist = haversine_km(lat, lng, rows["lat"], rows["lng"])
+        dist = np.where(np.isnan(dist), np.inf, dist)
+        if len(dist) > limit:
+            kth = np.partition(dist, limit - 1)[limit - 1]
+            keep = np.flatnonzero(dist <= kth)
+        else:
+            keep = np.arange(len(dist))
+        order = keep[np.lexsort((keep, dist[keep]))][:limit]
+        return indices[order], dist[order]
+
+    def candidates_near(self, indices, min_lat, min_lng, max_lat, max_lng, limit):
+        """
+        The subset of `indices` (in their order) that can be among the `limit`
+        nearest to any point of the box. Every point lies within `radius` of
+        the centre, so a doctor further than kth + 2 * radius from the centre
+        (kth: the centre's limit-th smallest distance) never makes the cut;
+        nearest() over the subset then ranks exactly like over all `indices`.
+        """
+        if len(indices) <= limit:
+            return indices
+        lat, lng = (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+        radius = float(haversine_km(lat, lng, np.array([min_lat, min_lat, max_lat, max_lat]),
+                                    np.array([min_lng, max_lng, min_lng, max_lng])).max())
+        rows = self.records[indices]
+        dist = haversine_km(lat, lng, rows["lat"], rows["lng"])
+        dist = np.where(np.isnan(dist), np.inf, dist)
+        kth = np.partition(dist, limit - 1)[limit - 1]
+        return indices[dist <= kth + 2 * radius + 1e-9]
+
+    def doctor(self, idx):
+        """Materialise one doctor as the dict shape of a doctors.json entry."""
+        row = self.records[idx]
+        doc = {
+            "name": self.string(row["name"]),
+            "specialty": self.specialties[row["specialty"]],
+            "clinic": self.string(row["clinic"]),
+            "address": self.string(row["address"]),
+            "city": self.cities[row["city"]],
+            "state": self.string(row["state"]),
+            "pincode": self.string(row["pincode"]),
+            "phone": self.string(row["phone"]),
+        }
+        if not math.isnan(row["lat"]) and not math.isnan(row["lng"]):
+            doc["lat"] = float(row["lat"])
+            doc["lng"] = float(row["lng"])
+        place_id = self.string(row["google_place_id"])
+        if place_id:
+            doc["google_place_id"] = place_id
+        return doc
+
+
+def load_doctor_store(json_path, store_path=None):
+    """
+    Open the compiled store when it is at least as new as doctors.json,
+    otherwise compile doctors.json in memory. Missing data -> empty store.
+    """
+    if store_path and os.path.exists(store_path):
+        if not os.path.exists(json_path) or os.path.getmtime(store_path) >= os.path.getmtime(json_path):
+            return DoctorStore.open(store_path)
+    if os.path.exists(json_path):
+        return DoctorStore.from_json(json_path)
+    return DoctorStore.empty()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Compile the doctor directory into a memory-mappable store")
+    parser.add_argument("source", help="doctors.json, .ndjson or .ndjson.gz")
+    parser.add_argument("store", help="output file, e.g. doctors.mtds")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = build_store(args.source, args.store)
+    print(f"Compiled {count} doctors into '{args.store}' "
+          f"({os.path.getsize(args.store)} bytes) in {time.perf_counter() - start:.2f}s")
@@ -1,496 +0,0 @@
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Ghosh', 'Cardiology', 'Ghosh Health Clinic', '165 Delhi Main Road', 'Delhi', 'India', 412437, '+91-6049905238', 28.723083849248376, 77.11890236059368);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Kulkarni', 'Cardiology', 'Kulkarni Health Clinic', '16 Mumbai Main Road', 'Mumbai', 'India', 760672, '+91-6103641103', 19.070838915924448, 72.88507116738158);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Mehta', 'Cardiology', 'Mehta Health Clinic', '48 Mumbai Main Road', 'Mumbai', 'India', 828542, '+91-6745132364', 19.066555277331073, 72.89761228095426);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Kulkarni', 'Cardiology', 'Kulkarni Health Clinic', '116 Lucknow Main Road', 'Lucknow', 'India', 359948, '+91-7524974736', 26.84353278099237, 80.93800091661076);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Shah', 'Cardiology', 'Shah Health Clinic', '119 Kolkata Main Road', 'Kolkata', 'India', 879653, '+91-7378681951', 22.573693137012018, 88.37913826250103);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Mehta', 'Cardiology', 'Mehta Health Clinic', '89 Lucknow Main Road', 'Lucknow', 'India', 714923, '+91-7837483582', 26.854575757011737, 80.9568653109749);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Das', 'Cardiology', 'Das Health Clinic', '16 Pune Main Road', 'Pune', 'India', 271688, '+91-9811733608', 18.507758643975944, 73.87069246770274);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Verma', 'Cardiology', 'Verma Health Clinic', '160 Chennai Main Road', 'Chennai', 'India', 996303, '+91-8907497604', 13.070938179195956, 80.28030365498745);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Mehta', 'Cardiology', 'Mehta Health Clinic', '96 Lucknow Main Road', 'Lucknow', 'India', 542083, '+91-7645465160', 26.86501709667587, 80.95075543565282);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Das', 'Cardiology', 'Das Health Clinic', '148 Hyderabad Main Road', 'Hyderabad', 'India', 599267, '+91-6587898179', 17.366092130079142, 78.50295851166881);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Verma', 'Cardiology', 'Verma Health Clinic', '26 Jaipur Main Road', 'Jaipur', 'India', 323287, '+91-6846108984', 26.9100237579339, 75.7940958415558);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Kulkarni', 'Cardiology', 'Kulkarni Health Clinic', '128 Delhi Main Road', 'Delhi', 'India', 238995, '+91-8016833582', 28.723791304691474, 77.10675739635857);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Kulkarni', 'Cardiology', 'Kulkarni Health Clinic', '109 Mumbai Main Road', 'Mumbai', 'India', 692808, '+91-9361954722', 19.08735320337805, 72.86554970064857);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Krishnan', 'Cardiology', 'Krishnan Health Clinic', '109 Pune Main Road', 'Pune', 'India', 601217, '+91-6584208289', 18.52389393533174, 73.84779582407295);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Rao', 'Cardiology', 'Rao Health Clinic', '86 Hyderabad Main Road', 'Hyderabad', 'India', 520193, '+91-8441564310', 17.39784833046144, 78.4920832298909);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Khan', 'Cardiology', 'Khan Health Clinic', '89 Bengaluru Main Road', 'Bengaluru', 'India', 143492, '+91-9654660144', 12.958778276982871, 77.58733673905812);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Mehta', 'Cardiology', 'Mehta Health Clinic', '83 Ahmedabad Main Road', 'Ahmedabad', 'India', 137269, '+91-8770076583', 23.030183214564197, 72.55587186723281);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Rao', 'Cardiology', 'Rao Health Clinic', '36 Bengaluru Main Road', 'Bengaluru', 'India', 640774, '+91-6423023223', 12.983126732675087, 77.60768388953193);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Banerjee', 'Cardiology', 'Banerjee Health Clinic', '146 Lucknow Main Road', 'Lucknow', 'India', 840629, '+91-8030020443', 26.850965020747577, 80.94684519894382);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Patel', 'Cardiology', 'Patel Health Clinic', '159 Delhi Main Road', 'Delhi', 'India', 769060, '+91-6122593041', 28.717704881232976, 77.11509639033422);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Shah', 'Cardiology', 'Shah Health Clinic', '23 Mumbai Main Road', 'Mumbai', 'India', 282451, '+91-9324664639', 19.05879495041173, 72.85895160273064);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Krishnan', 'Cardiology', 'Krishnan Health Clinic', '96 Mumbai Main Road', 'Mumbai', 'India', 570001, '+91-9933448909', 19.06443324160772, 72.86035797637983);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Ghosh', 'Cardiology', 'Ghosh Health Clinic', '70 Jaipur Main Road', 'Jaipur', 'India', 119448, '+91-8405958658', 26.90469040580963, 75.78782912890956);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Mehta', 'Cardiology', 'Mehta Health Clinic', '52 Hyderabad Main Road', 'Hyderabad', 'India', 911989, '+91-7565718080', 17.392501774510215, 78.48302074523866);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Reddy', 'Cardiology', 'Reddy Health Clinic', '155 Kolkata Main Road', 'Kolkata', 'India', 578402, '+91-7803228917', 22.586752496707792, 88.35014444655003);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Singh', 'Cardiology', 'Singh Health Clinic', '81 Lucknow Main Road', 'Lucknow', 'India', 238553, '+91-6698729274', 26.841234988671395, 80.94335479273053);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Reddy', 'Cardiology', 'Reddy Health Clinic', '135 Delhi Main Road', 'Delhi', 'India', 784455, '+91-9351388320', 28.68911189905644, 77.09248875574346);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Singh', 'Cardiology', 'Singh Health Clinic', '76 Chennai Main Road', 'Chennai', 'India', 163693, '+91-6988085281', 13.095053046867577, 80.28089975801677);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Chakraborty', 'Cardiology', 'Chakraborty Health Clinic', '136 Chennai Main Road', 'Chennai', 'India', 819746, '+91-8303393068', 13.100014346718169, 80.2772097440204);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Das', 'Cardiology', 'Das Health Clinic', '191 Jaipur Main Road', 'Jaipur', 'India', 288539, '+91-9752311830', 26.916910317794798, 75.79837610663353);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Ghosh', 'Cardiology', 'Ghosh Health Clinic', '27 Chennai Main Road', 'Chennai', 'India', 370840, '+91-7667838583', 13.080294870011029, 80.2656377698352);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Ghosh', 'Cardiology', 'Ghosh Health Clinic', '187 Hyderabad Main Road', 'Hyderabad', 'India', 395454, '+91-6524151265', 17.38229554204379, 78.49276412878434);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Sengupta', 'Cardiology', 'Sengupta Health Clinic', '60 Pune Main Road', 'Pune', 'India', 738748, '+91-8422596502', 18.528813584185173, 73.8570996858396);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Singh', 'Cardiology', 'Singh Health Clinic', '123 Ahmedabad Main Road', 'Ahmedabad', 'India', 580905, '+91-6062670380', 23.017849411150866, 72.55815727434167);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Patel', 'Cardiology', 'Patel Health Clinic', '101 Kolkata Main Road', 'Kolkata', 'India', 348568, '+91-7797608752', 22.57373219157183, 88.34793002626063);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Ghosh', 'Cardiology', 'Ghosh Health Clinic', '60 Lucknow Main Road', 'Lucknow', 'India', 156536, '+91-6324094734', 26.841096112644482, 80.94382407884608);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Ghosh', 'Cardiology', 'Ghosh Health Clinic', '58 Delhi Main Road', 'Delhi', 'India', 295511, '+91-8235818342', 28.698913352795607, 77.12138955564006);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Chakraborty', 'Cardiology', 'Chakraborty Health Clinic', '94 Mumbai Main Road', 'Mumbai', 'India', 114480, '+91-9932651470', 19.0840362112286, 72.87392632809966);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Shah', 'Cardiology', 'Shah Health Clinic', '182 Lucknow Main Road', 'Lucknow', 'India', 837853, '+91-7296620108', 26.842245733760763, 80.95312848175696);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Patel', 'Cardiology', 'Patel Health Clinic', '176 Hyderabad Main Road', 'Hyderabad', 'India', 385507, '+91-6116622491', 17.402056741297205, 78.49772897308948);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Sharma', 'Cardiology', 'Sharma Health Clinic', '167 Ahmedabad Main Road', 'Ahmedabad', 'India', 461582, '+91-8904282851', 23.014139515838124, 72.56483551429429);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Rao', 'Cardiology', 'Rao Health Clinic', '45 Jaipur Main Road', 'Jaipur', 'India', 600467, '+91-7043310210', 26.92618769691669, 75.79540155661931);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sharma', 'Cardiology', 'Sharma Health Clinic', '141 Delhi Main Road', 'Delhi', 'India', 282179, '+91-8531664958', 28.703955504818115, 77.11530682649637);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Mehta', 'Cardiology', 'Mehta Health Clinic', '70 Bengaluru Main Road', 'Bengaluru', 'India', 620580, '+91-6350633511', 12.988162221210466, 77.58434837796645);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Mehta', 'Cardiology', 'Mehta Health Clinic', '143 Jaipur Main Road', 'Jaipur', 'India', 456675, '+91-8404186656', 26.91003687886339, 75.79974101339462);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Verma', 'Cardiology', 'Verma Health Clinic', '143 Jaipur Main Road', 'Jaipur', 'India', 830301, '+91-8831715962', 26.919490896364806, 75.76846101571951);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Banerjee', 'Cardiology', 'Banerjee Health Clinic', '129 Mumbai Main Road', 'Mumbai', 'India', 428534, '+91-9210142958', 19.0582632273214, 72.86025382059748);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Patel', 'Cardiology', 'Patel Health Clinic', '73 Lucknow Main Road', 'Lucknow', 'India', 644423, '+91-7516453973', 26.839179614616977, 80.95310936985919);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Sharma', 'Cardiology', 'Sharma Health Clinic', '158 Chennai Main Road', 'Chennai', 'India', 923320, '+91-6419141456', 13.077330630256343, 80.27852379352923);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Ghosh', 'Cardiology', 'Ghosh Health Clinic', '166 Jaipur Main Road', 'Jaipur', 'India', 347893, '+91-9775560837', 26.92990489676229, 75.78839667024472);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Sharma', 'Cardiology', 'Sharma Health Clinic', '80 Bengaluru Main Road', 'Bengaluru', 'India', 399828, '+91-8867526196', 12.953756334461376, 77.58792359703226);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Ghosh', 'Cardiology', 'Ghosh Health Clinic', '28 Bengaluru Main Road', 'Bengaluru', 'India', 402914, '+91-8620839067', 12.971145086280874, 77.61292245761369);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Reddy', 'Cardiology', 'Reddy Health Clinic', '37 Pune Main Road', 'Pune', 'India', 636831, '+91-8094481155', 18.513836712969756, 73.84578783143023);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Singh', 'Cardiology', 'Singh Health Clinic', '118 Pune Main Road', 'Pune', 'India', 269182, '+91-7311258222', 18.51371120875706, 73.85846086824107);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Reddy', 'Cardiology', 'Reddy Health Clinic', '124 Pune Main Road', 'Pune', 'India', 341846, '+91-6057172869', 18.51992881564106, 73.84455755359618);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Ghosh', 'Cardiology', 'Ghosh Health Clinic', '166 Delhi Main Road', 'Delhi', 'India', 844159, '+91-9767718368', 28.719336966912252, 77.12185843239232);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Sengupta', 'Cardiology', 'Sengupta Health Clinic', '48 Pune Main Road', 'Pune', 'India', 814333, '+91-6823280234', 18.504713381494238, 73.84052691822103);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Khan', 'Cardiology', 'Khan Health Clinic', '27 Jaipur Main Road', 'Jaipur', 'India', 453447, '+91-8742859203', 26.8973437134818, 75.78970834688157);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Sengupta', 'Cardiology', 'Sengupta Health Clinic', '57 Jaipur Main Road', 'Jaipur', 'India', 701430, '+91-6275887683', 26.897031069783214, 75.79026621666611);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Banerjee', 'Cardiology', 'Banerjee Health Clinic', '104 Lucknow Main Road', 'Lucknow', 'India', 429586, '+91-8033271559', 26.858450279943572, 80.96611240025979);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Sengupta', 'Cardiology', 'Sengupta Health Clinic', '42 Kolkata Main Road', 'Kolkata', 'India', 951371, '+91-8634864781', 22.55442365192655, 88.38137290682596);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Banerjee', 'Cardiology', 'Banerjee Health Clinic', '131 Pune Main Road', 'Pune', 'India', 120732, '+91-8347940293', 18.52358370103247, 73.84461146795068);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Verma', 'Dermatology', 'Verma Health Clinic', '28 Kolkata Main Road', 'Kolkata', 'India', 870374, '+91-8912431112', 22.59233838838053, 88.37607359540249);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Mehta', 'Dermatology', 'Mehta Health Clinic', '130 Lucknow Main Road', 'Lucknow', 'India', 446609, '+91-9937329956', 26.85239529400322, 80.94906128958178);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Das', 'Dermatology', 'Das Health Clinic', '101 Bengaluru Main Road', 'Bengaluru', 'India', 886665, '+91-6051548950', 12.971949924995277, 77.57667369253775);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Patel', 'Dermatology', 'Patel Health Clinic', '13 Hyderabad Main Road', 'Hyderabad', 'India', 187885, '+91-8076413543', 17.3967548015603, 78.48474044127666);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Chakraborty', 'Dermatology', 'Chakraborty Health Clinic', '167 Pune Main Road', 'Pune', 'India', 224465, '+91-8710122716', 18.515125120765685, 73.84318024787643);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Ghosh', 'Dermatology', 'Ghosh Health Clinic', '21 Delhi Main Road', 'Delhi', 'India', 109897, '+91-9434685971', 28.712660712879483, 77.09911096976731);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Sharma', 'Dermatology', 'Sharma Health Clinic', '123 Kolkata Main Road', 'Kolkata', 'India', 100334, '+91-7910951164', 22.559797280736195, 88.36105381010458);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Rao', 'Dermatology', 'Rao Health Clinic', '146 Kolkata Main Road', 'Kolkata', 'India', 733607, '+91-9169265700', 22.592334320028435, 88.36593276005118);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Banerjee', 'Dermatology', 'Banerjee Health Clinic', '44 Chennai Main Road', 'Chennai', 'India', 390022, '+91-8993694535', 13.083186559226338, 80.27269291705102);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sengupta', 'Dermatology', 'Sengupta Health Clinic', '41 Kolkata Main Road', 'Kolkata', 'India', 267569, '+91-7700492991', 22.55716869053081, 88.36002431584399);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Shah', 'Dermatology', 'Shah Health Clinic', '135 Hyderabad Main Road', 'Hyderabad', 'India', 921608, '+91-9175850784', 17.377784384886525, 78.4704060127569);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Verma', 'Dermatology', 'Verma Health Clinic', '133 Lucknow Main Road', 'Lucknow', 'India', 912960, '+91-7729502321', 26.86319319945652, 80.95391570548058);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Rao', 'Dermatology', 'Rao Health Clinic', '173 Delhi Main Road', 'Delhi', 'India', 338128, '+91-8133013501', 28.709090373653204, 77.10948281894574);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Reddy', 'Dermatology', 'Reddy Health Clinic', '25 Jaipur Main Road', 'Jaipur', 'India', 524922, '+91-6007042608', 26.916954908678875, 75.79945684134631);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Shah', 'Dermatology', 'Shah Health Clinic', '150 Kolkata Main Road', 'Kolkata', 'India', 845125, '+91-7851789934', 22.583449310424797, 88.36275579637811);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Verma', 'Dermatology', 'Verma Health Clinic', '176 Lucknow Main Road', 'Lucknow', 'India', 486928, '+91-7198986639', 26.851093919174367, 80.94228656566874);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Verma', 'Dermatology', 'Verma Health Clinic', '49 Jaipur Main Road', 'Jaipur', 'India', 495902, '+91-6525277245', 26.9289449617219, 75.77637109760401);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Mehta', 'Dermatology', 'Mehta Health Clinic', '28 Pune Main Road', 'Pune', 'India', 232973, '+91-9724392570', 18.502276820518222, 73.85253032541377);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Patel', 'Dermatology', 'Patel Health Clinic', '136 Lucknow Main Road', 'Lucknow', 'India', 868524, '+91-9242827153', 26.84556244878615, 80.96039692491674);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Sengupta', 'Dermatology', 'Sengupta Health Clinic', '140 Lucknow Main Road', 'Lucknow', 'India', 864107, '+91-9138610322', 26.848341820231365, 80.9634529879474);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Reddy', 'Dermatology', 'Reddy Health Clinic', '112 Lucknow Main Road', 'Lucknow', 'India', 854340, '+91-9707548836', 26.85230957395328, 80.93668165378062);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'Dermatology', 'Banerjee Health Clinic', '105 Pune Main Road', 'Pune', 'India', 995307, '+91-6598567917', 18.517051591767224, 73.87124140940124);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Krishnan', 'Dermatology', 'Krishnan Health Clinic', '152 Pune Main Road', 'Pune', 'India', 963118, '+91-6354096997', 18.530407884617677, 73.8529440567829);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Das', 'Dermatology', 'Das Health Clinic', '109 Mumbai Main Road', 'Mumbai', 'India', 336630, '+91-6536187218', 19.067173819508362, 72.86140639003143);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Chakraborty', 'Dermatology', 'Chakraborty Health Clinic', '48 Chennai Main Road', 'Chennai', 'India', 143881, '+91-6498033088', 13.068809758062395, 80.28443250937237);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Chakraborty', 'Dermatology', 'Chakraborty Health Clinic', '128 Kolkata Main Road', 'Kolkata', 'India', 972698, '+91-8932188816', 22.575630127805045, 88.35536858049801);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Sharma', 'Dermatology', 'Sharma Health Clinic', '13 Bengaluru Main Road', 'Bengaluru', 'India', 613244, '+91-9079410835', 12.987874883413893, 77.59539819516021);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Kulkarni', 'Dermatology', 'Kulkarni Health Clinic', '110 Chennai Main Road', 'Chennai', 'India', 973409, '+91-9531245461', 13.065258587383918, 80.26297457011998);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Shah', 'Dermatology', 'Shah Health Clinic', '136 Chennai Main Road', 'Chennai', 'India', 495668, '+91-9109485331', 13.095546917845727, 80.2649157347387);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Sengupta', 'Dermatology', 'Sengupta Health Clinic', '93 Chennai Main Road', 'Chennai', 'India', 968021, '+91-6987892773', 13.08125433556463, 80.25855240166477);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Shah', 'Dermatology', 'Shah Health Clinic', '179 Chennai Main Road', 'Chennai', 'India', 633893, '+91-7504751282', 13.101001112641926, 80.26859520465656);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Shah', 'Dermatology', 'Shah Health Clinic', '135 Jaipur Main Road', 'Jaipur', 'India', 652308, '+91-7877072416', 26.906813694557744, 75.77913431539544);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Patel', 'Dermatology', 'Patel Health Clinic', '128 Pune Main Road', 'Pune', 'India', 329514, '+91-8401723900', 18.501285589595298, 73.84444870803293);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Reddy', 'Dermatology', 'Reddy Health Clinic', '27 Pune Main Road', 'Pune', 'India', 451919, '+91-9209599829', 18.51892532661313, 73.84142162043081);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Ghosh', 'Dermatology', 'Ghosh Health Clinic', '121 Delhi Main Road', 'Delhi', 'India', 467709, '+91-8882023736', 28.68997120187042, 77.11082475930714);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Sharma', 'Dermatology', 'Sharma Health Clinic', '10 Chennai Main Road', 'Chennai', 'India', 965733, '+91-9210337405', 13.10077287989218, 80.25910324931282);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Khan', 'Dermatology', 'Khan Health Clinic', '95 Hyderabad Main Road', 'Hyderabad', 'India', 798569, '+91-7208634371', 17.375497245869266, 78.49847427655408);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Patel', 'Dermatology', 'Patel Health Clinic', '112 Delhi Main Road', 'Delhi', 'India', 579620, '+91-6779018917', 28.695140063175714, 77.10622195222913);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Krishnan', 'Dermatology', 'Krishnan Health Clinic', '145 Delhi Main Road', 'Delhi', 'India', 236176, '+91-6452128043', 28.690382686053358, 77.08909774688239);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Verma', 'Dermatology', 'Verma Health Clinic', '42 Ahmedabad Main Road', 'Ahmedabad', 'India', 422707, '+91-7018543071', 23.005896437909296, 72.56916447836086);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Rao', 'Dermatology', 'Rao Health Clinic', '112 Jaipur Main Road', 'Jaipur', 'India', 230921, '+91-8555147279', 26.92349631675501, 75.79407388436513);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Mehta', 'Dermatology', 'Mehta Health Clinic', '87 Delhi Main Road', 'Delhi', 'India', 160733, '+91-8040685552', 28.709700499191296, 77.1158959824395);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Krishnan', 'Dermatology', 'Krishnan Health Clinic', '106 Jaipur Main Road', 'Jaipur', 'India', 882092, '+91-9962289145', 26.896533465509965, 75.78142719289798);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Singh', 'Dermatology', 'Singh Health Clinic', '117 Pune Main Road', 'Pune', 'India', 331510, '+91-6599466535', 18.502375605765973, 73.83798016208914);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Reddy', 'Dermatology', 'Reddy Health Clinic', '36 Mumbai Main Road', 'Mumbai', 'India', 836401, '+91-7502964429', 19.072433735552007, 72.87440681436254);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Ghosh', 'Dermatology', 'Ghosh Health Clinic', '78 Lucknow Main Road', 'Lucknow', 'India', 622467, '+91-8185866141', 26.82859740945529, 80.95961969621533);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Das', 'Dermatology', 'Das Health Clinic', '117 Kolkata Main Road', 'Kolkata', 'India', 707980, '+91-7701803848', 22.57648733472648, 88.35851065779428);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Shah', 'Dermatology', 'Shah Health Clinic', '18 Jaipur Main Road', 'Jaipur', 'India', 812188, '+91-9501888111', 26.901419692633944, 75.80249212937217);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Patel', 'Dermatology', 'Patel Health Clinic', '149 Ahmedabad Main Road', 'Ahmedabad', 'India', 897485, '+91-6162925464', 23.009707292526546, 72.59094372148876);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Sharma', 'Dermatology', 'Sharma Health Clinic', '55 Kolkata Main Road', 'Kolkata', 'India', 256375, '+91-8626989912', 22.568162074308745, 88.36929341257627);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Banerjee', 'Dermatology', 'Banerjee Health Clinic', '128 Kolkata Main Road', 'Kolkata', 'India', 485406, '+91-8021335296', 22.589272153147462, 88.35339018308883);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Shah', 'Dermatology', 'Shah Health Clinic', '77 Bengaluru Main Road', 'Bengaluru', 'India', 374228, '+91-8590176832', 12.957880376974263, 77.58958523627753);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Verma', 'Dermatology', 'Verma Health Clinic', '120 Delhi Main Road', 'Delhi', 'India', 321382, '+91-9106337014', 28.706035092922903, 77.0849583116962);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Rao', 'Dermatology', 'Rao Health Clinic', '122 Kolkata Main Road', 'Kolkata', 'India', 362936, '+91-8414285211', 22.566488235367324, 88.38318311931998);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Shah', 'Dermatology', 'Shah Health Clinic', '14 Kolkata Main Road', 'Kolkata', 'India', 400566, '+91-8055201950', 22.558023707408207, 88.36507356557114);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Khan', 'Dermatology', 'Khan Health Clinic', '69 Kolkata Main Road', 'Kolkata', 'India', 908032, '+91-8523143452', 22.58097728892808, 88.36327146858265);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Ghosh', 'Dermatology', 'Ghosh Health Clinic', '30 Ahmedabad Main Road', 'Ahmedabad', 'India', 216958, '+91-6509067383', 23.042297820543837, 72.58092782067628);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sengupta', 'Dermatology', 'Sengupta Health Clinic', '18 Kolkata Main Road', 'Kolkata', 'India', 539021, '+91-6628642032', 22.55561453338345, 88.37179783696395);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Reddy', 'Dermatology', 'Reddy Health Clinic', '67 Hyderabad Main Road', 'Hyderabad', 'India', 858636, '+91-6577925149', 17.387185315004636, 78.47517835713428);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Ghosh', 'Dermatology', 'Ghosh Health Clinic', '68 Kolkata Main Road', 'Kolkata', 'India', 874274, '+91-8225480964', 22.56796805492075, 88.35633364627404);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Shah', 'Dermatology', 'Shah Health Clinic', '53 Kolkata Main Road', 'Kolkata', 'India', 198882, '+91-7168922504', 22.56961201609606, 88.36571391008128);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Mehta', 'Dermatology', 'Mehta Health Clinic', '66 Chennai Main Road', 'Chennai', 'India', 404083, '+91-6223594454', 13.086171625400452, 80.28241317468196);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Khan', 'Orthopedics', 'Khan Health Clinic', '138 Mumbai Main Road', 'Mumbai', 'India', 280290, '+91-6206977230', 19.07485864481443, 72.87924814888929);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Singh', 'Orthopedics', 'Singh Health Clinic', '102 Delhi Main Road', 'Delhi', 'India', 684347, '+91-7498864376', 28.705670137011467, 77.10266953639673);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Shah', 'Orthopedics', 'Shah Health Clinic', '105 Lucknow Main Road', 'Lucknow', 'India', 655322, '+91-9599105397', 26.834103191953215, 80.9458974811746);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Chakraborty', 'Orthopedics', 'Chakraborty Health Clinic', '55 Delhi Main Road', 'Delhi', 'India', 792550, '+91-9795639986', 28.694503786343134, 77.1104920258675);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Shah', 'Orthopedics', 'Shah Health Clinic', '150 Hyderabad Main Road', 'Hyderabad', 'India', 881589, '+91-7380506695', 17.388460529761044, 78.49099741537195);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Khan', 'Orthopedics', 'Khan Health Clinic', '129 Hyderabad Main Road', 'Hyderabad', 'India', 812473, '+91-9507000000', 17.393507156138345, 78.50658337937898);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Kulkarni', 'Orthopedics', 'Kulkarni Health Clinic', '27 Kolkata Main Road', 'Kolkata', 'India', 341819, '+91-9748911948', 22.58769919628981, 88.35861259863914);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Kulkarni', 'Orthopedics', 'Kulkarni Health Clinic', '67 Delhi Main Road', 'Delhi', 'India', 144494, '+91-6265395523', 28.685111353392198, 77.08744329118682);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Krishnan', 'Orthopedics', 'Krishnan Health Clinic', '126 Chennai Main Road', 'Chennai', 'India', 433606, '+91-6517979058', 13.08753698311744, 80.26934938161713);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Rao', 'Orthopedics', 'Rao Health Clinic', '15 Chennai Main Road', 'Chennai', 'India', 260377, '+91-8649855847', 13.08273479461723, 80.2846794004327);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Sharma', 'Orthopedics', 'Sharma Health Clinic', '48 Kolkata Main Road', 'Kolkata', 'India', 941737, '+91-7072016064', 22.586033310055335, 88.35194324127548);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Verma', 'Orthopedics', 'Verma Health Clinic', '122 Mumbai Main Road', 'Mumbai', 'India', 476791, '+91-7561129191', 19.091317826078395, 72.86499506022115);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sengupta', 'Orthopedics', 'Sengupta Health Clinic', '31 Jaipur Main Road', 'Jaipur', 'India', 966996, '+91-7230027756', 26.90215847260243, 75.780613738703);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Banerjee', 'Orthopedics', 'Banerjee Health Clinic', '67 Bengaluru Main Road', 'Bengaluru', 'India', 156718, '+91-6780719393', 12.958400293799523, 77.59148425910413);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Mehta', 'Orthopedics', 'Mehta Health Clinic', '173 Ahmedabad Main Road', 'Ahmedabad', 'India', 933067, '+91-6152083554', 23.03556511016643, 72.58576284127976);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Shah', 'Orthopedics', 'Shah Health Clinic', '85 Ahmedabad Main Road', 'Ahmedabad', 'India', 384365, '+91-8466344414', 23.006461921119058, 72.55450132976301);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sengupta', 'Orthopedics', 'Sengupta Health Clinic', '88 Bengaluru Main Road', 'Bengaluru', 'India', 949005, '+91-8137515207', 12.966054515143572, 77.61010284336173);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Krishnan', 'Orthopedics', 'Krishnan Health Clinic', '169 Chennai Main Road', 'Chennai', 'India', 639391, '+91-6224971829', 13.087908211781496, 80.28911126297811);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Chakraborty', 'Orthopedics', 'Chakraborty Health Clinic', '190 Mumbai Main Road', 'Mumbai', 'India', 777119, '+91-6343652923', 19.09221470336736, 72.88528124545017);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Verma', 'Orthopedics', 'Verma Health Clinic', '171 Jaipur Main Road', 'Jaipur', 'India', 319396, '+91-8291438200', 26.90771113981837, 75.76989242629251);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Das', 'Orthopedics', 'Das Health Clinic', '10 Chennai Main Road', 'Chennai', 'India', 133396, '+91-7697016639', 13.100893638706225, 80.26642486757389);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Krishnan', 'Orthopedics', 'Krishnan Health Clinic', '126 Chennai Main Road', 'Chennai', 'India', 104471, '+91-6282160698', 13.064390286858576, 80.26389488553255);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Das', 'Orthopedics', 'Das Health Clinic', '193 Jaipur Main Road', 'Jaipur', 'India', 505861, '+91-6199474589', 26.928493643792592, 75.78646662563781);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Das', 'Orthopedics', 'Das Health Clinic', '112 Delhi Main Road', 'Delhi', 'India', 164291, '+91-9873328525', 28.709972635442874, 77.1198673200601);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Sharma', 'Orthopedics', 'Sharma Health Clinic', '158 Bengaluru Main Road', 'Bengaluru', 'India', 955990, '+91-6406252817', 12.981209074554908, 77.57930050606448);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Verma', 'Orthopedics', 'Verma Health Clinic', '136 Delhi Main Road', 'Delhi', 'India', 421922, '+91-6889995028', 28.684279167186823, 77.09106247195082);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Sengupta', 'Orthopedics', 'Sengupta Health Clinic', '94 Mumbai Main Road', 'Mumbai', 'India', 982740, '+91-8185546294', 19.094346172951717, 72.86781191546676);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Verma', 'Orthopedics', 'Verma Health Clinic', '194 Lucknow Main Road', 'Lucknow', 'India', 515747, '+91-9099549081', 26.845401045632308, 80.95642467133092);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Rao', 'Orthopedics', 'Rao Health Clinic', '82 Chennai Main Road', 'Chennai', 'India', 425835, '+91-6544699206', 13.098635206349114, 80.25331299350617);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Reddy', 'Orthopedics', 'Reddy Health Clinic', '144 Mumbai Main Road', 'Mumbai', 'India', 524861, '+91-8571032805', 19.092759784425706, 72.89197356735377);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Banerjee', 'Orthopedics', 'Banerjee Health Clinic', '138 Bengaluru Main Road', 'Bengaluru', 'India', 124039, '+91-6025113133', 12.974087491387925, 77.58749436182912);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'Orthopedics', 'Banerjee Health Clinic', '105 Delhi Main Road', 'Delhi', 'India', 495143, '+91-7146584490', 28.712913229626746, 77.1214413748815);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Khan', 'Orthopedics', 'Khan Health Clinic', '101 Bengaluru Main Road', 'Bengaluru', 'India', 235143, '+91-9424802727', 12.976861434833602, 77.60158194474562);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Kulkarni', 'Orthopedics', 'Kulkarni Health Clinic', '107 Mumbai Main Road', 'Mumbai', 'India', 731850, '+91-7270864344', 19.083182222070523, 72.8876916846939);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Shah', 'Orthopedics', 'Shah Health Clinic', '180 Lucknow Main Road', 'Lucknow', 'India', 461702, '+91-9303732445', 26.842591596302494, 80.92816593917755);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Mehta', 'Orthopedics', 'Mehta Health Clinic', '122 Lucknow Main Road', 'Lucknow', 'India', 698930, '+91-8152440611', 26.828022807339625, 80.93473339068089);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Shah', 'Orthopedics', 'Shah Health Clinic', '80 Ahmedabad Main Road', 'Ahmedabad', 'India', 530265, '+91-7538221514', 23.009842569701814, 72.58942897910175);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Rao', 'Orthopedics', 'Rao Health Clinic', '193 Lucknow Main Road', 'Lucknow', 'India', 238080, '+91-9955029153', 26.841988625707412, 80.92980782542787);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Patel', 'Orthopedics', 'Patel Health Clinic', '29 Hyderabad Main Road', 'Hyderabad', 'India', 998273, '+91-8538050311', 17.38175562506604, 78.47541407976284);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Singh', 'Orthopedics', 'Singh Health Clinic', '110 Pune Main Road', 'Pune', 'India', 844303, '+91-8191196434', 18.511465610175705, 73.8465342480316);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Sengupta', 'Orthopedics', 'Sengupta Health Clinic', '50 Jaipur Main Road', 'Jaipur', 'India', 696110, '+91-6934968161', 26.916773268368374, 75.79312688202144);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Verma', 'Orthopedics', 'Verma Health Clinic', '76 Kolkata Main Road', 'Kolkata', 'India', 621344, '+91-7784316378', 22.557964143930512, 88.37346560235883);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Ghosh', 'Orthopedics', 'Ghosh Health Clinic', '105 Hyderabad Main Road', 'Hyderabad', 'India', 454800, '+91-9291480454', 17.38958711783318, 78.47251669951537);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Ghosh', 'Orthopedics', 'Ghosh Health Clinic', '71 Delhi Main Road', 'Delhi', 'India', 820817, '+91-6009929260', 28.693076691560268, 77.08674992885915);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Shah', 'Orthopedics', 'Shah Health Clinic', '77 Lucknow Main Road', 'Lucknow', 'India', 923826, '+91-7444241219', 26.85843533539255, 80.93955533421385);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Mehta', 'Orthopedics', 'Mehta Health Clinic', '129 Ahmedabad Main Road', 'Ahmedabad', 'India', 150743, '+91-7711119828', 23.02686972540443, 72.58424454343886);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Kulkarni', 'Orthopedics', 'Kulkarni Health Clinic', '164 Mumbai Main Road', 'Mumbai', 'India', 894060, '+91-8425115639', 19.073925696062613, 72.88690617539191);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Shah', 'Orthopedics', 'Shah Health Clinic', '140 Lucknow Main Road', 'Lucknow', 'India', 917664, '+91-9760891358', 26.853166690000332, 80.96110887239374);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Das', 'Orthopedics', 'Das Health Clinic', '147 Hyderabad Main Road', 'Hyderabad', 'India', 896140, '+91-8426460170', 17.38791676088598, 78.47111454374767);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Das', 'Orthopedics', 'Das Health Clinic', '70 Jaipur Main Road', 'Jaipur', 'India', 805078, '+91-9724591759', 26.923953647782714, 75.78857962715914);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Chakraborty', 'Orthopedics', 'Chakraborty Health Clinic', '51 Ahmedabad Main Road', 'Ahmedabad', 'India', 567139, '+91-7451860901', 23.004568835575338, 72.58800748205063);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Shah', 'Orthopedics', 'Shah Health Clinic', '108 Jaipur Main Road', 'Jaipur', 'India', 473291, '+91-9303120265', 26.91786478397417, 75.80070074730355);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Das', 'Orthopedics', 'Das Health Clinic', '120 Bengaluru Main Road', 'Bengaluru', 'India', 266398, '+91-7835746099', 12.972649232327907, 77.59902388092367);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Singh', 'Orthopedics', 'Singh Health Clinic', '95 Kolkata Main Road', 'Kolkata', 'India', 894948, '+91-7878836096', 22.55757211206729, 88.36109451079327);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Khan', 'Orthopedics', 'Khan Health Clinic', '51 Jaipur Main Road', 'Jaipur', 'India', 458879, '+91-8944950278', 26.92120321392805, 75.78829119484925);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Reddy', 'Orthopedics', 'Reddy Health Clinic', '13 Hyderabad Main Road', 'Hyderabad', 'India', 156872, '+91-6470111347', 17.37375713865176, 78.48131136772889);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Verma', 'Orthopedics', 'Verma Health Clinic', '90 Chennai Main Road', 'Chennai', 'India', 476428, '+91-9906114076', 13.075501936605681, 80.26065636961958);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Khan', 'Orthopedics', 'Khan Health Clinic', '193 Jaipur Main Road', 'Jaipur', 'India', 452352, '+91-9176651346', 26.905537594780967, 75.78702862922216);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Khan', 'Orthopedics', 'Khan Health Clinic', '42 Ahmedabad Main Road', 'Ahmedabad', 'India', 695802, '+91-8661746547', 23.041662481179834, 72.55528157950828);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Das', 'Orthopedics', 'Das Health Clinic', '32 Mumbai Main Road', 'Mumbai', 'India', 925068, '+91-7716340712', 19.057123224630594, 72.85809844752826);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Khan', 'Orthopedics', 'Khan Health Clinic', '30 Lucknow Main Road', 'Lucknow', 'India', 936397, '+91-6011519901', 26.859332308415603, 80.96384178788725);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Krishnan', 'Orthopedics', 'Krishnan Health Clinic', '110 Kolkata Main Road', 'Kolkata', 'India', 471829, '+91-9150536703', 22.565452530136092, 88.38262772363116);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Khan', 'Gynecology', 'Khan Health Clinic', '13 Hyderabad Main Road', 'Hyderabad', 'India', 794939, '+91-9721849750', 17.387687378180168, 78.50171309031926);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Rao', 'Gynecology', 'Rao Health Clinic', '120 Hyderabad Main Road', 'Hyderabad', 'India', 542428, '+91-8799020499', 17.38422468972722, 78.49101560285249);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Verma', 'Gynecology', 'Verma Health Clinic', '10 Pune Main Road', 'Pune', 'India', 161075, '+91-9012602242', 18.516018207835973, 73.8403746866588);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Singh', 'Gynecology', 'Singh Health Clinic', '179 Lucknow Main Road', 'Lucknow', 'India', 523011, '+91-7694832856', 26.8665426703522, 80.94254577974631);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Singh', 'Gynecology', 'Singh Health Clinic', '144 Lucknow Main Road', 'Lucknow', 'India', 762736, '+91-8457759237', 26.8329466698504, 80.93118139762005);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Khan', 'Gynecology', 'Khan Health Clinic', '86 Lucknow Main Road', 'Lucknow', 'India', 763198, '+91-8929293437', 26.852070350300345, 80.9525456880526);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Shah', 'Gynecology', 'Shah Health Clinic', '94 Kolkata Main Road', 'Kolkata', 'India', 536874, '+91-9068838764', 22.571749486563537, 88.37751431883102);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Kulkarni', 'Gynecology', 'Kulkarni Health Clinic', '195 Bengaluru Main Road', 'Bengaluru', 'India', 741559, '+91-8480584377', 12.986661251362854, 77.59540635301198);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Banerjee', 'Gynecology', 'Banerjee Health Clinic', '62 Mumbai Main Road', 'Mumbai', 'India', 693535, '+91-8287009073', 19.060286627628003, 72.88336260886119);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Sengupta', 'Gynecology', 'Sengupta Health Clinic', '165 Jaipur Main Road', 'Jaipur', 'India', 796493, '+91-8467464581', 26.921324703178747, 75.78498318406922);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Verma', 'Gynecology', 'Verma Health Clinic', '108 Hyderabad Main Road', 'Hyderabad', 'India', 331366, '+91-6217820259', 17.37640481011716, 78.49329239067113);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Sengupta', 'Gynecology', 'Sengupta Health Clinic', '121 Chennai Main Road', 'Chennai', 'India', 774430, '+91-6689884269', 13.084980401297319, 80.27481083853667);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Patel', 'Gynecology', 'Patel Health Clinic', '22 Pune Main Road', 'Pune', 'India', 355916, '+91-6730572415', 18.511802812401935, 73.87391315064096);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Chakraborty', 'Gynecology', 'Chakraborty Health Clinic', '200 Delhi Main Road', 'Delhi', 'India', 419742, '+91-8957397469', 28.71000039077964, 77.09599916256444);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Krishnan', 'Gynecology', 'Krishnan Health Clinic', '198 Pune Main Road', 'Pune', 'India', 145448, '+91-7127134602', 18.527099450913386, 73.8608318402818);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Kulkarni', 'Gynecology', 'Kulkarni Health Clinic', '17 Kolkata Main Road', 'Kolkata', 'India', 666996, '+91-6062468536', 22.56273431550065, 88.36960721125624);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Patel', 'Gynecology', 'Patel Health Clinic', '10 Chennai Main Road', 'Chennai', 'India', 511742, '+91-8998403049', 13.080645081211188, 80.25118335143847);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Patel', 'Gynecology', 'Patel Health Clinic', '69 Kolkata Main Road', 'Kolkata', 'India', 193724, '+91-8966112413', 22.579468898138302, 88.35678842074336);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Reddy', 'Gynecology', 'Reddy Health Clinic', '188 Mumbai Main Road', 'Mumbai', 'India', 997626, '+91-9215324348', 19.06568364413799, 72.86388594525174);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Mehta', 'Gynecology', 'Mehta Health Clinic', '21 Bengaluru Main Road', 'Bengaluru', 'India', 654646, '+91-9193893165', 12.957617725049483, 77.58534685162324);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Singh', 'Gynecology', 'Singh Health Clinic', '10 Ahmedabad Main Road', 'Ahmedabad', 'India', 757838, '+91-9545954725', 23.021598601661243, 72.58509534488162);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Reddy', 'Gynecology', 'Reddy Health Clinic', '118 Bengaluru Main Road', 'Bengaluru', 'India', 749685, '+91-7511496691', 12.958616466448587, 77.60466133808002);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Mehta', 'Gynecology', 'Mehta Health Clinic', '197 Jaipur Main Road', 'Jaipur', 'India', 557910, '+91-7073006124', 26.917255639385104, 75.77275750472386);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Ghosh', 'Gynecology', 'Ghosh Health Clinic', '186 Chennai Main Road', 'Chennai', 'India', 423797, '+91-7180330191', 13.065525278994109, 80.25096448690992);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Sharma', 'Gynecology', 'Sharma Health Clinic', '162 Hyderabad Main Road', 'Hyderabad', 'India', 329555, '+91-7778669108', 17.402133280152338, 78.46745507412642);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Rao', 'Gynecology', 'Rao Health Clinic', '130 Jaipur Main Road', 'Jaipur', 'India', 260342, '+91-8091782342', 26.903365821837387, 75.78007282699373);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Shah', 'Gynecology', 'Shah Health Clinic', '161 Kolkata Main Road', 'Kolkata', 'India', 327901, '+91-6543270597', 22.576106607189022, 88.36499073424082);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Mehta', 'Gynecology', 'Mehta Health Clinic', '141 Pune Main Road', 'Pune', 'India', 230665, '+91-7606137288', 18.52485718221358, 73.86535773850538);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Reddy', 'Gynecology', 'Reddy Health Clinic', '196 Kolkata Main Road', 'Kolkata', 'India', 772182, '+91-7342772824', 22.579846888849385, 88.36338335827978);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Sengupta', 'Gynecology', 'Sengupta Health Clinic', '33 Mumbai Main Road', 'Mumbai', 'India', 365108, '+91-8099699933', 19.08851902150115, 72.86477370965802);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Mehta', 'Gynecology', 'Mehta Health Clinic', '153 Ahmedabad Main Road', 'Ahmedabad', 'India', 780762, '+91-6957650485', 23.037909577255967, 72.56327363919483);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Mehta', 'Gynecology', 'Mehta Health Clinic', '185 Hyderabad Main Road', 'Hyderabad', 'India', 514193, '+91-7922812893', 17.386123471042293, 78.48389068920163);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Krishnan', 'Gynecology', 'Krishnan Health Clinic', '44 Bengaluru Main Road', 'Bengaluru', 'India', 512974, '+91-6571279294', 12.952292485611638, 77.59643304714946);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Singh', 'Gynecology', 'Singh Health Clinic', '29 Kolkata Main Road', 'Kolkata', 'India', 339268, '+91-7433986037', 22.58158662901541, 88.36449530991858);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Krishnan', 'Gynecology', 'Krishnan Health Clinic', '126 Jaipur Main Road', 'Jaipur', 'India', 935677, '+91-7775779866', 26.91694684150314, 75.79356424442243);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Chakraborty', 'Gynecology', 'Chakraborty Health Clinic', '165 Chennai Main Road', 'Chennai', 'India', 349713, '+91-6372329765', 13.093998690152569, 80.28612665960077);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Mehta', 'Gynecology', 'Mehta Health Clinic', '158 Bengaluru Main Road', 'Bengaluru', 'India', 756253, '+91-6634745919', 12.98363430044844, 77.5955429411444);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Chakraborty', 'Gynecology', 'Chakraborty Health Clinic', '63 Delhi Main Road', 'Delhi', 'India', 578762, '+91-8976545171', 28.719220641403844, 77.0923756772349);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Sengupta', 'Gynecology', 'Sengupta Health Clinic', '113 Kolkata Main Road', 'Kolkata', 'India', 600174, '+91-8129363322', 22.564009778821212, 88.3769841439394);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Verma', 'Gynecology', 'Verma Health Clinic', '97 Delhi Main Road', 'Delhi', 'India', 300211, '+91-8968963660', 28.712286019697423, 77.11977921475217);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Sharma', 'Gynecology', 'Sharma Health Clinic', '63 Delhi Main Road', 'Delhi', 'India', 348697, '+91-9510556047', 28.707764373576723, 77.0942822919253);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Rao', 'Gynecology', 'Rao Health Clinic', '82 Chennai Main Road', 'Chennai', 'India', 163981, '+91-8332753661', 13.065095401001214, 80.28543315166314);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Patel', 'Gynecology', 'Patel Health Clinic', '15 Ahmedabad Main Road', 'Ahmedabad', 'India', 757130, '+91-6151916047', 23.016127617248546, 72.56211546704664);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Das', 'Gynecology', 'Das Health Clinic', '132 Ahmedabad Main Road', 'Ahmedabad', 'India', 175341, '+91-7395598468', 23.042181152413217, 72.55774658817053);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Mehta', 'Gynecology', 'Mehta Health Clinic', '86 Lucknow Main Road', 'Lucknow', 'India', 437220, '+91-6395489232', 26.82881865711891, 80.9342560077679);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Ghosh', 'Gynecology', 'Ghosh Health Clinic', '20 Pune Main Road', 'Pune', 'India', 426717, '+91-9795355810', 18.518225823363917, 73.8485234755047);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Das', 'Gynecology', 'Das Health Clinic', '46 Bengaluru Main Road', 'Bengaluru', 'India', 746951, '+91-6501101393', 12.982843218232155, 77.59974946905538);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Patel', 'Gynecology', 'Patel Health Clinic', '91 Kolkata Main Road', 'Kolkata', 'India', 656766, '+91-8670330058', 22.57903998245468, 88.36047967907923);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Mehta', 'Gynecology', 'Mehta Health Clinic', '76 Chennai Main Road', 'Chennai', 'India', 876006, '+91-6719217825', 13.075091009255745, 80.27333696368841);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Patel', 'Gynecology', 'Patel Health Clinic', '181 Lucknow Main Road', 'Lucknow', 'India', 173642, '+91-7382519095', 26.846399039735324, 80.95164247438319);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Khan', 'Gynecology', 'Khan Health Clinic', '105 Bengaluru Main Road', 'Bengaluru', 'India', 664916, '+91-9924342477', 12.957719382487426, 77.57863536151014);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Singh', 'Gynecology', 'Singh Health Clinic', '13 Jaipur Main Road', 'Jaipur', 'India', 383387, '+91-6594927491', 26.92003319875784, 75.8067929227967);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Banerjee', 'Gynecology', 'Banerjee Health Clinic', '55 Hyderabad Main Road', 'Hyderabad', 'India', 196526, '+91-8733915866', 17.40261861176135, 78.49991660387933);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Banerjee', 'Gynecology', 'Banerjee Health Clinic', '16 Chennai Main Road', 'Chennai', 'India', 797418, '+91-7468172691', 13.099110708929775, 80.28372962483047);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Verma', 'Gynecology', 'Verma Health Clinic', '57 Chennai Main Road', 'Chennai', 'India', 880980, '+91-9072530188', 13.072328705789355, 80.28189414932191);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Ghosh', 'Gynecology', 'Ghosh Health Clinic', '30 Hyderabad Main Road', 'Hyderabad', 'India', 271061, '+91-8687339419', 17.39796730745592, 78.49989149551246);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Verma', 'Gynecology', 'Verma Health Clinic', '91 Ahmedabad Main Road', 'Ahmedabad', 'India', 256893, '+91-9970443817', 23.01166322828371, 72.56259709561665);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Chakraborty', 'Gynecology', 'Chakraborty Health Clinic', '162 Hyderabad Main Road', 'Hyderabad', 'India', 598428, '+91-6215579056', 17.36955172841255, 78.49225634481954);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Singh', 'Gynecology', 'Singh Health Clinic', '68 Lucknow Main Road', 'Lucknow', 'India', 231387, '+91-9022277584', 26.837460166510127, 80.95609318571009);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Ghosh', 'Gynecology', 'Ghosh Health Clinic', '11 Jaipur Main Road', 'Jaipur', 'India', 419155, '+91-6363579526', 26.911627865893017, 75.77131424502785);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Verma', 'Gynecology', 'Verma Health Clinic', '77 Bengaluru Main Road', 'Bengaluru', 'India', 381363, '+91-6463553196', 12.99042213148833, 77.59409584959455);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Reddy', 'Gynecology', 'Reddy Health Clinic', '155 Ahmedabad Main Road', 'Ahmedabad', 'India', 679727, '+91-6348198090', 23.019468574552057, 72.58275794128143);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Verma', 'Neurology', 'Verma Health Clinic', '24 Jaipur Main Road', 'Jaipur', 'India', 449187, '+91-8450493097', 26.907685254404775, 75.80482788291286);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Mehta', 'Neurology', 'Mehta Health Clinic', '150 Lucknow Main Road', 'Lucknow', 'India', 232543, '+91-9571882537', 26.840217163056224, 80.94010550966647);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Krishnan', 'Neurology', 'Krishnan Health Clinic', '42 Bengaluru Main Road', 'Bengaluru', 'India', 236391, '+91-9146155698', 12.99107706943523, 77.59824323358198);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Sharma', 'Neurology', 'Sharma Health Clinic', '148 Jaipur Main Road', 'Jaipur', 'India', 713183, '+91-9002395246', 26.918957995982357, 75.80232856936398);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Shah', 'Neurology', 'Shah Health Clinic', '22 Jaipur Main Road', 'Jaipur', 'India', 450983, '+91-7647964318', 26.929758794585027, 75.77943439669488);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Reddy', 'Neurology', 'Reddy Health Clinic', '103 Bengaluru Main Road', 'Bengaluru', 'India', 794943, '+91-7566743688', 12.95749769300139, 77.60458579333421);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Verma', 'Neurology', 'Verma Health Clinic', '93 Jaipur Main Road', 'Jaipur', 'India', 247538, '+91-6781107843', 26.924464093811178, 75.7844791419578);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Mehta', 'Neurology', 'Mehta Health Clinic', '23 Lucknow Main Road', 'Lucknow', 'India', 365419, '+91-9758310224', 26.831247860540934, 80.92797830283506);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Banerjee', 'Neurology', 'Banerjee Health Clinic', '151 Delhi Main Road', 'Delhi', 'India', 200708, '+91-9823952939', 28.717649142897617, 77.12154525135264);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Patel', 'Neurology', 'Patel Health Clinic', '88 Lucknow Main Road', 'Lucknow', 'India', 804451, '+91-9600239516', 26.845206358715025, 80.95301931581663);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Mehta', 'Neurology', 'Mehta Health Clinic', '48 Mumbai Main Road', 'Mumbai', 'India', 133146, '+91-9288307983', 19.084176023103627, 72.88898321716454);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Ghosh', 'Neurology', 'Ghosh Health Clinic', '48 Ahmedabad Main Road', 'Ahmedabad', 'India', 663162, '+91-6989304757', 23.00294499495249, 72.56490034707565);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Das', 'Neurology', 'Das Health Clinic', '37 Hyderabad Main Road', 'Hyderabad', 'India', 640704, '+91-7749683794', 17.39254358280264, 78.49335537084697);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Reddy', 'Neurology', 'Reddy Health Clinic', '40 Delhi Main Road', 'Delhi', 'India', 625794, '+91-6351230066', 28.701146012431252, 77.08866078282621);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Sharma', 'Neurology', 'Sharma Health Clinic', '183 Chennai Main Road', 'Chennai', 'India', 915861, '+91-9173232257', 13.090601275132116, 80.27902771549564);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Banerjee', 'Neurology', 'Banerjee Health Clinic', '135 Delhi Main Road', 'Delhi', 'India', 890238, '+91-8793116854', 28.699533131469405, 77.11410371839311);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Sengupta', 'Neurology', 'Sengupta Health Clinic', '58 Delhi Main Road', 'Delhi', 'India', 434571, '+91-9534554265', 28.702572276948967, 77.09988396466751);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Ghosh', 'Neurology', 'Ghosh Health Clinic', '114 Jaipur Main Road', 'Jaipur', 'India', 712147, '+91-6156510630', 26.91642633219602, 75.78264396325136);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Mehta', 'Neurology', 'Mehta Health Clinic', '58 Bengaluru Main Road', 'Bengaluru', 'India', 401802, '+91-8787049530', 12.971321488158102, 77.59060198438155);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Sharma', 'Neurology', 'Sharma Health Clinic', '146 Mumbai Main Road', 'Mumbai', 'India', 506180, '+91-8521446634', 19.05928477510497, 72.890661065181);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Rao', 'Neurology', 'Rao Health Clinic', '27 Pune Main Road', 'Pune', 'India', 440271, '+91-7262792398', 18.52962904533956, 73.86863923041486);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Shah', 'Neurology', 'Shah Health Clinic', '156 Delhi Main Road', 'Delhi', 'India', 555887, '+91-8838433651', 28.723785921924726, 77.1083447326051);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Sengupta', 'Neurology', 'Sengupta Health Clinic', '154 Bengaluru Main Road', 'Bengaluru', 'India', 350864, '+91-9711438761', 12.988226549179224, 77.60787988322998);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Krishnan', 'Neurology', 'Krishnan Health Clinic', '148 Jaipur Main Road', 'Jaipur', 'India', 877151, '+91-7132091722', 26.901460228249356, 75.77871142002505);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Chakraborty', 'Neurology', 'Chakraborty Health Clinic', '67 Lucknow Main Road', 'Lucknow', 'India', 527902, '+91-7075640182', 26.83036781211674, 80.92802969005226);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Mehta', 'Neurology', 'Mehta Health Clinic', '134 Jaipur Main Road', 'Jaipur', 'India', 510373, '+91-8184370354', 26.91022053630989, 75.7932583017192);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Das', 'Neurology', 'Das Health Clinic', '126 Kolkata Main Road', 'Kolkata', 'India', 354557, '+91-6273314950', 22.567811180972893, 88.37277316754844);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Singh', 'Neurology', 'Singh Health Clinic', '157 Delhi Main Road', 'Delhi', 'India', 978268, '+91-7907145824', 28.68630612958204, 77.1106195971395);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Ghosh', 'Neurology', 'Ghosh Health Clinic', '148 Lucknow Main Road', 'Lucknow', 'India', 648971, '+91-7170556254', 26.856525908559995, 80.95340136108292);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Rao', 'Neurology', 'Rao Health Clinic', '163 Lucknow Main Road', 'Lucknow', 'India', 527771, '+91-7181026201', 26.83815346115646, 80.9342218562404);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Mehta', 'Neurology', 'Mehta Health Clinic', '117 Ahmedabad Main Road', 'Ahmedabad', 'India', 960495, '+91-6637505237', 23.01923326833538, 72.5855669880214);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Sharma', 'Neurology', 'Sharma Health Clinic', '43 Lucknow Main Road', 'Lucknow', 'India', 569381, '+91-9400952587', 26.851734029961634, 80.95365329696901);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Kulkarni', 'Neurology', 'Kulkarni Health Clinic', '105 Ahmedabad Main Road', 'Ahmedabad', 'India', 136832, '+91-8498265514', 23.03491298342602, 72.5872375149603);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Krishnan', 'Neurology', 'Krishnan Health Clinic', '153 Ahmedabad Main Road', 'Ahmedabad', 'India', 417254, '+91-8653180577', 23.018277578380946, 72.58250416805062);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Krishnan', 'Neurology', 'Krishnan Health Clinic', '95 Bengaluru Main Road', 'Bengaluru', 'India', 844462, '+91-9939709709', 12.955983545160146, 77.58542685485371);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Khan', 'Neurology', 'Khan Health Clinic', '83 Delhi Main Road', 'Delhi', 'India', 915227, '+91-9586011323', 28.69819092504742, 77.09017479456952);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Rao', 'Neurology', 'Rao Health Clinic', '121 Chennai Main Road', 'Chennai', 'India', 659231, '+91-9831583348', 13.069436636416519, 80.27202970329648);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Sengupta', 'Neurology', 'Sengupta Health Clinic', '54 Kolkata Main Road', 'Kolkata', 'India', 397761, '+91-8850876713', 22.56443737550354, 88.35913760535881);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Singh', 'Neurology', 'Singh Health Clinic', '121 Mumbai Main Road', 'Mumbai', 'India', 748434, '+91-8052556858', 19.070290520000622, 72.89299591550294);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Rao', 'Neurology', 'Rao Health Clinic', '104 Ahmedabad Main Road', 'Ahmedabad', 'India', 315848, '+91-7467891739', 23.029473135872504, 72.55430031993764);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Mehta', 'Neurology', 'Mehta Health Clinic', '95 Lucknow Main Road', 'Lucknow', 'India', 560638, '+91-8622555126', 26.839812722487654, 80.95847575422498);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Ghosh', 'Neurology', 'Ghosh Health Clinic', '177 Kolkata Main Road', 'Kolkata', 'India', 372159, '+91-7237221846', 22.57654713319126, 88.35815811193343);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Krishnan', 'Neurology', 'Krishnan Health Clinic', '162 Kolkata Main Road', 'Kolkata', 'India', 322486, '+91-7951776981', 22.586827255873075, 88.37742560987618);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Sengupta', 'Neurology', 'Sengupta Health Clinic', '187 Pune Main Road', 'Pune', 'India', 422789, '+91-6007036207', 18.516456064496793, 73.84322059090275);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Krishnan', 'Neurology', 'Krishnan Health Clinic', '195 Delhi Main Road', 'Delhi', 'India', 904747, '+91-6782299012', 28.722278205638535, 77.10175842880909);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Chakraborty', 'Neurology', 'Chakraborty Health Clinic', '90 Lucknow Main Road', 'Lucknow', 'India', 594158, '+91-7572957523', 26.851073903986112, 80.94217554214534);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Chakraborty', 'Neurology', 'Chakraborty Health Clinic', '136 Chennai Main Road', 'Chennai', 'India', 847651, '+91-9341438604', 13.09561128339188, 80.258194170618);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Rao', 'Neurology', 'Rao Health Clinic', '38 Kolkata Main Road', 'Kolkata', 'India', 524248, '+91-6877484810', 22.57050564161967, 88.37500098307343);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Ghosh', 'Neurology', 'Ghosh Health Clinic', '171 Delhi Main Road', 'Delhi', 'India', 147514, '+91-6171986177', 28.724085768867234, 77.08634775924081);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Das', 'Neurology', 'Das Health Clinic', '72 Bengaluru Main Road', 'Bengaluru', 'India', 871538, '+91-6326993949', 12.977422867519206, 77.59179555113472);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Ghosh', 'Neurology', 'Ghosh Health Clinic', '118 Lucknow Main Road', 'Lucknow', 'India', 771995, '+91-8055777171', 26.846667448703524, 80.93865153395949);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Verma', 'Neurology', 'Verma Health Clinic', '166 Mumbai Main Road', 'Mumbai', 'India', 726103, '+91-7208113505', 19.095613384170395, 72.86450984956454);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Ghosh', 'Neurology', 'Ghosh Health Clinic', '127 Chennai Main Road', 'Chennai', 'India', 802033, '+91-8633106564', 13.097382517858708, 80.27282066429055);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Shah', 'Neurology', 'Shah Health Clinic', '62 Ahmedabad Main Road', 'Ahmedabad', 'India', 108852, '+91-7037788889', 23.011398297729727, 72.57355318146128);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Chakraborty', 'Neurology', 'Chakraborty Health Clinic', '79 Lucknow Main Road', 'Lucknow', 'India', 404961, '+91-7143785233', 26.82704303376806, 80.94911539370547);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Sengupta', 'Neurology', 'Sengupta Health Clinic', '37 Delhi Main Road', 'Delhi', 'India', 890023, '+91-6729645626', 28.72356991796019, 77.08594846996456);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Khan', 'Neurology', 'Khan Health Clinic', '100 Lucknow Main Road', 'Lucknow', 'India', 128577, '+91-9654592671', 26.8405868131796, 80.93725123381665);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Rao', 'Neurology', 'Rao Health Clinic', '101 Chennai Main Road', 'Chennai', 'India', 280269, '+91-9644453649', 13.079711734736254, 80.28320280792097);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Rao', 'Neurology', 'Rao Health Clinic', '136 Bengaluru Main Road', 'Bengaluru', 'India', 469626, '+91-7338021221', 12.961054009285618, 77.6109606606253);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Sharma', 'Neurology', 'Sharma Health Clinic', '170 Delhi Main Road', 'Delhi', 'India', 279057, '+91-6299878952', 28.704185556456295, 77.0969446973996);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Reddy', 'Neurology', 'Reddy Health Clinic', '55 Mumbai Main Road', 'Mumbai', 'India', 815686, '+91-6891980442', 19.071197136782324, 72.88647271917641);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Kulkarni', 'Neurology', 'Kulkarni Health Clinic', '121 Jaipur Main Road', 'Jaipur', 'India', 844047, '+91-6896965879', 26.901978469245346, 75.77295049081854);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Chakraborty', 'ENT', 'Chakraborty Health Clinic', '59 Pune Main Road', 'Pune', 'India', 162101, '+91-9473406985', 18.530855746354096, 73.85194728050462);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Patel', 'ENT', 'Patel Health Clinic', '127 Ahmedabad Main Road', 'Ahmedabad', 'India', 754415, '+91-9131813030', 23.029642929876488, 72.57694417445944);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Sengupta', 'ENT', 'Sengupta Health Clinic', '113 Lucknow Main Road', 'Lucknow', 'India', 284033, '+91-9441080586', 26.864906367911004, 80.9376679200497);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Patel', 'ENT', 'Patel Health Clinic', '121 Lucknow Main Road', 'Lucknow', 'India', 501583, '+91-8026770701', 26.835324801477775, 80.95912937518563);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Verma', 'ENT', 'Verma Health Clinic', '78 Kolkata Main Road', 'Kolkata', 'India', 135892, '+91-7879493088', 22.574424923454927, 88.34437778368726);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Khan', 'ENT', 'Khan Health Clinic', '56 Jaipur Main Road', 'Jaipur', 'India', 692549, '+91-8113376393', 26.89384120632084, 75.77815679904732);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Banerjee', 'ENT', 'Banerjee Health Clinic', '179 Kolkata Main Road', 'Kolkata', 'India', 645694, '+91-9379545019', 22.580139681664537, 88.38187660720423);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Chakraborty', 'ENT', 'Chakraborty Health Clinic', '14 Bengaluru Main Road', 'Bengaluru', 'India', 341022, '+91-6821970772', 12.975767704279772, 77.60475351594057);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Patel', 'ENT', 'Patel Health Clinic', '106 Bengaluru Main Road', 'Bengaluru', 'India', 173754, '+91-7664162063', 12.98370711225685, 77.60505100363588);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Khan', 'ENT', 'Khan Health Clinic', '154 Hyderabad Main Road', 'Hyderabad', 'India', 153029, '+91-6580967361', 17.37474067766719, 78.47781366352473);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Shah', 'ENT', 'Shah Health Clinic', '181 Chennai Main Road', 'Chennai', 'India', 882953, '+91-8970333018', 13.098692693624672, 80.25630258766759);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Kulkarni', 'ENT', 'Kulkarni Health Clinic', '62 Delhi Main Road', 'Delhi', 'India', 346543, '+91-6168570544', 28.691616380096505, 77.10657731241312);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Kulkarni', 'ENT', 'Kulkarni Health Clinic', '24 Hyderabad Main Road', 'Hyderabad', 'India', 750454, '+91-8872680225', 17.36743331655144, 78.46845670919836);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Khan', 'ENT', 'Khan Health Clinic', '173 Jaipur Main Road', 'Jaipur', 'India', 543004, '+91-7663898194', 26.924296648206617, 75.77277128320196);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Rao', 'ENT', 'Rao Health Clinic', '148 Mumbai Main Road', 'Mumbai', 'India', 728377, '+91-6640716082', 19.067787678484844, 72.88263098309432);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Verma', 'ENT', 'Verma Health Clinic', '125 Bengaluru Main Road', 'Bengaluru', 'India', 696880, '+91-7294253874', 12.955535942267352, 77.5986232597543);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Mehta', 'ENT', 'Mehta Health Clinic', '158 Mumbai Main Road', 'Mumbai', 'India', 166244, '+91-8269299873', 19.086395918935043, 72.89108705036845);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Verma', 'ENT', 'Verma Health Clinic', '196 Pune Main Road', 'Pune', 'India', 551069, '+91-6112914140', 18.52662062027775, 73.86226148128868);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'ENT', 'Banerjee Health Clinic', '79 Hyderabad Main Road', 'Hyderabad', 'India', 543606, '+91-6786525654', 17.39120516882591, 78.49105602048877);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Singh', 'ENT', 'Singh Health Clinic', '172 Delhi Main Road', 'Delhi', 'India', 466333, '+91-9160322132', 28.69569356594861, 77.08311949200781);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Kulkarni', 'ENT', 'Kulkarni Health Clinic', '83 Jaipur Main Road', 'Jaipur', 'India', 891888, '+91-8079869162', 26.92736807051604, 75.79590444820482);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Patel', 'ENT', 'Patel Health Clinic', '79 Jaipur Main Road', 'Jaipur', 'India', 258211, '+91-7980438706', 26.90275661380325, 75.78516186166216);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Singh', 'ENT', 'Singh Health Clinic', '81 Hyderabad Main Road', 'Hyderabad', 'India', 562003, '+91-6426641390', 17.3766648115669, 78.50592243634237);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Khan', 'ENT', 'Khan Health Clinic', '37 Bengaluru Main Road', 'Bengaluru', 'India', 566992, '+91-7659109717', 12.952410223457132, 77.57793930260412);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Chakraborty', 'ENT', 'Chakraborty Health Clinic', '138 Mumbai Main Road', 'Mumbai', 'India', 507309, '+91-6640548664', 19.05711327625773, 72.87924647985659);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Shah', 'ENT', 'Shah Health Clinic', '17 Bengaluru Main Road', 'Bengaluru', 'India', 808843, '+91-9331380402', 12.98087974080064, 77.60871206064225);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Banerjee', 'ENT', 'Banerjee Health Clinic', '14 Chennai Main Road', 'Chennai', 'India', 434917, '+91-9719264190', 13.075159136697293, 80.2723002325528);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Krishnan', 'ENT', 'Krishnan Health Clinic', '138 Kolkata Main Road', 'Kolkata', 'India', 956394, '+91-7005069480', 22.573491792286656, 88.34575626964967);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Rao', 'ENT', 'Rao Health Clinic', '171 Hyderabad Main Road', 'Hyderabad', 'India', 167143, '+91-9718414957', 17.396333110644775, 78.49579567873936);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Shah', 'ENT', 'Shah Health Clinic', '38 Jaipur Main Road', 'Jaipur', 'India', 444857, '+91-8216014356', 26.91286575815078, 75.79832158877257);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Reddy', 'ENT', 'Reddy Health Clinic', '14 Hyderabad Main Road', 'Hyderabad', 'India', 819643, '+91-8435888060', 17.381928993522326, 78.48042381264972);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Ghosh', 'ENT', 'Ghosh Health Clinic', '179 Chennai Main Road', 'Chennai', 'India', 930846, '+91-9897177105', 13.086766772239486, 80.2561663625026);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Das', 'ENT', 'Das Health Clinic', '104 Pune Main Road', 'Pune', 'India', 364110, '+91-7505984832', 18.529582434751692, 73.87261198989093);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Khan', 'ENT', 'Khan Health Clinic', '154 Chennai Main Road', 'Chennai', 'India', 442261, '+91-8840644868', 13.101345935997344, 80.27754926189681);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Khan', 'ENT', 'Khan Health Clinic', '130 Chennai Main Road', 'Chennai', 'India', 474491, '+91-7156142157', 13.080537780600583, 80.2603633081292);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Shah', 'ENT', 'Shah Health Clinic', '149 Pune Main Road', 'Pune', 'India', 888237, '+91-6752765469', 18.51151595639629, 73.83938458006521);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Chakraborty', 'ENT', 'Chakraborty Health Clinic', '31 Kolkata Main Road', 'Kolkata', 'India', 831963, '+91-9236006233', 22.571867229824413, 88.35280141654725);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Sengupta', 'ENT', 'Sengupta Health Clinic', '199 Hyderabad Main Road', 'Hyderabad', 'India', 454799, '+91-8097994422', 17.370883542093246, 78.49134029957335);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Shah', 'ENT', 'Shah Health Clinic', '61 Ahmedabad Main Road', 'Ahmedabad', 'India', 250887, '+91-9918310143', 23.007082474675535, 72.57369679258268);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Das', 'ENT', 'Das Health Clinic', '53 Mumbai Main Road', 'Mumbai', 'India', 992752, '+91-9682899246', 19.07378859638679, 72.89167895027278);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Kulkarni', 'ENT', 'Kulkarni Health Clinic', '191 Ahmedabad Main Road', 'Ahmedabad', 'India', 986974, '+91-7898138575', 23.039716951500303, 72.57201522036651);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Verma', 'ENT', 'Verma Health Clinic', '148 Lucknow Main Road', 'Lucknow', 'India', 505394, '+91-9288050559', 26.860350804555434, 80.94716174231144);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Verma', 'ENT', 'Verma Health Clinic', '91 Ahmedabad Main Road', 'Ahmedabad', 'India', 383474, '+91-8777009344', 23.014557854472812, 72.56838488008194);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Banerjee', 'ENT', 'Banerjee Health Clinic', '32 Bengaluru Main Road', 'Bengaluru', 'India', 172380, '+91-8222899376', 12.97740720007487, 77.5968653051837);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Chakraborty', 'ENT', 'Chakraborty Health Clinic', '133 Hyderabad Main Road', 'Hyderabad', 'India', 385078, '+91-9293085600', 17.395273201473103, 78.49688185379526);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Das', 'ENT', 'Das Health Clinic', '38 Jaipur Main Road', 'Jaipur', 'India', 280329, '+91-7084816017', 26.902969813301425, 75.78962336272346);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Shah', 'ENT', 'Shah Health Clinic', '132 Jaipur Main Road', 'Jaipur', 'India', 429917, '+91-7926291394', 26.90845407039281, 75.79935646485313);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Reddy', 'ENT', 'Reddy Health Clinic', '118 Bengaluru Main Road', 'Bengaluru', 'India', 470268, '+91-7431513890', 12.98883790067272, 77.60426010193466);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Kulkarni', 'ENT', 'Kulkarni Health Clinic', '144 Lucknow Main Road', 'Lucknow', 'India', 750463, '+91-8052397682', 26.842110276250715, 80.93311017432082);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Singh', 'ENT', 'Singh Health Clinic', '86 Ahmedabad Main Road', 'Ahmedabad', 'India', 262668, '+91-8982615391', 23.023155306547128, 72.55977244345192);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Kulkarni', 'ENT', 'Kulkarni Health Clinic', '75 Bengaluru Main Road', 'Bengaluru', 'India', 759240, '+91-8770981896', 12.960125894830254, 77.58043561955743);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Patel', 'ENT', 'Patel Health Clinic', '188 Delhi Main Road', 'Delhi', 'India', 895124, '+91-6904038389', 28.723984608070154, 77.09664479473794);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Singh', 'ENT', 'Singh Health Clinic', '195 Bengaluru Main Road', 'Bengaluru', 'India', 795365, '+91-9849818376', 12.974596509852375, 77.57598040549995);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Rao', 'ENT', 'Rao Health Clinic', '48 Lucknow Main Road', 'Lucknow', 'India', 662839, '+91-7508438995', 26.8330504045609, 80.93281140342265);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Reddy', 'ENT', 'Reddy Health Clinic', '75 Hyderabad Main Road', 'Hyderabad', 'India', 405580, '+91-6697010623', 17.393248560056875, 78.50523295196695);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Ghosh', 'ENT', 'Ghosh Health Clinic', '160 Kolkata Main Road', 'Kolkata', 'India', 799067, '+91-8509500131', 22.556917191872515, 88.35941442059867);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Ghosh', 'ENT', 'Ghosh Health Clinic', '176 Bengaluru Main Road', 'Bengaluru', 'India', 896503, '+91-6813244496', 12.967940511728118, 77.60876608157585);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Sharma', 'ENT', 'Sharma Health Clinic', '87 Bengaluru Main Road', 'Bengaluru', 'India', 741475, '+91-6594431921', 12.990247986103324, 77.61150189157505);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Rao', 'ENT', 'Rao Health Clinic', '66 Ahmedabad Main Road', 'Ahmedabad', 'India', 526195, '+91-9637441417', 23.027269847481648, 72.5831703091572);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Mehta', 'ENT', 'Mehta Health Clinic', '128 Ahmedabad Main Road', 'Ahmedabad', 'India', 251150, '+91-6174580085', 23.00513073834255, 72.57346603952782);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Rao', 'ENT', 'Rao Health Clinic', '44 Jaipur Main Road', 'Jaipur', 'India', 134201, '+91-7067536693', 26.9224847513373, 75.77960876212317);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Chakraborty', 'ENT', 'Chakraborty Health Clinic', '37 Bengaluru Main Road', 'Bengaluru', 'India', 533678, '+91-8892721617', 12.974396122683046, 77.58153470946175);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Das', 'Psychiatry', 'Das Health Clinic', '102 Hyderabad Main Road', 'Hyderabad', 'India', 791494, '+91-6803376522', 17.389814388773203, 78.46933377255226);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Patel', 'Psychiatry', 'Patel Health Clinic', '118 Delhi Main Road', 'Delhi', 'India', 955883, '+91-7272116989', 28.706638790424186, 77.1033521208613);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Sharma', 'Psychiatry', 'Sharma Health Clinic', '106 Chennai Main Road', 'Chennai', 'India', 351385, '+91-9032574962', 13.075085710431312, 80.287788487184);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Khan', 'Psychiatry', 'Khan Health Clinic', '200 Pune Main Road', 'Pune', 'India', 311143, '+91-6413546707', 18.52409622899325, 73.8503385145532);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Khan', 'Psychiatry', 'Khan Health Clinic', '93 Ahmedabad Main Road', 'Ahmedabad', 'India', 625979, '+91-9733206979', 23.034645464495252, 72.55417077861969);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '36 Ahmedabad Main Road', 'Ahmedabad', 'India', 299907, '+91-9753018589', 23.010356982775168, 72.56909651763698);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Das', 'Psychiatry', 'Das Health Clinic', '105 Ahmedabad Main Road', 'Ahmedabad', 'India', 221857, '+91-9390905983', 23.031062670493224, 72.58595693220511);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Krishnan', 'Psychiatry', 'Krishnan Health Clinic', '18 Jaipur Main Road', 'Jaipur', 'India', 233205, '+91-8134736313', 26.895325959690656, 75.76875329599993);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Sharma', 'Psychiatry', 'Sharma Health Clinic', '189 Jaipur Main Road', 'Jaipur', 'India', 719704, '+91-6723539419', 26.927352748869268, 75.76977651534227);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Sengupta', 'Psychiatry', 'Sengupta Health Clinic', '199 Bengaluru Main Road', 'Bengaluru', 'India', 344978, '+91-9146217243', 12.97346877646439, 77.58739093138968);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Patel', 'Psychiatry', 'Patel Health Clinic', '46 Chennai Main Road', 'Chennai', 'India', 367543, '+91-8597965323', 13.083222333287786, 80.26643582884716);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Das', 'Psychiatry', 'Das Health Clinic', '133 Ahmedabad Main Road', 'Ahmedabad', 'India', 692155, '+91-9000975418', 23.00367477457342, 72.55557890941449);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Sengupta', 'Psychiatry', 'Sengupta Health Clinic', '142 Hyderabad Main Road', 'Hyderabad', 'India', 347525, '+91-7537653502', 17.38295257665431, 78.49139146498844);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Reddy', 'Psychiatry', 'Reddy Health Clinic', '66 Lucknow Main Road', 'Lucknow', 'India', 244208, '+91-9626173248', 26.851538028649223, 80.9433883063857);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'Psychiatry', 'Banerjee Health Clinic', '115 Delhi Main Road', 'Delhi', 'India', 719671, '+91-7885830434', 28.720123110519356, 77.10549458676529);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Patel', 'Psychiatry', 'Patel Health Clinic', '193 Mumbai Main Road', 'Mumbai', 'India', 585818, '+91-7676156904', 19.084617253994857, 72.89132032810292);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Chakraborty', 'Psychiatry', 'Chakraborty Health Clinic', '153 Delhi Main Road', 'Delhi', 'India', 754045, '+91-6613674040', 28.69600999865453, 77.11999746833979);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Khan', 'Psychiatry', 'Khan Health Clinic', '177 Mumbai Main Road', 'Mumbai', 'India', 352155, '+91-9465756300', 19.091545201438503, 72.85903178252897);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Patel', 'Psychiatry', 'Patel Health Clinic', '68 Hyderabad Main Road', 'Hyderabad', 'India', 960416, '+91-7857924601', 17.402344245242595, 78.47795490313925);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Shah', 'Psychiatry', 'Shah Health Clinic', '101 Lucknow Main Road', 'Lucknow', 'India', 643010, '+91-7161691639', 26.863256327266875, 80.93130932087132);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '199 Mumbai Main Road', 'Mumbai', 'India', 241609, '+91-7574312746', 19.061440183203867, 72.88100164855467);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Banerjee', 'Psychiatry', 'Banerjee Health Clinic', '161 Hyderabad Main Road', 'Hyderabad', 'India', 686140, '+91-8814245895', 17.378452809660857, 78.47266867393165);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Banerjee', 'Psychiatry', 'Banerjee Health Clinic', '66 Kolkata Main Road', 'Kolkata', 'India', 149052, '+91-6612216033', 22.56348039709878, 88.368873690138);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Khan', 'Psychiatry', 'Khan Health Clinic', '127 Hyderabad Main Road', 'Hyderabad', 'India', 130249, '+91-6805533631', 17.398350678574648, 78.50328222843868);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Sharma', 'Psychiatry', 'Sharma Health Clinic', '103 Delhi Main Road', 'Delhi', 'India', 569951, '+91-8286524802', 28.687801896275694, 77.09100682532717);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Das', 'Psychiatry', 'Das Health Clinic', '78 Bengaluru Main Road', 'Bengaluru', 'India', 523191, '+91-8300566085', 12.96297092541871, 77.59394297981584);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Sengupta', 'Psychiatry', 'Sengupta Health Clinic', '186 Mumbai Main Road', 'Mumbai', 'India', 404523, '+91-6069825492', 19.090437110972466, 72.89655101044946);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Verma', 'Psychiatry', 'Verma Health Clinic', '141 Bengaluru Main Road', 'Bengaluru', 'India', 209681, '+91-6449860864', 12.97160649681685, 77.58443414600974);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Das', 'Psychiatry', 'Das Health Clinic', '61 Lucknow Main Road', 'Lucknow', 'India', 708948, '+91-9101871550', 26.856111438314993, 80.94657987920917);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Verma', 'Psychiatry', 'Verma Health Clinic', '23 Ahmedabad Main Road', 'Ahmedabad', 'India', 662972, '+91-9300723303', 23.028180782127553, 72.57775438134588);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Reddy', 'Psychiatry', 'Reddy Health Clinic', '178 Ahmedabad Main Road', 'Ahmedabad', 'India', 616308, '+91-7565436055', 23.010093569950776, 72.58259582827237);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Khan', 'Psychiatry', 'Khan Health Clinic', '62 Ahmedabad Main Road', 'Ahmedabad', 'India', 334604, '+91-8080687842', 23.03014822499184, 72.55262374174966);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Khan', 'Psychiatry', 'Khan Health Clinic', '133 Delhi Main Road', 'Delhi', 'India', 169697, '+91-8756624897', 28.717655870643426, 77.09301148135552);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Rao', 'Psychiatry', 'Rao Health Clinic', '42 Kolkata Main Road', 'Kolkata', 'India', 461196, '+91-8836320751', 22.581489627227423, 88.35589924938245);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Sengupta', 'Psychiatry', 'Sengupta Health Clinic', '105 Lucknow Main Road', 'Lucknow', 'India', 303788, '+91-8165070975', 26.85056624043033, 80.95469079716828);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Chakraborty', 'Psychiatry', 'Chakraborty Health Clinic', '125 Pune Main Road', 'Pune', 'India', 488873, '+91-9566461630', 18.5206947444168, 73.8515102996227);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Verma', 'Psychiatry', 'Verma Health Clinic', '28 Kolkata Main Road', 'Kolkata', 'India', 900717, '+91-7314350564', 22.565648826446484, 88.38349405789512);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Chakraborty', 'Psychiatry', 'Chakraborty Health Clinic', '124 Mumbai Main Road', 'Mumbai', 'India', 300663, '+91-7885351164', 19.08429911761281, 72.88792305470574);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Shah', 'Psychiatry', 'Shah Health Clinic', '181 Kolkata Main Road', 'Kolkata', 'India', 653725, '+91-7526458982', 22.57971178251436, 88.38302006437516);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Ghosh', 'Psychiatry', 'Ghosh Health Clinic', '166 Chennai Main Road', 'Chennai', 'India', 257451, '+91-9348062347', 13.074989039453104, 80.27132823652752);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Sharma', 'Psychiatry', 'Sharma Health Clinic', '87 Ahmedabad Main Road', 'Ahmedabad', 'India', 322618, '+91-9548404068', 23.03809800672319, 72.55871197649086);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Sengupta', 'Psychiatry', 'Sengupta Health Clinic', '134 Hyderabad Main Road', 'Hyderabad', 'India', 810168, '+91-8088641529', 17.39626615226964, 78.49240530380052);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Reddy', 'Psychiatry', 'Reddy Health Clinic', '137 Hyderabad Main Road', 'Hyderabad', 'India', 445115, '+91-6093926984', 17.39549734445974, 78.48958183015877);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '195 Mumbai Main Road', 'Mumbai', 'India', 328427, '+91-6381743864', 19.07407358548342, 72.87776351022826);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '92 Chennai Main Road', 'Chennai', 'India', 799610, '+91-9548676383', 13.09765245038299, 80.25634822955507);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Chakraborty', 'Psychiatry', 'Chakraborty Health Clinic', '129 Delhi Main Road', 'Delhi', 'India', 576183, '+91-9114552942', 28.707486074975982, 77.1036301547205);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Chakraborty', 'Psychiatry', 'Chakraborty Health Clinic', '26 Kolkata Main Road', 'Kolkata', 'India', 160866, '+91-9655072083', 22.588328751315203, 88.35356427695254);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Mehta', 'Psychiatry', 'Mehta Health Clinic', '78 Jaipur Main Road', 'Jaipur', 'India', 629751, '+91-9248979309', 26.90203973522333, 75.7847501804945);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Reddy', 'Psychiatry', 'Reddy Health Clinic', '123 Mumbai Main Road', 'Mumbai', 'India', 189480, '+91-9851014504', 19.094269970317374, 72.89085344731397);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Verma', 'Psychiatry', 'Verma Health Clinic', '22 Jaipur Main Road', 'Jaipur', 'India', 439078, '+91-7985899770', 26.894524483976124, 75.78410409587119);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '16 Jaipur Main Road', 'Jaipur', 'India', 157262, '+91-6340041190', 26.91154095268552, 75.79541374634164);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Verma', 'Psychiatry', 'Verma Health Clinic', '78 Mumbai Main Road', 'Mumbai', 'India', 824107, '+91-6988049542', 19.062281578805585, 72.8592660872432);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Mehta', 'Psychiatry', 'Mehta Health Clinic', '100 Pune Main Road', 'Pune', 'India', 647983, '+91-6711847412', 18.52101096515532, 73.85841411873555);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Mehta', 'Psychiatry', 'Mehta Health Clinic', '107 Delhi Main Road', 'Delhi', 'India', 904601, '+91-8980088807', 28.70232256291867, 77.10460293913295);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '24 Chennai Main Road', 'Chennai', 'India', 471399, '+91-6035011261', 13.070332113791714, 80.2711102595467);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Reddy', 'Psychiatry', 'Reddy Health Clinic', '81 Chennai Main Road', 'Chennai', 'India', 796235, '+91-7271309560', 13.101746667348891, 80.26145255417727);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Reddy', 'Psychiatry', 'Reddy Health Clinic', '50 Chennai Main Road', 'Chennai', 'India', 759269, '+91-8882465950', 13.091429116417604, 80.2803692355897);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Khan', 'Psychiatry', 'Khan Health Clinic', '70 Chennai Main Road', 'Chennai', 'India', 856037, '+91-9371862805', 13.085471260594588, 80.27602618459758);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Mehta', 'Psychiatry', 'Mehta Health Clinic', '87 Delhi Main Road', 'Delhi', 'India', 804024, '+91-9793835708', 28.699801910460295, 77.09697088368185);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Sharma', 'Psychiatry', 'Sharma Health Clinic', '51 Kolkata Main Road', 'Kolkata', 'India', 167457, '+91-6451672601', 22.583861983606862, 88.37302262088646);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Rao', 'Psychiatry', 'Rao Health Clinic', '85 Jaipur Main Road', 'Jaipur', 'India', 129283, '+91-8329924933', 26.932229637011645, 75.7851638930918);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Kulkarni', 'Psychiatry', 'Kulkarni Health Clinic', '12 Hyderabad Main Road', 'Hyderabad', 'India', 190496, '+91-8476496230', 17.399843911468725, 78.50613811155058);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Sengupta', 'Urology', 'Sengupta Health Clinic', '73 Jaipur Main Road', 'Jaipur', 'India', 274014, '+91-7824182389', 26.896195528665643, 75.806916562098);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Sharma', 'Urology', 'Sharma Health Clinic', '73 Chennai Main Road', 'Chennai', 'India', 775573, '+91-6495639538', 13.092608376314104, 80.2723448363606);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Banerjee', 'Urology', 'Banerjee Health Clinic', '54 Lucknow Main Road', 'Lucknow', 'India', 128871, '+91-6960019677', 26.852362303344467, 80.96251731773683);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Singh', 'Urology', 'Singh Health Clinic', '113 Hyderabad Main Road', 'Hyderabad', 'India', 677752, '+91-8599211617', 17.373871010788825, 78.46758969891667);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Latha Chakraborty', 'Urology', 'Chakraborty Health Clinic', '44 Delhi Main Road', 'Delhi', 'India', 906566, '+91-9104200490', 28.713667539821447, 77.08865036781208);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Patel', 'Urology', 'Patel Health Clinic', '82 Chennai Main Road', 'Chennai', 'India', 316703, '+91-8242661500', 13.098396970017381, 80.27345260214368);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Patel', 'Urology', 'Patel Health Clinic', '41 Chennai Main Road', 'Chennai', 'India', 698875, '+91-6932779188', 13.098738236114501, 80.27723269864691);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nidhi Das', 'Urology', 'Das Health Clinic', '57 Mumbai Main Road', 'Mumbai', 'India', 198463, '+91-7132778784', 19.060170459099606, 72.86871655605952);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Shah', 'Urology', 'Shah Health Clinic', '88 Delhi Main Road', 'Delhi', 'India', 420433, '+91-6087763520', 28.708166284031236, 77.08610739782014);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Reddy', 'Urology', 'Reddy Health Clinic', '156 Kolkata Main Road', 'Kolkata', 'India', 233908, '+91-6170888609', 22.564402386886044, 88.3539828802304);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Shah', 'Urology', 'Shah Health Clinic', '48 Mumbai Main Road', 'Mumbai', 'India', 711127, '+91-6088638630', 19.063879459224832, 72.88430451748347);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sharma', 'Urology', 'Sharma Health Clinic', '98 Ahmedabad Main Road', 'Ahmedabad', 'India', 520963, '+91-6090354427', 23.033572901992617, 72.5690436518751);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rupal Chakraborty', 'Urology', 'Chakraborty Health Clinic', '46 Mumbai Main Road', 'Mumbai', 'India', 688016, '+91-8172024754', 19.08794625509385, 72.88635898928672);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Sharma', 'Urology', 'Sharma Health Clinic', '21 Jaipur Main Road', 'Jaipur', 'India', 812732, '+91-6648197277', 26.91157581663386, 75.79178254665977);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Patel', 'Urology', 'Patel Health Clinic', '102 Lucknow Main Road', 'Lucknow', 'India', 168777, '+91-6573065112', 26.851009007565743, 80.9280946301502);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Patel', 'Urology', 'Patel Health Clinic', '18 Jaipur Main Road', 'Jaipur', 'India', 441321, '+91-7755622706', 26.9046332718521, 75.7952497631404);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Reddy', 'Urology', 'Reddy Health Clinic', '149 Kolkata Main Road', 'Kolkata', 'India', 470446, '+91-8888731564', 22.576016917133963, 88.36465523287956);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Manish Chakraborty', 'Urology', 'Chakraborty Health Clinic', '53 Hyderabad Main Road', 'Hyderabad', 'India', 856120, '+91-8283391338', 17.390026351114972, 78.50196799766873);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Mehta', 'Urology', 'Mehta Health Clinic', '62 Hyderabad Main Road', 'Hyderabad', 'India', 640350, '+91-6606100499', 17.368414953591895, 78.50232972037);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Patel', 'Urology', 'Patel Health Clinic', '98 Jaipur Main Road', 'Jaipur', 'India', 168351, '+91-8488080873', 26.922341709092734, 75.79818141096713);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Sengupta', 'Urology', 'Sengupta Health Clinic', '137 Lucknow Main Road', 'Lucknow', 'India', 219839, '+91-8151140348', 26.83983946818696, 80.93361925939263);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Khan', 'Urology', 'Khan Health Clinic', '23 Mumbai Main Road', 'Mumbai', 'India', 984119, '+91-6565789040', 19.081537378396757, 72.88730927661862);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Singh', 'Urology', 'Singh Health Clinic', '108 Jaipur Main Road', 'Jaipur', 'India', 977464, '+91-6629218839', 26.900964853633937, 75.78263450781348);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sayan Sengupta', 'Urology', 'Sengupta Health Clinic', '134 Lucknow Main Road', 'Lucknow', 'India', 889599, '+91-6386148768', 26.828907600082303, 80.93921111134719);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Patel', 'Urology', 'Patel Health Clinic', '37 Delhi Main Road', 'Delhi', 'India', 146725, '+91-6167574943', 28.688267532290702, 77.1124913400165);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'Urology', 'Banerjee Health Clinic', '57 Kolkata Main Road', 'Kolkata', 'India', 673379, '+91-6334634344', 22.572649283862624, 88.36670006230051);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Chakraborty', 'Urology', 'Chakraborty Health Clinic', '120 Kolkata Main Road', 'Kolkata', 'India', 540801, '+91-6860791944', 22.556921394586528, 88.34434602507189);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Sharma', 'Urology', 'Sharma Health Clinic', '146 Pune Main Road', 'Pune', 'India', 528784, '+91-7467509312', 18.506005275769528, 73.86342457453739);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Das', 'Urology', 'Das Health Clinic', '171 Mumbai Main Road', 'Mumbai', 'India', 466478, '+91-9102256246', 19.09128034404953, 72.8593399748629);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Patel', 'Urology', 'Patel Health Clinic', '189 Delhi Main Road', 'Delhi', 'India', 846780, '+91-6963529545', 28.718848046502238, 77.1123534305202);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Banerjee', 'Urology', 'Banerjee Health Clinic', '60 Hyderabad Main Road', 'Hyderabad', 'India', 881253, '+91-9886290854', 17.384807243062284, 78.47977723518011);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Reddy', 'Urology', 'Reddy Health Clinic', '162 Hyderabad Main Road', 'Hyderabad', 'India', 685027, '+91-7098639141', 17.37833887443694, 78.50448834353631);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Patel', 'Urology', 'Patel Health Clinic', '88 Bengaluru Main Road', 'Bengaluru', 'India', 886512, '+91-6891592739', 12.952854661514763, 77.57713397652228);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Patel', 'Urology', 'Patel Health Clinic', '42 Ahmedabad Main Road', 'Ahmedabad', 'India', 330585, '+91-9997697351', 23.021838617888214, 72.5573360422745);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Chakraborty', 'Urology', 'Chakraborty Health Clinic', '11 Ahmedabad Main Road', 'Ahmedabad', 'India', 947888, '+91-7893046947', 23.020107324746927, 72.56017731160786);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Jay Mehta', 'Urology', 'Mehta Health Clinic', '45 Jaipur Main Road', 'Jaipur', 'India', 304962, '+91-9054917222', 26.90290856269286, 75.78009831054598);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Arjun Das', 'Urology', 'Das Health Clinic', '75 Hyderabad Main Road', 'Hyderabad', 'India', 167002, '+91-7736701099', 17.39252219245284, 78.47382492358642);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Reddy', 'Urology', 'Reddy Health Clinic', '140 Bengaluru Main Road', 'Bengaluru', 'India', 945202, '+91-6385336395', 12.986655394303202, 77.59518819833555);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Shah', 'Urology', 'Shah Health Clinic', '188 Bengaluru Main Road', 'Bengaluru', 'India', 345110, '+91-6620832786', 12.961158687933118, 77.6093424779156);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Sengupta', 'Urology', 'Sengupta Health Clinic', '65 Chennai Main Road', 'Chennai', 'India', 359879, '+91-9452964348', 13.074829115758849, 80.25259176274595);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rohan Chakraborty', 'Urology', 'Chakraborty Health Clinic', '173 Mumbai Main Road', 'Mumbai', 'India', 455780, '+91-8120870207', 19.05924338733348, 72.87948516941037);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Singh', 'Urology', 'Singh Health Clinic', '100 Hyderabad Main Road', 'Hyderabad', 'India', 281312, '+91-7951825224', 17.400907676731205, 78.50444136108946);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Sengupta', 'Urology', 'Sengupta Health Clinic', '149 Pune Main Road', 'Pune', 'India', 184781, '+91-7084372118', 18.506959561376124, 73.87575759109848);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anirban Ghosh', 'Urology', 'Ghosh Health Clinic', '124 Ahmedabad Main Road', 'Ahmedabad', 'India', 146168, '+91-8080562572', 23.017921122414165, 72.57703743935083);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sunita Patel', 'Urology', 'Patel Health Clinic', '59 Pune Main Road', 'Pune', 'India', 669622, '+91-9899698015', 18.52674808966971, 73.85554558698476);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Sharma', 'Urology', 'Sharma Health Clinic', '150 Delhi Main Road', 'Delhi', 'India', 951757, '+91-9093141353', 28.69146227366247, 77.0988140546409);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Nirmala Krishnan', 'Urology', 'Krishnan Health Clinic', '107 Mumbai Main Road', 'Mumbai', 'India', 760286, '+91-9609209117', 19.07083414681331, 72.87787842215052);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Banerjee', 'Urology', 'Banerjee Health Clinic', '181 Lucknow Main Road', 'Lucknow', 'India', 816784, '+91-8751432958', 26.839358406829263, 80.95726829363153);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Khan', 'Urology', 'Khan Health Clinic', '200 Delhi Main Road', 'Delhi', 'India', 254719, '+91-9040797166', 28.71338763636298, 77.11669142848386);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Hina Shah', 'Urology', 'Shah Health Clinic', '197 Chennai Main Road', 'Chennai', 'India', 192238, '+91-9567422728', 13.085561381921842, 80.25531581960949);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rajesh Patel', 'Urology', 'Patel Health Clinic', '188 Delhi Main Road', 'Delhi', 'India', 594813, '+91-8840710136', 28.696150189055153, 77.1020976258016);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Ritu Chakraborty', 'Urology', 'Chakraborty Health Clinic', '146 Bengaluru Main Road', 'Bengaluru', 'India', 696916, '+91-8551415879', 12.982234172881965, 77.58697229246259);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Vikram Reddy', 'Urology', 'Reddy Health Clinic', '96 Jaipur Main Road', 'Jaipur', 'India', 976926, '+91-6301360138', 26.90540878458205, 75.77750999974178);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Chakraborty', 'Urology', 'Chakraborty Health Clinic', '168 Jaipur Main Road', 'Jaipur', 'India', 319228, '+91-9570904075', 26.911660241464876, 75.77015553816598);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Anil Sharma', 'Urology', 'Sharma Health Clinic', '11 Hyderabad Main Road', 'Hyderabad', 'India', 643346, '+91-9576931540', 17.36897232733015, 78.49379557473952);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Rita Kulkarni', 'Urology', 'Kulkarni Health Clinic', '19 Kolkata Main Road', 'Kolkata', 'India', 952468, '+91-6419770415', 22.557095544419475, 88.38097467948921);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Kavita Ghosh', 'Urology', 'Ghosh Health Clinic', '176 Jaipur Main Road', 'Jaipur', 'India', 311357, '+91-7903900431', 26.911650998158066, 75.76828863166442);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Aditi Kulkarni', 'Urology', 'Kulkarni Health Clinic', '75 Delhi Main Road', 'Delhi', 'India', 702987, '+91-7593255628', 28.722206138039045, 77.11918591191669);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Sneha Rao', 'Urology', 'Rao Health Clinic', '73 Jaipur Main Road', 'Jaipur', 'India', 887098, '+91-8647503583', 26.928534884042794, 75.77051542253139);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Meera Das', 'Urology', 'Das Health Clinic', '15 Ahmedabad Main Road', 'Ahmedabad', 'India', 196677, '+91-7217372985', 23.018663815337757, 72.55153368024789);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Farheen Patel', 'Urology', 'Patel Health Clinic', '103 Lucknow Main Road', 'Lucknow', 'India', 480106, '+91-9189308409', 26.843418874829236, 80.9613966735056);
-INSERT INTO doctors (name, specialty, clinic, address, city, state, pincode, phone, lat, lng) VALUES ('Dr. Priya Khan', 'Urology', 'Khan Health Clinic', '98 Kolkata Main Road', 'Kolkata', 'India', 149661, '+91-7786720618', 22.55535934373647, 88.3743713859408);
@@ -1,26 +1,48 @@
-import json, random
+"""
+Synthetic data generator for the doctor directory and load-test datasets.
+
+Every record is produced by a generator and written as soon as it is made,
+so output size is bounded by disk, not memory: millions of doctors, patients,
+requests and appointments can be generated on a laptop.
+
+Run:
+    python generate_doctors.py
+        # default: 500 doctors -> doctors.json, doctors_ml_dataset.json
+    python generate_doctors.py --doctors 2000000 --format ndjson.gz --density population \\
+        --patients 200000 --requests 1000000 --appointments 400000 --out-dir data/
+
+Users, requests and appointments follow the columns of app/models.py
+(users, requests, appointments) and reference each other consistently:
+appointment N books request N, both owned by the same patient and handled
+by a doctor account of the request's specialty, with no overlapping slots.
+
+To put the directory into the database, use the bulk loader:
+    python -m app.load_doctors doctors.json
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+from datetime import datetime, timedelta
 
 specialties = [
     "Cardiology", "Dermatology", "Orthopedics", "Gynecology",
     "Neurology", "ENT", "Psychiatry", "Urology",
 ]
 
-# Balanced counts
-TOTAL = 500
-PER_SPEC = TOTAL // len(specialties)
-
-# Random Indian cities + coordinates (approx)
+# Indian cities + coordinates (approx) + population weight (millions, approx)
 cities = [
-    ("Bengaluru", 12.9716, 77.5946),
-    ("Mumbai", 19.0760, 72.8777),
-    ("Delhi", 28.7041, 77.1025),
-    ("Kolkata", 22.5726, 88.3639),
-    ("Chennai", 13.0827, 80.2707),
-    ("Hyderabad", 17.3850, 78.4867),
-    ("Pune", 18.5204, 73.8567),
-    ("Ahmedabad", 23.0225, 72.5714),
-    ("Jaipur", 26.9124, 75.7873),
-    ("Lucknow", 26.8467, 80.9462)
+    ("Bengaluru", 12.9716, 77.5946, 13.2),
+    ("Mumbai", 19.0760, 72.8777, 21.3),
+    ("Delhi", 28.7041, 77.1025, 32.9),
+    ("Kolkata", 22.5726, 88.3639, 15.3),
+    ("Chennai", 13.0827, 80.2707, 11.8),
+    ("Hyderabad", 17.3850, 78.4867, 10.8),
+    ("Pune", 18.5204, 73.8567, 7.2),
+    ("Ahmedabad", 23.0225, 72.5714, 8.6),
+    ("Jaipur", 26.9124, 75.7873, 4.1),
+    ("Lucknow", 26.8467, 80.9462, 3.9)
 ]
 
 first_names = ["Arjun","Meera","Kavita","Rohan","Sneha","Manish","Vikram","Ritu",
@@ -30,60 +52,283 @@ first_names = ["Arjun","Meera","Kavita","Rohan","Sneha","Manish","Vikram","Ritu"
 last_names = ["Mehta","Sharma","Rao","Patel","Sengupta","Ghosh","Banerjee","Reddy",
               "Chakraborty","Verma","Singh","Kulkarni","Das","Shah","Krishnan","Khan"]
 
-def random_phone():
-    return "+91-" + str(random.randint(6000000000, 9999999999))
+symptoms = {
+    "Cardiology": ["Chest pain", "Palpitations", "Shortness of breath"],
+    "Dermatology": ["Skin rash", "Itching", "Acne"],
+    "Orthopedics": ["Knee pain", "Back pain", "Sprained ankle"],
+    "Gynecology": ["Irregular periods", "Pelvic pain", "Pregnancy check"],
+    "Neurology": ["Headache", "Numbness", "Dizziness"],
+    "ENT": ["Ear pain", "Sore throat", "Sinus congestion"],
+    "Psychiatry": ["Anxiety", "Low mood", "Trouble sleeping"],
+    "Urology": ["Painful urination", "Kidney pain", "Frequent urination"],
+}
 
-def jitter(coord):
-    return coord + random.uniform(-0.02, 0.02)
+DENSITIES = ("uniform", "population", "zipf")
+FORMATS = ("json", "ndjson", "ndjson.gz")
+REQUEST_STATUSES = ["pending", "new", "viewed", "rejected"]
+APPOINTMENT_MODES = ["in_person", "video", "phone"]
 
-doctors = []
 
-for spec in specialties:
-    for _ in range(PER_SPEC):
-        fname = random.choice(first_names)
-        lname = random.choice(last_names)
-        name = f"Dr. {fname} {lname}"
+def load_cities(path):
+    """City list from a JSON file of {name, lat, lng[, weight]} objects."""
+    with open(path) as f:
+        return [(c["name"], c["lat"], c["lng"], c.get("weight", 1.0)) for c in json.load(f)]
 
-        city, lat, lng = random.choice(cities)
-        doc = {
-            "name": name,
+
+def city_weights(city_list, density):
+    if density == "uniform":
+        return [1.0] * len(city_list)
+    if density == "population":
+        return [c[3] for c in city_list]
+    # zipf: rank cities by weight, the k-th largest gets 1/k of the demand
+    order = sorted(range(len(city_list)), key=lambda i: city_list[i][3], reverse=True)
+    weights = [0.0] * len(city_list)
+    for rank, i in enumerate(order, start=1):
+        weights[i] = 1.0 / rank
+    return weights
+
+
+def random_phone(rng):
+    return "+91-" + str(rng.randint(6000000000, 9999999999))
+
+
+def jitter(rng, coord, spread):
+    return coord + rng.uniform(-spread, spread)
+
+
+def iter_doctors(rng, count, city_list, weights, spread):
+    """Directory doctors, balanced across specialties like the original 500."""
+    for i in range(count):
+        spec = specialties[i * len(specialties) // count] if count >= len(specialties) else rng.choice(specialties)
+        fname = rng.choice(first_names)
+        lname = rng.choice(last_names)
+        city, lat, lng, _ = rng.choices(city_list, weights)[0]
+        yield {
+            "id": i + 1,
+            "name": f"Dr. {fname} {lname}",
             "specialty": spec,
             "clinic": f"{lname} Health Clinic",
-            "address": f"{random.randint(10,200)} {city} Main Road",
+            "address": f"{rng.randint(10,200)} {city} Main Road",
             "city": city,
             "state": "India",
-            "pincode": random.randint(100000, 999999),
-            "phone": random_phone(),
-            "lat": jitter(lat),
-            "lng": jitter(lng)
+            "pincode": rng.randint(100000, 999999),
+            "phone": random_phone(rng),
+            "lat": jitter(rng, lat, spread),
+            "lng": jitter(rng, lng, spread)
+        }
+
+
+def iter_users(rng, n_patients, doctor_accounts, start):
+    """`users` rows: patients first (ids 1..n_patients), then doctor accounts."""
+    for i in range(n_patients):
+        name = f"{rng.choice(first_names)} {rng.choice(last_names)}"
+        username = f"patient{i + 1}"
+        yield {
+            "id": i + 1,
+            "username": username,
+            "password_hash": None,
+            "role": "patient",
+            "name": name,
+            "email": f"{username}@example.com",
+            "specialty": None,
+            "location": None,
+            "created_at": (start + timedelta(seconds=i)).isoformat()
+        }
+    for doc in doctor_accounts:
+        yield {
+            "id": doc["id"],
+            "username": doc["username"],
+            "password_hash": None,
+            "role": "doctor",
+            "name": doc["name"],
+            "email": f"{doc['username']}@example.com",
+            "specialty": doc["specialty"],
+            "location": doc["location"],
+            "created_at": start.isoformat()
         }
-        doctors.append(doc)
-
-# ---------- EXPORT JSON ----------
-with open("doctors.json", "w") as f:
-    json.dump(doctors, f, indent=2)
-
-# ---------- EXPORT ML READY JSON ----------
-ml = [{
-    "name": d["name"],
-    "specialty": d["specialty"],
-    "lat": d["lat"],
-    "lng": d["lng"],
-    "city": d["city"]
-} for d in doctors]
-
-with open("doctors_ml_dataset.json", "w") as f:
-    json.dump(ml, f, indent=2)
-
-# ---------- EXPORT SQL ----------
-with open("doctors.sql", "w") as f:
-    for d in doctors:
-        f.write(
-            f"INSERT INTO doctors "
-            f"(name, specialty, clinic, address, city, state, pincode, phone, lat, lng) "
-            f"VALUES ('{d['name']}', '{d['specialty']}', '{d['clinic']}', "
-            f"'{d['address']}', '{d['city']}', '{d['state']}', "
-            f"{d['pincode']}, '{d['phone']}', {d['lat']}, {d['lng']});\n"
-        )
-
-print("Generated: doctors.json, doctors.sql, doctors_ml_dataset.json")
+
+
+def make_doctor_accounts(rng, count, first_id, city_list, weights):
+    accounts = []
+    for i in range(count):
+        accounts.append({
+            "id": first_id + i,
+            "username": f"doctor{i + 1}",
+            "name": f"Dr. {rng.choice(first_names)} {rng.choice(last_names)}",
+            "specialty": specialties[i % len(specialties)],
+            "location": rng.choices(city_list, weights)[0][0]
+        })
+    return accounts
+
+
+def iter_requests_and_appointments(rng, n_requests, n_appointments, n_patients, accounts, start):
+    """
+    Yields ('request', row) and ('appointment', row) pairs in one pass.
+    Requests 1..n_appointments are 'booked' and each gets exactly one
+    CONFIRMED appointment in the next free 30-minute slot of its doctor.
+    Booked, viewed and rejected requests are always handled by a doctor of
+    the request's specialty.
+    """
+    by_specialty = {}
+    for acc in accounts:
+        by_specialty.setdefault(acc["specialty"], []).append(acc)
+    booking_specs = list(by_specialty)
+    next_slot = {acc["id"]: start + timedelta(days=1, hours=9) for acc in accounts}
+    span = max(1, n_requests)
+
+    for i in range(1, n_requests + 1):
+        booked = i <= n_appointments
+        spec = rng.choice(booking_specs) if booked else rng.choice(specialties)
+        created_at = start + timedelta(seconds=i * 86400 // span)
+        patient_id = rng.randint(1, n_patients)
+        doctor = rng.choice(by_specialty[spec]) if booked else None
+
+        status = "booked" if booked else rng.choice(REQUEST_STATUSES)
+        if doctor is None and status in ("viewed", "rejected"):
+            # Only a doctor of the request's specialty can have handled it;
+            # with none among the accounts it is still waiting in the queue
+            if by_specialty.get(spec):
+                doctor = rng.choice(by_specialty[spec])
+            else:
+                status = "new"
+        handled = doctor is not None
+        handler_id = doctor["id"] if doctor else None
+        yield "request", {
+            "id": i,
+            "patient_id": patient_id,
+            "symptom": rng.choice(symptoms[spec]),
+            "specialty": spec,
+            "answers_json": [rng.choice("abc") for _ in range(10)],
+            "status": status,
+            "doctor_id": handler_id,
+            "handled_by": handler_id if handled else None,
+            "handled_at": (created_at + timedelta(minutes=rng.randint(5, 600))).isoformat() if handled else None,
+            "created_at": created_at.isoformat()
+        }
+
+        if booked:
+            slot = next_slot[doctor["id"]]
+            next_slot[doctor["id"]] = slot + timedelta(minutes=30)
+            yield "appointment", {
+                "id": i,
+                "request_id": i,
+                "doctor_id": doctor["id"],
+                "patient_id": patient_id,
+                "start_time": slot.isoformat(),
+                "end_time": (slot + timedelta(minutes=30)).isoformat(),
+                "mode": rng.choice(APPOINTMENT_MODES),
+                "status": "CONFIRMED",
+                "notes": None,
+                "created_by": doctor["id"],
+                "created_at": created_at.isoformat()
+            }
+
+
+class RecordWriter:
+    """Streams records as a compact JSON array, NDJSON or gzipped NDJSON."""
+
+    def __init__(self, path, fmt):
+        self.fmt = fmt
+        self.count = 0
+        if fmt == "ndjson.gz":
+            self._f = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            self._f = open(path, "w", encoding="utf-8")
+        if fmt == "json":
+            self._f.write("[")
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":"))
+        if self.fmt == "json":
+            self._f.write(("\n" if self.count == 0 else ",\n") + line)
+        else:
+            self._f.write(line + "\n")
+        self.count += 1
+
+    def close(self):
+        if self.fmt == "json":
+            self._f.write("\n]\n")
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic doctors, patients, requests and appointments")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible output")
+    parser.add_argument("--doctors", type=int, default=500)
+    parser.add_argument("--cities", default=None, help="JSON file of {name, lat, lng, weight} to use instead of the built-in list")
+    parser.add_argument("--density", choices=DENSITIES, default="uniform",
+                        help="how doctors/accounts are spread over cities")
+    parser.add_argument("--spread", type=float, default=0.02, help="max lat/lng jitter around a city centre (degrees)")
+    parser.add_argument("--patients", type=int, default=0)
+    parser.add_argument("--doctor-accounts", type=int, default=None,
+                        help="doctor user accounts (default: one per specialty when requests are generated)")
+    parser.add_argument("--requests", type=int, default=0)
+    parser.add_argument("--appointments", type=int, default=0)
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument("--out-dir", default=".")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    city_list = load_cities(args.cities) if args.cities else cities
+    weights = city_weights(city_list, args.density)
+    os.makedirs(args.out_dir, exist_ok=True)
+    ext = {"json": "json", "ndjson": "ndjson", "ndjson.gz": "ndjson.gz"}[args.format]
+
+    def out(name):
+        return os.path.join(args.out_dir, f"{name}.{ext}")
+
+    generated = []
+
+    # ---------- DOCTOR DIRECTORY ----------
+    if args.format == "json":
+        # Legacy outputs: directory and ML-ready subset
+        with RecordWriter(out("doctors"), "json") as docs, \
+                RecordWriter(os.path.join(args.out_dir, "doctors_ml_dataset.json"), "json") as ml:
+            for d in iter_doctors(rng, args.doctors, city_list, weights, args.spread):
+                docs.write(d)
+                ml.write({k: d[k] for k in ("name", "specialty", "lat", "lng", "city")})
+        generated += [out("doctors"), "doctors_ml_dataset.json"]
+    else:
+        with RecordWriter(out("doctors"), args.format) as docs:
+            for d in iter_doctors(rng, args.doctors, city_list, weights, args.spread):
+                docs.write(d)
+        generated.append(out("doctors"))
+
+    # ---------- USERS / REQUESTS / APPOINTMENTS ----------
+    n_appointments = min(args.appointments, args.requests)
+    if args.patients or args.requests:
+        if args.requests and not args.patients:
+            parser.error("--requests needs --patients")
+        n_accounts = args.doctor_accounts
+        if n_accounts is None:
+            n_accounts = len(specialties) if args.requests else 0
+        if n_appointments and n_accounts == 0:
+            parser.error("--appointments needs at least one --doctor-accounts")
+
+        start = datetime(2025, 1, 1) if args.seed is not None else datetime.utcnow().replace(microsecond=0)
+        accounts = make_doctor_accounts(rng, n_accounts, args.patients + 1, city_list, weights)
+
+        with RecordWriter(out("users"), args.format) as users:
+            for u in iter_users(rng, args.patients, accounts, start):
+                users.write(u)
+        generated.append(out("users"))
+
+        if args.requests:
+            with RecordWriter(out("requests"), args.format) as reqs, \
+                    RecordWriter(out("appointments"), args.format) as appts:
+                for kind, row in iter_requests_and_appointments(
+                        rng, args.requests, n_appointments, args.patients, accounts, start):
+                    (reqs if kind == "request" else appts).write(row)
+            generated += [out("requests"), out("appointments")]
+
+    print("Generated: " + ", ".join(os.path.basename(p) for p in generated))
+
+
+if __name__ == "__main__":
+    main()
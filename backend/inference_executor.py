@@ -0,0 +1,158 @@
+"""
+Dedicated executor for /triage model inference.
+
+RandomForest inference is CPU-bound. Running it in FastAPI's shared
+threadpool makes cheap endpoints (sign-in, listings) queue behind it and
+fight it for the GIL. InferenceExecutor moves it to its own pool:
+
+- thread:  a small ThreadPoolExecutor sharing the loaded model. Good enough
+           when the estimator releases the GIL (sklearn tree prediction
+           mostly does) and cheapest to run.
+- process: a ProcessPoolExecutor whose workers each load the model once in
+           their initializer, so inference never touches the API process's GIL.
+
+Admission is bounded by queue depth: once max_workers + max_queue calls are in
+flight, submit() raises ExecutorBusy instead of letting requests pile up.
+
+joblib and triage_pipeline (pandas/sklearn) are imported on first use, so
+importing this module for ExecutorBusy costs nothing at API startup.
+"""
+import asyncio
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from rules_engine import combine_ml_and_rules
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+class ExecutorBusy(Exception):
+    """Raised when the inference queue is full."""
+
+
+def run_inference(model, symptoms_text, age, fever, chest_pain, duration_days):
+    """
+    Features -> vectorize -> predict_proba -> argmax -> rules.
+
+    Returns ((specialty, confidence, reason), timings) where the first item is
+    the combine_ml_and_rules result and timings maps each stage
+    (feature_prep, vectorize, classify, rules) to seconds spent in it.
+    """
+    from triage_pipeline import make_feature_frame
+
+    timings = {}
+
+    start = time.perf_counter()
+    features = make_feature_frame(symptoms_text, age, fever, chest_pain, duration_days)
+    mark = time.perf_counter()
+    timings["feature_prep"] = mark - start
+
+    # Split the pipeline so vectorization and classification are timed separately
+    steps = getattr(model, "named_steps", {})
+    if "preprocessor" in steps and "classifier" in steps:
+        start = mark
+        Xt = steps["preprocessor"].transform(features)
+        mark = time.perf_counter()
+        timings["vectorize"] = mark - start
+        start = mark
+        probs = steps["classifier"].predict_proba(Xt)[0]
+    else:
+        timings["vectorize"] = 0.0
+        start = mark
+        probs = model.predict_proba(features)[0]
+    classes = model.classes_
+    best_idx = probs.argmax()
+    ml_specialty = classes[best_idx]
+    ml_confidence = float(probs[best_idx])
+    mark = time.perf_counter()
+    timings["classify"] = mark - start
+
+    start = mark
+    result = combine_ml_and_rules(ml_specialty, ml_confidence, symptoms_text)
+    timings["rules"] = time.perf_counter() - start
+    return result, timings
+
+
+# --- Process-pool worker state ---
+_worker_model = None
+
+def _init_worker(model_path):
+    global _worker_model
+    import joblib
+    _worker_model = joblib.load(model_path)
+
+def _predict_in_worker(symptoms_text, age, fever, chest_pain, duration_days):
+    return run_inference(_worker_model, symptoms_text, age, fever, chest_pain, duration_days)
+
+
+class InferenceExecutor:
+    def __init__(self, model, model_path: str, mode: str = "thread",
+                 max_workers: int = 2, max_queue: int = 32, start_method: str = "spawn"):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode '{mode}', expected one of {EXECUTOR_MODES}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.completed = 0
+        self.errors = 0 # calls that raised (or were cancelled) in the pool
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+        if mode == "process":
+            # spawn by default: forking a process that already runs threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(model_path,)
+            )
+            self._fn = _predict_in_worker
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="triage-inference")
+            self._fn = functools.partial(run_inference, model)
+
+    async def submit(self, symptoms_text, age, fever, chest_pain, duration_days):
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy()
+            self.in_flight += 1
+        try:
+            future = self._pool.submit(self._fn, symptoms_text, age, fever, chest_pain, duration_days)
+        except BaseException:
+            self._finished(None)
+            raise
+        # The slot is freed when the pool is done with the call, not when the
+        # caller stops waiting: a cancelled request (client disconnect) keeps
+        # occupying its worker until the inference actually finishes
+        future.add_done_callback(self._finished)
+        return await asyncio.wrap_future(future)
+
+    def _finished(self, future):
+        ok = future is not None and not future.cancelled() and future.exception() is None
+        with self._lock:
+            self.in_flight -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.errors += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queued": max(0, self.in_flight - self.max_workers),
+                "completed": self.completed,
+                "errors": self.errors,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = True):
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,97 @@
+"""
+Compact inference engine for the MCQ symptom classifier.
+
+Scores the logistic-regression weights exported by train_symptom_model.py
+with plain Python: one bias vector plus one weight row per answered question,
+followed by a softmax. No numpy/sklearn at request time, so a prediction
+takes a few microseconds.
+"""
+import json
+import math
+import os
+
+QUESTIONS = [f"q{i}" for i in range(1, 11)]
+OPTIONS = ("a", "b", "c")
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "symptom_model.json")
+
+# codebook.json specialty codes -> specialties the recommendation lookup can
+# serve (doctors.json, or GP's mixed fallback). Codes without doctors in the
+# directory (pulmonology, emergency, gastro, endocrine) are referred to GP.
+SPECIALTY_NAMES = {
+    "GP": "GP",
+    "ENT": "ENT",
+    "CARDIO": "Cardiology",
+    "PULM": "GP",
+    "GASTRO": "GP",
+    "NEURO": "Neurology",
+    "DERM": "Dermatology",
+    "ORTHO": "Orthopedics",
+    "ER": "GP",
+    "ENDO": "GP",
+    "PSYCH": "Psychiatry",
+}
+
+
+class SymptomModel:
+    def __init__(self, spec: dict):
+        self.version = spec.get("version", 1)
+        self.diseases = spec["diseases"]
+        self.disease_names = spec.get("disease_names", {})
+        self.intercept = spec["intercept"]
+        self.weights = spec["weights"]
+
+        # Precompute disease index -> specialty names for the probability roll-up
+        self.disease_specialties = [
+            list(dict.fromkeys(SPECIALTY_NAMES.get(code, code) for code in spec["disease_specialties"].get(d, [])))
+            for d in self.diseases
+        ]
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH):
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def disease_probabilities(self, answers: dict) -> list:
+        """Softmax over diseases. Unanswered or unknown options contribute nothing."""
+        logits = list(self.intercept)
+        for question in QUESTIONS:
+            row = self.weights.get(question, {}).get(answers.get(question))
+            if row is None:
+                continue
+            for i, w in enumerate(row):
+                logits[i] += w
+
+        top = max(logits)
+        exps = [math.exp(l - top) for l in logits]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def predict(self, answers: dict, top_k: int = 3) -> dict:
+        """
+        Returns {'diseases': [(code, name, p), ...], 'specialties': [(name, p), ...]}
+        with both lists sorted by probability. A specialty's probability is the
+        total probability of the diseases it treats.
+        """
+        probs = self.disease_probabilities(answers)
+
+        specialty_probs = {}
+        for i, p in enumerate(probs):
+            for name in self.disease_specialties[i]:
+                specialty_probs[name] = specialty_probs.get(name, 0.0) + p
+
+        ranked = sorted(range(len(probs)), key=lambda i: probs[i], reverse=True)[:top_k]
+        diseases = [
+            (self.diseases[i], self.disease_names.get(self.diseases[i], self.diseases[i]), probs[i])
+            for i in ranked
+        ]
+        specialties = sorted(specialty_probs.items(), key=lambda x: x[1], reverse=True)
+        return {"diseases": diseases, "specialties": specialties}
+
+
+def load_symptom_model(path: str = DEFAULT_MODEL_PATH):
+    """Load the exported weights, or None if the model has not been trained yet."""
+    try:
+        return SymptomModel.load(path)
+    except (OSError, ValueError, KeyError):
+        return None
@@ -0,0 +1,101 @@
+"""
+Unit Tests for admin account provisioning.
+
+Run: pytest test_admins.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import database
+from app.admins import AdminProvisioningError, create_admin, promote
+from app.database import Base
+from app.main import app
+from app.models import User
+
+
+BACKEND = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+class TestProvisioning:
+    """Test suite for create_admin and promote."""
+
+    def test_created_admin_can_reach_admin_endpoints(self, session_factory, db):
+        """Test that a provisioned admin logs in and passes get_current_admin."""
+        create_admin(db, "ops", "s3cret", name="Ops Team")
+
+        def get_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[database.get_db] = get_db
+        try:
+            client = TestClient(app)
+            login = client.post("/api/auth/login", json={"username": "ops", "password": "s3cret"})
+            assert login.status_code == 200
+            token = login.json()["access_token"]
+            response = client.get("/api/admin/admission", headers={"Authorization": f"Bearer {token}"})
+        finally:
+            app.dependency_overrides.clear()
+        assert response.status_code == 200
+
+    def test_refuses_taken_username_and_empty_password(self, db):
+        """Test that create never overwrites an account and needs a password."""
+        db.add(User(username="dr_rao", role="doctor", name="Dr. Rao"))
+        db.commit()
+        with pytest.raises(AdminProvisioningError):
+            create_admin(db, "dr_rao", "pw")
+        with pytest.raises(AdminProvisioningError):
+            create_admin(db, "ops", "")
+        assert db.query(User).filter(User.username == "dr_rao").one().role == "doctor"
+
+    def test_promote_keeps_the_password(self, db):
+        """Test that promote only changes the role of an existing account."""
+        db.add(User(username="dr_rao", role="doctor", name="Dr. Rao", password_hash="hash"))
+        db.commit()
+        user = promote(db, "dr_rao")
+        assert (user.role, user.password_hash) == ("admin", "hash")
+        with pytest.raises(AdminProvisioningError):
+            promote(db, "nobody")
+
+
+class TestCommand:
+    """Test suite for python -m app.admins."""
+
+    def test_create_then_list(self, tmp_path):
+        """Test that the command creates the schema, the admin, and lists it."""
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path / 'admins.db'}", "ADMIN_PASSWORD": "s3cret"}
+
+        def run(*args):
+            return subprocess.run([sys.executable, "-m", "app.admins", *args], cwd=BACKEND, env=env,
+                                  capture_output=True, text=True)
+
+        created = run("create", "ops", "--email", "ops@example.org")
+        assert created.returncode == 0, created.stderr
+        assert "Created admin 'ops'" in created.stdout
+        assert run("create", "ops").returncode == 1
+        assert "ops\tops@example.org" in run("list").stdout
@@ -0,0 +1,100 @@
+"""
+Unit Tests for per-route admission control.
+
+Run: pytest test_admission.py -v
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.admission import AdmissionLimiter, Overloaded, add_admission_control
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAdmissionLimiter:
+    """Test suite for AdmissionLimiter."""
+
+    def test_admits_up_to_limit_then_queues(self):
+        """Test that a released slot goes to the first waiter."""
+        async def scenario():
+            limiter = AdmissionLimiter("t", max_concurrent=1, max_queue=1, queue_timeout=1.0)
+            await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            assert limiter.queued == 1 and not waiter.done()
+            limiter.release()
+            await waiter
+            assert limiter.in_flight == 1 and limiter.queued == 0
+            limiter.release()
+            assert limiter.in_flight == 0
+            return limiter
+        limiter = run(scenario())
+        assert limiter.admitted == 2 and limiter.rejected == 0
+
+    def test_full_queue_is_rejected_immediately(self):
+        """Test that requests beyond the queue bound fail fast."""
+        async def scenario():
+            limiter = AdmissionLimiter("t", max_concurrent=1, max_queue=0, queue_timeout=1.0)
+            await limiter.acquire()
+            with pytest.raises(Overloaded) as exc:
+                await limiter.acquire()
+            return exc.value.reason
+        assert run(scenario()) == "queue_full"
+
+    def test_waiter_past_deadline_is_rejected(self):
+        """Test that a queued request gives up after queue_timeout and leaves the queue."""
+        async def scenario():
+            limiter = AdmissionLimiter("t", max_concurrent=1, max_queue=4, queue_timeout=0.01)
+            await limiter.acquire()
+            with pytest.raises(Overloaded) as exc:
+                await limiter.acquire()
+            limiter.release()
+            return exc.value.reason, limiter
+        reason, limiter = run(scenario())
+        assert reason == "deadline"
+        assert limiter.in_flight == 0 and limiter.queued == 0
+
+    def test_from_env(self, monkeypatch):
+        """Test that limits can be overridden per limiter name."""
+        monkeypatch.setenv("ADMISSION_DEMO_CONCURRENCY", "3")
+        monkeypatch.setenv("ADMISSION_DEMO_TIMEOUT", "0.5")
+        limiter = AdmissionLimiter.from_env("demo", 1, 7, 2.0)
+        assert (limiter.max_concurrent, limiter.max_queue, limiter.queue_timeout) == (3, 7, 0.5)
+
+
+class TestAdmissionMiddleware:
+    """Test suite for AdmissionMiddleware."""
+
+    def test_excess_requests_get_503_with_retry_after(self):
+        """Test that overflow is shed while other routes are untouched."""
+        demo = FastAPI()
+        limiter = AdmissionLimiter("slow", max_concurrent=1, max_queue=0, queue_timeout=1.0)
+        add_admission_control(demo, {limiter: [("POST", "/slow")]})
+
+        @demo.post("/slow")
+        async def slow():
+            await asyncio.sleep(0.1)
+            return {"ok": True}
+
+        @demo.post("/fast")
+        async def fast():
+            return {"ok": True}
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=demo)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(client.post("/slow"), client.post("/slow"), client.post("/fast"))
+
+        first, second, other = run(scenario())
+        assert sorted([first.status_code, second.status_code]) == [200, 503]
+        rejected = first if first.status_code == 503 else second
+        assert rejected.headers["retry-after"] == "1"
+        assert rejected.json()["reason"] == "queue_full"
+        assert other.status_code == 200
+        assert limiter.in_flight == 0
@@ -0,0 +1,120 @@
+"""
+Unit Tests for the demand rollup.
+
+Run: pytest test_analytics.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import analytics, database
+from app.database import Base
+from app.main import app
+from app.models import DemandRollup
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def at(day, hour, minute=0):
+    return datetime(2030, 1, day, hour, minute)
+
+
+class TestDemandRollup:
+    """Test suite for incremental rollup maintenance and bucketed reads."""
+
+    def test_events_accumulate_per_hour(self, db):
+        """Test that events in the same hour share one rollup row."""
+        analytics.record(db, "created", "ENT", "Pune", at=at(1, 9, 5))
+        analytics.record(db, "created", "ENT", "Pune", at=at(1, 9, 55))
+        analytics.record(db, "created", "ENT", "Pune", at=at(1, 10, 1))
+        db.commit()
+        rows = db.query(DemandRollup).order_by(DemandRollup.bucket).all()
+        assert [(r.bucket.hour, r.count) for r in rows] == [(9, 2), (10, 1)]
+
+    def test_day_buckets_and_conversion(self, db):
+        """Test day-level aggregation and booked/created conversion."""
+        for hour in (9, 10, 11, 12):
+            analytics.record(db, "created", "ENT", "Pune", at=at(1, hour))
+        analytics.record(db, "booked", "ENT", "Pune", at=at(1, 13))
+        analytics.record(db, "created", "Cardiology", "Mumbai", at=at(1, 9))
+        db.commit()
+        series = analytics.demand(db, bucket="day")
+        assert series == [
+            {"bucket": "2030-01-01T00:00:00", "specialty": "Cardiology", "created": 1, "viewed": 0,
+             "rejected": 0, "booked": 0, "cancelled": 0, "conversion": 0.0},
+            {"bucket": "2030-01-01T00:00:00", "specialty": "ENT", "created": 4, "viewed": 0,
+             "rejected": 0, "booked": 1, "cancelled": 0, "conversion": 0.25},
+        ]
+
+    def test_filters_and_city_grouping(self, db):
+        """Test time-range and city filters and grouping by city."""
+        analytics.record(db, "created", "ENT", "Pune", at=at(1, 9))
+        analytics.record(db, "created", "ENT", "Mumbai", at=at(2, 9))
+        analytics.record(db, "cancelled", "ENT", "Mumbai", at=at(2, 10))
+        db.commit()
+        series = analytics.demand(db, start=at(2, 0), bucket="week", group_by=("city",))
+        assert [(s["city"], s["created"], s["cancelled"]) for s in series] == [("Mumbai", 1, 1)]
+        assert analytics.demand(db, city="Pune")[0]["created"] == 1
+
+    def test_unknown_event(self, db):
+        """Test that unknown events are rejected."""
+        with pytest.raises(ValueError):
+            analytics.record(db, "teleported", "ENT")
+
+
+class TestRecordedEvents:
+    """Test suite for the events the request routes record."""
+
+    @pytest.fixture
+    def client(self, engine):
+        session_factory = sessionmaker(bind=engine)
+
+        def get_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[database.get_db] = get_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def signup(self, client, kind, **fields):
+        response = client.post(f"/api/{kind}/signup", json={"password": "pw", **fields})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    def test_city_and_viewed_counted_once(self, client, db):
+        """Test that events carry the request's city and re-viewing is not counted again."""
+        patient = self.signup(client, "patients", name="P", username="p", location="Pune")
+        doctor = self.signup(client, "doctors", name="D", username="d", specialty="ENT", location="Pune")
+        base = {"symptom": "ear pain", "specialty": "ENT", "answers": []}
+        first = client.post("/api/requests", headers=patient, json=base).json()
+        client.post("/api/requests", headers=patient, json={**base, "city": "Mumbai"})
+
+        for _ in range(2):
+            assert client.post(f"/api/requests/{first['id']}/accept", headers=doctor).status_code == 200
+        assert client.post(f"/api/requests/{first['id']}/reject", headers=doctor).status_code == 200
+        assert client.post(f"/api/requests/{first['id']}/reject", headers=doctor).status_code == 409
+
+        series = analytics.demand(db, bucket="day", group_by=("city",))
+        counts = {s["city"]: (s["created"], s["viewed"], s["rejected"]) for s in series}
+        assert counts == {"Mumbai": (1, 0, 0), "Pune": (1, 1, 1)}
@@ -0,0 +1,74 @@
+"""
+Unit Tests for cursor-paginated appointment listings.
+
+Run: pytest test_appointment_pagination.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Appointment
+from app.routers.appointments import list_appointments
+
+
+START = datetime(2030, 1, 1, 9, 0)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for i in range(12):
+        # Pairs of appointments share a start time to exercise the id tie-breaker
+        start = START + timedelta(hours=i // 2)
+        session.add(Appointment(doctor_id=1, patient_id=2, status="CANCELLED" if i == 3 else "CONFIRMED",
+                                start_time=start, end_time=start + timedelta(minutes=30)))
+    session.add(Appointment(doctor_id=9, patient_id=2, status="CONFIRMED", start_time=START, end_time=START))
+    session.commit()
+    yield session
+    session.close()
+
+
+def page(db, **kwargs):
+    response = Response()
+    params = dict(start=None, end=None, limit=100, cursor=None)
+    params.update(kwargs)
+    appts = list_appointments(Appointment.doctor_id, 1, db, response, **params)
+    return [a.id for a in appts], response.headers.get("X-Next-Cursor")
+
+
+class TestAppointmentPagination:
+    """Test suite for list_appointments."""
+
+    def test_pages_cover_everything_once(self, db):
+        """Test that following cursors returns every active appointment exactly once, in order."""
+        seen, cursor = [], None
+        while True:
+            ids, cursor = page(db, limit=4, cursor=cursor)
+            seen.extend(ids)
+            if not cursor:
+                break
+        assert seen == [1, 2, 3, 5, 6, 7, 8, 9, 10, 11, 12]
+
+    def test_last_page_has_no_cursor(self, db):
+        """Test that a page holding the remaining rows carries no cursor."""
+        ids, cursor = page(db, limit=11)
+        assert len(ids) == 11 and cursor is None
+
+    def test_date_window(self, db):
+        """Test from/to filtering on start_time."""
+        ids, _ = page(db, start=START + timedelta(hours=1), end=START + timedelta(hours=3))
+        assert ids == [3, 5, 6]
+
+    def test_invalid_cursor(self, db):
+        """Test that a malformed cursor is a 400."""
+        with pytest.raises(HTTPException) as exc:
+            page(db, cursor="not-a-cursor")
+        assert exc.value.status_code == 400
@@ -0,0 +1,164 @@
+"""
+Unit Tests for the request claim queue.
+
+Run: pytest test_assignment.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import analytics, assignment
+from app.database import Base
+from app.models import TriageRequest, User
+
+
+NOW = datetime(2030, 1, 1, 9, 0)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    patient = User(username="p", name="P", role="patient")
+    session.add(patient)
+    session.add_all([
+        User(username="d1", name="D1", role="doctor", specialty="Cardiology"),
+        User(username="d2", name="D2", role="doctor", specialty="cardiology"),
+        User(username="d3", name="D3", role="doctor", specialty="ENT"),
+    ])
+    session.flush()
+    for i, specialty in enumerate(["Cardiology", "Cardiology", "ENT", "Cardiology"]):
+        session.add(TriageRequest(patient_id=patient.id, symptom=f"s{i}", specialty=specialty,
+                                  answers_json=[], status="new", created_at=NOW - timedelta(minutes=10 - i)))
+    session.commit()
+    yield session
+    session.close()
+
+
+def doctor(db, username):
+    return db.query(User).filter(User.username == username).one()
+
+
+class TestClaimQueue:
+    """Test suite for claim/lease/release semantics."""
+
+    def test_claims_in_arrival_order_without_duplicates(self, db):
+        """Test that doctors of a specialty each get a different request, oldest first."""
+        first = assignment.claim_next(db, doctor(db, "d1"), NOW)
+        second = assignment.claim_next(db, doctor(db, "d2"), NOW)
+        assert (first.symptom, second.symptom) == ("s0", "s1")
+        assert first.claimed_by != second.claimed_by
+        assert assignment.claim_next(db, doctor(db, "d3"), NOW).symptom == "s2"
+
+    def test_one_active_claim_per_doctor(self, db):
+        """Test that claiming again returns the request already held."""
+        d1 = doctor(db, "d1")
+        first = assignment.claim_next(db, d1, NOW)
+        assert assignment.claim_next(db, d1, NOW).id == first.id
+        assert [r.id for r in assignment.inbox(db, d1, NOW)] == [first.id]
+
+    def test_expired_lease_is_reclaimable(self, db):
+        """Test that an abandoned claim goes back to the queue after the lease."""
+        held = assignment.claim_next(db, doctor(db, "d1"), NOW)
+        assignment.claim_next(db, doctor(db, "d2"), NOW)
+        later = NOW + timedelta(seconds=assignment.LEASE_SECONDS + 1)
+        # d2's lease on s1 expired too, and s0 is older
+        assert assignment.claim_next(db, doctor(db, "d2"), later).id == held.id
+
+    def test_release_and_accept(self, db):
+        """Test release back to the queue and that accept is exclusive."""
+        d1, d2 = doctor(db, "d1"), doctor(db, "d2")
+        held = assignment.claim_next(db, d1, NOW)
+        assert not assignment.release(db, held, d2)
+        assert assignment.release(db, held, d1)
+        assert held.status == "new" and held.claimed_by is None
+
+        held = assignment.claim_next(db, d1, NOW)
+        assert not assignment.mark_viewed(db, held.id, d2, NOW)
+        assert assignment.mark_viewed(db, held.id, d1, NOW)
+        db.refresh(held)
+        assert held.status == "viewed" and held.doctor_id == d1.id
+        assert assignment.can_book(held, d1.id, NOW) and not assignment.can_book(held, d2.id, NOW)
+
+    def test_most_severe_first(self, db):
+        """Test that a severe request jumps ahead of older mild ones."""
+        urgent = db.query(TriageRequest).filter(TriageRequest.symptom == "s3").one()
+        urgent.severity = 7
+        db.commit()
+        assert assignment.claim_next(db, doctor(db, "d1"), NOW).symptom == "s3"
+        assert assignment.claim_next(db, doctor(db, "d2"), NOW).symptom == "s0"
+
+    def test_empty_queue(self, db):
+        """Test that a specialty with no queued requests yields None."""
+        d3 = doctor(db, "d3")
+        assignment.claim_next(db, d3, NOW)
+        assignment.mark_viewed(db, assignment.active_claim(db, d3, NOW).id, d3, NOW)
+        assert assignment.claim_next(db, d3, NOW) is None
+
+
+class TestReject:
+    """Test suite for assignment.reject."""
+
+    def test_only_claimer_or_viewer_rejects(self, db):
+        """Test that another doctor, or a request nobody holds, cannot be rejected."""
+        d1, d2 = doctor(db, "d1"), doctor(db, "d2")
+        held = assignment.claim_next(db, d1, NOW)
+        queued = db.query(TriageRequest).filter(TriageRequest.symptom == "s1").one()
+        assert not assignment.reject(db, held, d2, NOW)
+        assert not assignment.reject(db, queued, d1, NOW)
+        assert queued.status == "new"
+        assert assignment.reject(db, held, d1, NOW)
+        assert held.status == "rejected" and held.handled_by == d1.id
+
+    def test_viewer_rejects_once(self, db):
+        """Test that a viewed request can be rejected by its viewer, and only from an open status."""
+        d1 = doctor(db, "d1")
+        held = assignment.claim_next(db, d1, NOW)
+        assignment.mark_viewed(db, held.id, d1, NOW)
+        assert assignment.reject(db, held, d1, NOW)
+        assert not assignment.reject(db, held, d1, NOW)
+        assert not assignment.mark_viewed(db, held.id, d1, NOW)
+        db.refresh(held)
+        assert held.status == "rejected"
+
+    def test_records_one_rejected_event(self, db):
+        """Test that the demand rollup counts a rejection once, in the same transaction."""
+        d1 = doctor(db, "d1")
+        held = assignment.claim_next(db, d1, NOW)
+        assignment.reject(db, held, d1, NOW)
+        assignment.reject(db, held, d1, NOW)
+        series = analytics.demand(db)
+        assert [(s["specialty"], s["rejected"]) for s in series] == [("Cardiology", 1)]
+
+
+class TestBook:
+    """Test suite for assignment.book."""
+
+    def test_requires_claim_or_view(self, db):
+        """Test that a queued request cannot be booked straight from the queue."""
+        d1 = doctor(db, "d1")
+        queued = db.query(TriageRequest).filter(TriageRequest.symptom == "s0").one()
+        assert not assignment.can_book(queued, d1.id, NOW)
+        assert not assignment.book(db, queued, d1, NOW)
+        held = assignment.claim_next(db, d1, NOW)
+        assert assignment.can_book(held, d1.id, NOW)
+        assert assignment.book(db, held, d1, NOW)
+        db.commit()
+        db.refresh(held)
+        assert held.status == "booked" and held.handled_by == d1.id
+
+    def test_only_one_booking_wins(self, db):
+        """Test that a second booking of the same request fails, even by a doctor who passed the pre-check."""
+        d1, d2 = doctor(db, "d1"), doctor(db, "d2")
+        held = assignment.claim_next(db, d1, NOW)
+        assert not assignment.book(db, held, d2, NOW)
+        assert assignment.book(db, held, d1, NOW)
+        assert not assignment.book(db, held, d1, NOW)
+        db.commit()
+        series = analytics.demand(db)
+        assert [(s["specialty"], s["booked"]) for s in series] == [("Cardiology", 1)]
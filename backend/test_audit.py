@@ -0,0 +1,67 @@
+"""
+Unit Tests for the batched audit writer.
+
+Run: pytest test_audit.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.audit import AuditLog
+from app.database import Base
+from app.models import AuditEvent
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[AuditEvent.__table__])
+    return engine
+
+
+def events(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        return session.query(AuditEvent).order_by(AuditEvent.id).all()
+    finally:
+        session.close()
+
+
+class TestAuditLog:
+    """Test suite for AuditLog."""
+
+    def test_events_are_written_in_background(self, engine):
+        """Test that emitted events end up in audit_events with their details."""
+        log = AuditLog(engine=engine, batch_size=10, flush_interval=0.05)
+        log.emit("BOOK_APPOINTMENT", actor_id=1, appointment_id=5, request_id=9,
+                 start_time=datetime(2030, 1, 1, 9, 0))
+        log.emit("CANCEL_APPOINTMENT", actor_id=2, appointment_id=5)
+        log.flush()
+        rows = events(engine)
+        assert [(r.action, r.actor_id, r.appointment_id) for r in rows] == [
+            ("BOOK_APPOINTMENT", 1, 5), ("CANCEL_APPOINTMENT", 2, 5)
+        ]
+        assert rows[0].details == {"start_time": "2030-01-01T09:00:00"}
+        assert log.stats()["written"] == 2
+        log.stop()
+
+    def test_stop_drains_queue(self, engine):
+        """Test that stop() writes everything still queued."""
+        log = AuditLog(engine=engine, batch_size=7, flush_interval=0.05)
+        for i in range(50):
+            log.emit("BOOK_APPOINTMENT", appointment_id=i)
+        log.stop()
+        assert len(events(engine)) == 50
+
+    def test_full_queue_drops_instead_of_blocking(self, engine):
+        """Test that emit() never blocks when the writer is behind."""
+        log = AuditLog(engine=engine, maxsize=2)
+        log._thread = object()  # pretend the writer is running but stalled
+        for i in range(5):
+            log.emit("BOOK_APPOINTMENT", appointment_id=i)
+        assert log.dropped == 3
+        assert log.stats()["queued"] == 2
@@ -0,0 +1,79 @@
+"""
+Unit Tests for the doctor directory reloader.
+
+Run: pytest test_directory_reloader.py -v
+"""
+
+import json
+import os
+
+import pytest
+from directory_reloader import DirectoryReloader
+
+
+DOCTORS = [
+    {"name": "Dr. A", "specialty": "Cardiology", "clinic": "C1", "address": "a", "city": "Pune",
+     "state": "MH", "pincode": "411001", "phone": "1", "lat": 18.5, "lng": 73.8},
+    {"name": "Dr. B", "specialty": "ENT", "clinic": "C2", "address": "b", "city": "Pune",
+     "state": "MH", "pincode": "411002", "phone": "2", "lat": 18.6, "lng": 73.9},
+]
+
+
+def write_json(path, doctors, mtime=None):
+    with open(path, "w") as f:
+        json.dump(doctors, f)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = str(tmp_path / "doctors.json")
+    write_json(path, DOCTORS, mtime=1_000_000)
+    return path
+
+
+class TestDirectoryReloader:
+    """Test suite for change detection and snapshot swapping."""
+
+    def test_initial_load(self, json_path):
+        """Test that the first access loads the directory."""
+        reloader = DirectoryReloader(json_path, interval=0)
+        assert len(reloader.current()) == 2
+        assert reloader.reloads == 1
+        assert reloader.stats()["version"] == reloader.current().version
+
+    def test_swaps_on_change(self, json_path):
+        """Test that a changed file produces a new snapshot and notifies listeners."""
+        reloader = DirectoryReloader(json_path, interval=0)
+        old = reloader.current()
+        seen = []
+        reloader.add_listener(seen.append)
+
+        write_json(json_path, DOCTORS[:1], mtime=2_000_000)
+        assert reloader.check() is True
+        assert len(reloader.current()) == 1
+        assert reloader.version != old.version
+        assert seen == [reloader.current()]
+        # The old snapshot is still usable by requests that hold it
+        assert old.doctor(1)["name"] == "Dr. B"
+
+    def test_unchanged_content_is_not_reloaded(self, json_path):
+        """Test that touching the file without changing it skips the rebuild."""
+        reloader = DirectoryReloader(json_path, interval=0)
+        reloader.current()
+        os.utime(json_path, (3_000_000, 3_000_000))
+        assert reloader.check() is False
+        assert reloader.check() is False
+        assert reloader.reloads == 1
+
+    def test_failed_reload_keeps_old_snapshot(self, json_path):
+        """Test that a broken file keeps serving the previous directory."""
+        reloader = DirectoryReloader(json_path, interval=0)
+        old = reloader.current()
+        with open(json_path, "w") as f:
+            f.write("[{not json")
+        assert reloader.check() is False
+        assert reloader.current() is old
+        assert reloader.failures == 1
+        assert reloader.last_error
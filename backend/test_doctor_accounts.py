@@ -0,0 +1,153 @@
+"""
+Unit Tests for linking directory entries to doctor accounts.
+
+Run: pytest test_doctor_accounts.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import database, doctor_accounts, doctor_load
+from app.database import Base, upgrade_schema
+from app.main import app
+from app.models import Doctor, TriageRequest, User
+from app.routers import appointments
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_doctor(db, name, lat, city="Pune", specialty="Cardiology"):
+    doctor = Doctor(name=name, specialty=specialty, city=city, lat=lat, lng=73.85)
+    db.add(doctor)
+    db.commit()
+    return doctor
+
+
+class TestLinkAccount:
+    """Test suite for doctor_accounts.link_account."""
+
+    def test_links_by_name_and_specialty(self, db):
+        """Test that a unique name/specialty match is linked."""
+        entry = add_doctor(db, "Dr. A", 18.5)
+        user = User(username="a", name="dr. a", role="doctor", specialty="cardiology")
+        db.add(user)
+        db.flush()
+        assert doctor_accounts.link_account(db, user) is entry
+        assert entry.user_id == user.id
+
+    def test_ambiguous_match_is_left_unlinked(self, db):
+        """Test that same-named entries are only linked when the location decides."""
+        add_doctor(db, "Dr. A", 18.5, city="Pune")
+        mumbai = add_doctor(db, "Dr. A", 19.0, city="Mumbai")
+        anywhere = User(username="a1", name="Dr. A", role="doctor", specialty="Cardiology")
+        db.add(anywhere)
+        db.flush()
+        assert doctor_accounts.link_account(db, anywhere) is None
+        located = User(username="a2", name="Dr. A", role="doctor", specialty="Cardiology", location="Mumbai")
+        db.add(located)
+        db.flush()
+        assert doctor_accounts.link_account(db, located) is mumbai
+
+    def test_explicit_directory_id(self, db):
+        """Test that directory_id wins and an entry is never linked twice."""
+        add_doctor(db, "Dr. A", 18.5)
+        other = add_doctor(db, "Dr. B", 18.6)
+        first = User(username="x", name="Someone", role="doctor", specialty="Cardiology")
+        second = User(username="y", name="Someone Else", role="doctor", specialty="Cardiology")
+        db.add_all([first, second])
+        db.flush()
+        assert doctor_accounts.link_account(db, first, directory_id=other.id) is other
+        assert doctor_accounts.link_account(db, second, directory_id=other.id) is None
+
+
+class TestUpgradeSchema:
+    """Test suite for upgrade_schema on databases created by older versions."""
+
+    def test_adds_missing_columns_and_indexes(self):
+        """Test that an old doctors table gains user_id and the expression index."""
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE doctors (id INTEGER PRIMARY KEY, name VARCHAR, specialty VARCHAR, "
+                              "clinic VARCHAR, address VARCHAR, city VARCHAR, state VARCHAR, pincode VARCHAR, "
+                              "phone VARCHAR, lat FLOAT, lng FLOAT)"))
+        Base.metadata.create_all(bind=engine)
+        upgrade_schema(engine)
+        upgrade_schema(engine)  # idempotent
+        assert "user_id" in {c["name"] for c in inspect(engine).get_columns("doctors")}
+        with engine.connect() as conn:
+            names = {r[0] for r in conn.execute(text("SELECT name FROM sqlite_master WHERE type='index'"))}
+        assert "ix_doctors_specialty_lat_lng" in names
+
+
+class TestRankByLoadEndToEnd:
+    """Test suite for rank=load through signup, booking and /api/doctors/nearby."""
+
+    @pytest.fixture
+    def client(self, engine, monkeypatch):
+        session_factory = sessionmaker(bind=engine)
+
+        def get_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[database.get_db] = get_db
+        monkeypatch.setattr(appointments.audit_log, "emit", lambda *args, **kwargs: None)
+        doctor_load.tracker.reset()
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+        doctor_load.tracker.reset()
+
+    def test_booked_doctor_moves_down(self, client, db):
+        """Test that bookings for the nearest doctor push it below an idle one."""
+        add_doctor(db, "Dr. Near", 18.52)
+        add_doctor(db, "Dr. Far", 18.55)
+        signup = client.post("/api/doctors/signup", json={
+            "name": "Dr. Near", "username": "near", "password": "pw", "specialty": "Cardiology", "location": "Pune"
+        })
+        assert signup.status_code == 200
+        doctor_id = signup.json()["user"]["id"]
+        token = signup.json()["access_token"]
+
+        patient = User(username="p", name="P", role="patient")
+        db.add(patient)
+        db.commit()
+        start = datetime.utcnow() + timedelta(days=1)
+        for i in range(3):
+            db.add(TriageRequest(patient_id=patient.id, symptom="chest pain", specialty="Cardiology",
+                                answers_json=[], status="new"))
+            db.commit()
+            claimed = client.post("/api/requests/claim", headers={"Authorization": f"Bearer {token}"})
+            assert claimed.status_code == 200, claimed.text
+            slot = start + timedelta(hours=i)
+            booked = client.post("/api/appointments/book", headers={"Authorization": f"Bearer {token}"}, json={
+                "requestId": str(claimed.json()["id"]), "doctorId": str(doctor_id), "patientId": str(patient.id),
+                "startTime": slot.isoformat(), "endTime": (slot + timedelta(minutes=30)).isoformat(),
+            })
+            assert booked.status_code == 200, booked.text
+
+        params = {"specialty": "Cardiology", "lat": 18.52, "lng": 73.85, "k": 2}
+        by_distance = client.get("/api/doctors/nearby", params=params).json()["doctors"]
+        by_load = client.get("/api/doctors/nearby", params={**params, "rank": "load"}).json()["doctors"]
+        assert [d["name"] for d in by_distance] == ["Dr. Near", "Dr. Far"]
+        assert [d["name"] for d in by_load] == ["Dr. Far", "Dr. Near"]
+        assert by_load[1]["user_id"] == doctor_id and by_load[1]["upcoming_appointments"] == 3
@@ -0,0 +1,136 @@
+"""
+Unit Tests for server-side doctor availability counts.
+
+Run: pytest test_doctor_counts.py -v
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import api
+from app import database as app_database
+from app.database import Base
+from app.models import Doctor, User
+from doctor_counts import DoctorCounts
+from doctor_store import DoctorStore, build_arrays
+
+
+DOCTORS = [
+    {"name": "Dr. A", "specialty": "Cardiology", "city": "Pune", "lat": 18.5, "lng": 73.8},
+    {"name": "Dr. B", "specialty": "Cardiology", "city": "Mumbai", "lat": 19.0, "lng": 72.8},
+    {"name": "Dr. C", "specialty": "ENT", "city": "Pune", "lat": 18.6, "lng": 73.9},
+]
+
+
+@pytest.fixture
+def counts():
+    counts = DoctorCounts()
+    counts.rebuild_directory(DoctorStore(*build_arrays(DOCTORS), version="v1"))
+    return counts
+
+
+class TestDoctorCounts:
+    """Test suite for DoctorCounts."""
+
+    def test_directory_counts(self, counts):
+        """Test per-specialty and per-city counts from the directory."""
+        assert counts.count("Cardiology") == 2
+        assert counts.count("cardiology", "pune") == 1
+        assert counts.count("ENT", "Mumbai") == 0
+        assert counts.count("Neurology") == 0
+        assert counts.by_specialty() == {"Cardiology": 2, "ENT": 1}
+        assert counts.by_specialty("Pune") == {"Cardiology": 1, "ENT": 1}
+
+    def test_signups_are_added(self, counts):
+        """Test that registered doctors add to the directory counts."""
+        counts.add_doctor("Cardiology", "Pune")
+        counts.add_doctor("Neurology")
+        assert counts.count("Cardiology") == 3
+        assert counts.count("Cardiology", "Pune") == 2
+        assert counts.count("Neurology") == 1
+
+    def test_reload_keeps_signups(self, counts):
+        """Test that a directory rebuild replaces only the directory part."""
+        counts.add_doctor("ENT")
+        counts.rebuild_directory(DoctorStore(*build_arrays(DOCTORS[:1]), version="v2"))
+        assert counts.count("Cardiology") == 1
+        assert counts.count("ENT") == 1
+        assert counts.directory_version == "v2"
+
+
+    def test_app_accounts_are_replaced_on_recount(self, counts):
+        """Test that app-database account counts are swapped wholesale, not accumulated."""
+        counts.reset_accounts([("Cardiology", "Pune", 2), ("Neurology", None, 1)])
+        assert counts.count("Cardiology", "Pune") == 3
+        assert counts.count("Neurology") == 1
+        counts.reset_accounts([("Neurology", "Pune", 1)])
+        assert counts.count("Cardiology", "Pune") == 1
+        assert counts.by_specialty("Pune") == {"Cardiology": 1, "ENT": 1, "Neurology": 1}
+
+
+class TestAppSignups:
+    """Test suite for counting doctors registered through app.main."""
+
+    def test_unlinked_app_accounts_are_counted(self, counts, monkeypatch):
+        """Test that /api/doctors/counts includes app.main doctors without a directory entry."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        linked = User(username="a", name="Dr. A", role="doctor", specialty="Cardiology", location="Pune")
+        db.add_all([
+            linked,
+            User(username="n", name="Dr. N", role="doctor", specialty="Neurology", location="Pune"),
+            User(username="p", name="P", role="patient"),
+        ])
+        db.flush()
+        db.add(Doctor(name="Dr. A", specialty="Cardiology", city="Pune", user_id=linked.id))
+        db.commit()
+        db.close()
+        monkeypatch.setattr(app_database, "SessionLocal", sessionmaker(bind=engine))
+        monkeypatch.setattr(api, "doctor_counts", counts)
+        monkeypatch.setattr(api, "get_doctor_store", lambda: None)
+
+        api.recount_doctor_accounts()
+        data = TestClient(api.app).get("/api/doctors/counts", params={"city": "Pune"}).json()
+        # Dr. A is linked to a directory entry: counted once, through the directory
+        assert data["counts"] == {"Cardiology": 1, "ENT": 1, "Neurology": 1}
+
+
+    def test_triage_reads_counts_without_querying(self, monkeypatch):
+        """Test that /triage never opens an app-database session on the request path."""
+        class Executor:
+            async def submit(self, *args):
+                return ("ENT", 0.9, "ML Prediction"), {}
+
+        def no_session():
+            raise AssertionError("/triage opened a database session")
+
+        monkeypatch.setattr(app_database, "SessionLocal", no_session)
+        monkeypatch.setattr(api, "model", object())
+        monkeypatch.setattr(api, "inference_executor", Executor())
+        response = TestClient(api.app).post("/triage", json={
+            "symptoms_text": "ear pain", "age": 30, "fever": False, "chest_pain": False, "duration_days": 2
+        })
+        assert response.status_code == 200
+
+
+class TestTriageDoctorCount:
+    """Test suite for the doctor_count returned by /triage."""
+
+    @pytest.mark.skipif(not os.path.exists(api.MODEL_PATH), reason="triage model not trained")
+    def test_client_counts_are_ignored(self, monkeypatch):
+        """Test that /triage reports server counts, not the client-supplied dict."""
+        monkeypatch.setattr(api, "doctor_counts", DoctorCounts())
+        monkeypatch.setattr(api.doctor_counts, "count", lambda specialty, city=None: 7)
+        with TestClient(api.app) as client:  # the lifespan loads the model
+            response = client.post("/triage", json={
+                "symptoms_text": "chest pain", "age": 50, "fever": False, "chest_pain": True,
+                "duration_days": 1, "doctor_counts": {"Cardiology": 999}
+            })
+        assert response.status_code == 200
+        assert response.json()["doctor_count"] == 7
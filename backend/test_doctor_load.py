@@ -0,0 +1,61 @@
+"""
+Unit Tests for load-aware doctor ranking.
+
+Run: pytest test_doctor_load.py -v
+"""
+
+from datetime import datetime, timedelta
+
+from app.doctor_load import AppointmentLoad, rank_by_load
+
+
+NOW = datetime(2030, 1, 1, 9, 0)
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestAppointmentLoad:
+    """Test suite for the in-memory appointment load tracker."""
+
+    def test_book_and_cancel(self):
+        """Test that bookings and cancellations update the count."""
+        load = AppointmentLoad(clock=Clock(NOW))
+        load.booked(1, NOW + timedelta(hours=1))
+        load.booked(1, NOW + timedelta(hours=2))
+        load.booked(2, NOW + timedelta(hours=1))
+        assert load.load(1) == 2 and load.load(2) == 1 and load.load(3) == 0
+        load.cancelled(1, NOW + timedelta(hours=2))
+        assert load.load(1) == 1
+
+    def test_passed_appointments_drop_out(self):
+        """Test that appointments stop counting once they start."""
+        clock = Clock(NOW)
+        load = AppointmentLoad(clock=clock)
+        load.booked(1, NOW + timedelta(hours=1))
+        load.booked(1, NOW + timedelta(days=1))
+        clock.now = NOW + timedelta(hours=2)
+        assert load.load(1) == 1
+
+    def test_rank_by_load(self):
+        """Test that busy nearby doctors yield to idle ones a little further away."""
+        doctors = [
+            {"name": "near-busy", "user_id": 1, "distance_km": 1.0},
+            {"name": "mid-idle", "user_id": 2, "distance_km": 3.0},
+            {"name": "far-idle", "user_id": None, "distance_km": 10.0},
+        ]
+        loads = {1: 3}
+        ranked = rank_by_load(doctors, k=2, penalty_km=2.0, load=lambda uid: loads.get(uid, 0))
+        assert [d["name"] for d in ranked] == ["mid-idle", "near-busy"]
+        assert ranked[1]["upcoming_appointments"] == 3
+
+    def test_zero_load_keeps_distance_order(self):
+        """Test that without bookings the ranking is unchanged."""
+        doctors = [{"name": str(i), "user_id": i, "distance_km": float(i)} for i in range(5)]
+        ranked = rank_by_load(doctors, k=3, load=lambda uid: 0)
+        assert [d["name"] for d in ranked] == ["0", "1", "2"]
@@ -0,0 +1,76 @@
+"""
+Unit Tests for the SQL nearest-doctor search.
+
+Loads doctors.json into an in-memory SQLite database and checks that
+app.doctor_search ranks doctors exactly like get_doctors_for_specialties.
+
+Run: pytest test_doctor_search.py -v
+"""
+
+import json
+import os
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import api
+from app.database import Base
+from app.models import Doctor
+from app.doctor_search import bounding_box, haversine_km, nearest_doctors
+
+
+DOCTORS_JSON = os.path.join(os.path.dirname(__file__), 'doctors.json')
+
+
+@pytest.fixture(scope="module")
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[Doctor.__table__])
+    with open(DOCTORS_JSON) as f:
+        doctors = json.load(f)
+    with engine.begin() as conn:
+        conn.execute(Doctor.__table__.insert(), [
+            {**{k: d.get(k) for k in ("name", "specialty", "clinic", "address", "city", "state", "phone", "lat", "lng")},
+             "id": i + 1, "pincode": str(d.get("pincode"))}
+            for i, d in enumerate(doctors)
+        ])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestDoctorSearch:
+    """Test suite for bounding-box nearest-k search."""
+
+    def test_bounding_box_contains_circle(self):
+        """Test that points on the search radius fall inside the box."""
+        min_lat, max_lat, min_lng, max_lng = bounding_box(19.0, 72.8, 50)
+        assert haversine_km(19.0, 72.8, max_lat, 72.8) >= 50
+        assert haversine_km(19.0, 72.8, 19.0, max_lng) >= 50
+        assert bounding_box(89.9, 0, 50)[2:] == (-180.0, 180.0)
+
+    def test_ranking_matches_directory_lookup(self, db):
+        """Test parity with the JSON-backed recommendation ranking."""
+        rng = random.Random(11)
+        for _ in range(25):
+            lat, lng = rng.uniform(8, 32), rng.uniform(68, 92)
+            specialty = rng.choice(['Cardiology', 'Neurology', 'ENT', 'Obstetrics/Gynecology', 'Urology'])
+            k = rng.choice([1, 5, 20])
+            expected = api.get_doctors_for_specialties([specialty], lat, lng, limit=k)[specialty]
+            result = nearest_doctors(db, specialty, lat, lng, k)
+            assert [d['name'] for d in result] == [d['name'] for d in expected]
+            assert [round(d['distance_km'], 6) for d in result] == [round(d['distance_km'], 6) for d in expected]
+
+    def test_gp_fallback_and_no_location(self, db):
+        """Test the GP fallback and directory order without a location."""
+        expected = api.get_doctors_for_specialties(['GP'], 19.0, 72.8, limit=10)['GP']
+        assert [d['name'] for d in nearest_doctors(db, 'GP', 19.0, 72.8, 10)] == [d['name'] for d in expected]
+        expected = api.get_doctors_for_specialties(['ENT'], limit=3)['ENT']
+        assert [d['name'] for d in nearest_doctors(db, 'ENT', k=3)] == [d['name'] for d in expected]
+
+    def test_unknown_specialty(self, db):
+        """Test that an unknown specialty returns no doctors."""
+        assert nearest_doctors(db, 'Astrology', 19.0, 72.8) == []
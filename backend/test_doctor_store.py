@@ -0,0 +1,86 @@
+"""
+Unit Tests for the columnar doctor store.
+
+Checks that recommendations served from the memory-mapped store rank
+doctors exactly like the original filter-and-sort over doctors.json.
+
+Run: pytest test_doctor_store.py -v
+"""
+
+import json
+import os
+import random
+
+import pytest
+import api
+from doctor_store import DoctorStore, build_store
+
+
+DOCTORS_JSON = os.path.join(os.path.dirname(__file__), 'doctors.json')
+
+
+def reference_lookup(all_doctors, specialty, lat, lng, limit=5):
+    """The original list-based implementation of get_doctors_for_specialties."""
+    lookup = api.SPECIALTY_ALIASES.get(specialty, specialty)
+    matching = [dict(d) for d in all_doctors if d.get('specialty', '').lower() == lookup.lower()]
+    if not matching and specialty == 'GP':
+        matching = []
+        for gen_spec in ['ENT', 'Dermatology', 'Psychiatry']:
+            gen_docs = [dict(d) for d in all_doctors if d.get('specialty', '').lower() == gen_spec.lower()]
+            matching.extend(gen_docs[:2])
+    if lat is not None and lng is not None and matching:
+        for doc in matching:
+            doc['distance_km'] = api.haversine_distance(lat, lng, doc['lat'], doc['lng'])
+        matching.sort(key=lambda x: x['distance_km'])
+    return matching[:limit]
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("store") / "doctors.mtds")
+    build_store(DOCTORS_JSON, path)
+    return DoctorStore.open(path)
+
+
+@pytest.fixture(scope="module")
+def all_doctors():
+    with open(DOCTORS_JSON) as f:
+        return json.load(f)
+
+
+class TestDoctorStore:
+    """Test suite for the compiled doctor directory."""
+
+    def test_round_trip(self, store, all_doctors):
+        """Test that every doctor survives compilation unchanged."""
+        assert len(store) == len(all_doctors)
+        for i in (0, len(all_doctors) // 2, len(all_doctors) - 1):
+            doc = store.doctor(i)
+            assert doc['name'] == all_doctors[i]['name']
+            assert doc['specialty'] == all_doctors[i]['specialty']
+            assert doc['lat'] == all_doctors[i]['lat']
+            assert doc['pincode'] == str(all_doctors[i]['pincode'])
+
+    def test_specialty_lookup_is_case_insensitive(self, store):
+        """Test that specialty filtering ignores case."""
+        assert len(store.indices_for_specialty('cardiology')) == len(store.indices_for_specialty('Cardiology')) > 0
+        assert len(store.indices_for_specialty('Astrology')) == 0
+
+    def test_ranking_matches_reference(self, store, all_doctors, monkeypatch):
+        """Test that nearest-doctor ranking matches the original implementation."""
+        monkeypatch.setattr(api.doctor_directory, 'store', store)
+        rng = random.Random(7)
+        for _ in range(25):
+            lat, lng = rng.uniform(12, 29), rng.uniform(72, 89)
+            specialty = rng.choice(['Cardiology', 'Dermatology', 'ENT', 'Obstetrics/Gynecology', 'Psychiatry'])
+            result = api.get_doctors_for_specialties([specialty], lat, lng)[specialty]
+            expected = reference_lookup(all_doctors, specialty, lat, lng)
+            assert [d['name'] for d in result] == [d['name'] for d in expected]
+            assert [round(d['distance_km'], 6) for d in result] == [round(d['distance_km'], 6) for d in expected]
+
+    def test_gp_fallback_mixes_general_specialties(self, store, monkeypatch):
+        """Test that GP without GP doctors falls back to two each of ENT/Dermatology/Psychiatry."""
+        monkeypatch.setattr(api.doctor_directory, 'store', store)
+        result = api.get_doctors_for_specialties(['GP'], limit=10)['GP']
+        assert [d['specialty'] for d in result] == ['ENT', 'ENT', 'Dermatology', 'Dermatology', 'Psychiatry', 'Psychiatry']
+        assert all('distance_km' not in d for d in result)
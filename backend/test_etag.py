@@ -0,0 +1,156 @@
+"""
+Unit Tests for version-based ETags on list endpoints.
+
+Run: pytest test_etag.py -v
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import auth, database
+from app.database import Base
+from app.etag import ETagMiddleware, changes
+from app.main import app
+from app.models import ChangeVersion, User
+
+
+calls = []
+demo = FastAPI()
+demo.add_middleware(ETagMiddleware)
+
+
+@demo.get("/api/doctors/me/requests")
+def inbox():
+    calls.append("inbox")
+    return [{"id": 1}]
+
+
+@demo.get("/api/other")
+def other():
+    return {"ok": True}
+
+
+@pytest.fixture(autouse=True)
+def session_factory(monkeypatch):
+    """One in-memory database for the versions the middleware reads and the writes that bump them."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    return factory
+
+
+def bump(session_factory, kind=None, owner_id=None):
+    with session_factory() as db:
+        if kind is None:
+            changes.bump_all(db)
+        else:
+            changes.bump(db, kind, owner_id)
+        db.commit()
+
+
+def headers(uid, etag=None):
+    token = auth.create_access_token(data={"sub": f"user{uid}", "uid": uid, "role": "doctor"})
+    h = {"Authorization": f"Bearer {token}"}
+    if etag:
+        h["If-None-Match"] = etag
+    return h
+
+
+class TestETagMiddleware:
+    """Test suite for ETagMiddleware."""
+
+    def test_unchanged_resource_is_304_without_calling_handler(self):
+        """Test that a matching If-None-Match short-circuits the route."""
+        client = TestClient(demo)
+        first = client.get("/api/doctors/me/requests", headers=headers(101))
+        assert first.status_code == 200 and first.headers["etag"]
+        calls.clear()
+        second = client.get("/api/doctors/me/requests", headers=headers(101, first.headers["etag"]))
+        assert second.status_code == 304
+        assert calls == []
+
+    def test_write_changes_the_etag(self, session_factory):
+        """Test that bumping the owner's version makes the old ETag stale."""
+        client = TestClient(demo)
+        etag = client.get("/api/doctors/me/requests", headers=headers(102)).headers["etag"]
+        bump(session_factory, "inbox", 103)  # someone else's inbox
+        assert client.get("/api/doctors/me/requests", headers=headers(102, etag)).status_code == 304
+        bump(session_factory, "inbox", 102)
+        etag_after_write = client.get("/api/doctors/me/requests", headers=headers(102, etag))
+        assert etag_after_write.status_code == 200
+        bump(session_factory)
+        assert client.get("/api/doctors/me/requests",
+                          headers=headers(102, etag_after_write.headers["etag"])).status_code == 200
+
+    def test_versions_are_shared_between_workers(self, session_factory):
+        """Test that a write seen only through the database (another worker's) invalidates the ETag."""
+        client = TestClient(demo)
+        etag = client.get("/api/doctors/me/requests", headers=headers(107)).headers["etag"]
+        with session_factory() as db:
+            db.add(ChangeVersion(kind="inbox", owner_id=107, version=5))
+            db.commit()
+        assert client.get("/api/doctors/me/requests", headers=headers(107, etag)).status_code == 200
+
+    def test_unreadable_versions_pass_through(self, monkeypatch):
+        """Test that a database without change_versions serves plain 200s rather than failing."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+        response = TestClient(demo).get("/api/doctors/me/requests", headers=headers(108))
+        assert response.status_code == 200 and "etag" not in response.headers
+
+    def test_query_string_and_user_are_part_of_the_etag(self):
+        """Test that other pages and other users never match."""
+        client = TestClient(demo)
+        etag = client.get("/api/doctors/me/requests", headers=headers(104)).headers["etag"]
+        assert client.get("/api/doctors/me/requests?limit=5", headers=headers(104, etag)).status_code == 200
+        assert client.get("/api/doctors/me/requests", headers=headers(105, etag)).status_code == 200
+
+    def test_untracked_and_anonymous_requests_pass_through(self):
+        """Test that other routes and requests without a valid token get no ETag."""
+        client = TestClient(demo)
+        assert "etag" not in client.get("/api/other", headers=headers(106)).headers
+        assert "etag" not in client.get("/api/doctors/me/requests").headers
+
+
+class TestETagBehindCORS:
+    """Test suite for the ETag middleware's place in app.main's middleware stack."""
+
+    @pytest.fixture
+    def client(self, session_factory):
+        db = session_factory()
+        db.add(User(id=201, username="user201", name="Dr. 201", role="doctor", specialty="ENT"))
+        db.commit()
+        db.close()
+
+        def get_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[database.get_db] = get_db
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_not_modified_carries_cors_headers(self, client):
+        """Test that a cross-origin conditional GET answered with 304 still has CORS headers."""
+        cors = {"Origin": "http://localhost:5173"}
+        first = client.get("/api/doctors/me/requests", headers={**headers(201), **cors})
+        assert first.status_code == 200
+        assert first.headers["access-control-allow-origin"] == "*"
+        second = client.get("/api/doctors/me/requests", headers={**headers(201, first.headers["etag"]), **cors})
+        assert second.status_code == 304
+        assert second.headers["access-control-allow-origin"] == "*"
+        assert "etag" in second.headers["access-control-expose-headers"].lower()
+
+    def test_router_write_bumps_the_shared_version(self, client):
+        """Test that a claim attempt commits an inbox bump that stales the doctor's ETag."""
+        etag = client.get("/api/doctors/me/requests", headers=headers(201)).headers["etag"]
+        assert client.post("/api/requests/claim", headers=headers(201)).status_code == 204
+        assert client.get("/api/doctors/me/requests", headers=headers(201, etag)).status_code == 200
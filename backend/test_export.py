@@ -0,0 +1,73 @@
+"""
+Unit Tests for the streaming request/appointment export.
+
+Run: pytest test_export.py -v
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import export
+from app.database import Base
+from app.models import Appointment, TriageRequest, User
+
+
+START = datetime(2030, 1, 1)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    patient = User(username="p", name="P", role="patient")
+    session.add(patient)
+    session.flush()
+    for i in range(25):
+        session.add(TriageRequest(patient_id=patient.id, symptom=f"s{i}", specialty="ENT", answers_json=["a", "b"],
+                                  status="booked" if i % 5 == 0 else "new", created_at=START + timedelta(days=i)))
+        session.add(Appointment(doctor_id=patient.id, patient_id=patient.id, status="CONFIRMED",
+                                start_time=START + timedelta(hours=i), end_time=START + timedelta(hours=i, minutes=30)))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(export, "engine", engine)
+    return engine
+
+
+class TestExport:
+    """Test suite for NDJSON/CSV streaming."""
+
+    def test_ndjson_in_batches(self, engine):
+        """Test that rows are streamed one chunk per batch, in id order."""
+        chunks = list(export.stream("requests", "ndjson", batch_size=10))
+        assert len(chunks) == 3
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        assert [r["symptom"] for r in rows] == [f"s{i}" for i in range(25)]
+        assert rows[0]["answers_json"] == ["a", "b"]
+        assert rows[0]["created_at"] == START.isoformat()
+
+    def test_csv_with_filters(self, engine):
+        """Test CSV output with a date range and status filter."""
+        text = "".join(export.stream("requests", "csv", start=START, end=START + timedelta(days=20),
+                                     statuses=["booked"], batch_size=2))
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert [r["symptom"] for r in rows] == ["s0", "s5", "s10", "s15"]
+        assert json.loads(rows[0]["answers_json"]) == ["a", "b"]
+
+    def test_appointments_by_start_time(self, engine):
+        """Test that the appointment date range applies to start_time."""
+        text = "".join(export.stream("appointments", "ndjson", start=START + timedelta(hours=20)))
+        assert len(text.splitlines()) == 5
+
+    def test_empty_csv_has_header(self, engine):
+        """Test that an empty CSV export still carries the column header."""
+        text = "".join(export.stream("appointments", "csv", statuses=["CANCELLED"]))
+        assert text.startswith("id,request_id,doctor_id")
+        assert len(text.splitlines()) == 1
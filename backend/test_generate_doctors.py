@@ -0,0 +1,45 @@
+"""
+Unit Tests for the synthetic data generator.
+
+Run: pytest test_generate_doctors.py -v
+"""
+
+import random
+from datetime import datetime
+
+import generate_doctors
+
+
+def generate(n_accounts, n_requests=300, n_appointments=20):
+    rng = random.Random(7)
+    accounts = [
+        {"id": 1000 + i, "specialty": generate_doctors.specialties[i % len(generate_doctors.specialties)]}
+        for i in range(n_accounts)
+    ]
+    rows = list(generate_doctors.iter_requests_and_appointments(
+        rng, n_requests, n_appointments, 50, accounts, datetime(2030, 1, 1)
+    ))
+    return {a["id"]: a["specialty"] for a in accounts}, rows
+
+
+class TestRequestsAndAppointments:
+    """Test suite for iter_requests_and_appointments."""
+
+    def test_handlers_match_the_request_specialty(self):
+        """Test that viewed/rejected/booked requests are handled by a doctor of their specialty."""
+        specialty_of, rows = generate(n_accounts=3)  # most specialties have no account
+        requests = [row for kind, row in rows if kind == "request"]
+        handled = [r for r in requests if r["doctor_id"] is not None]
+        assert handled
+        for r in handled:
+            assert specialty_of[r["doctor_id"]] == r["specialty"]
+            assert r["handled_by"] == r["doctor_id"]
+
+    def test_unhandled_statuses_have_no_doctor(self):
+        """Test that viewed/rejected only appear with a handler, and booked requests get one appointment."""
+        _, rows = generate(n_accounts=3)
+        requests = [row for kind, row in rows if kind == "request"]
+        appointments = [row for kind, row in rows if kind == "appointment"]
+        for r in requests:
+            assert (r["status"] in ("viewed", "rejected", "booked")) == (r["doctor_id"] is not None)
+        assert len(appointments) == sum(r["status"] == "booked" for r in requests) == 20
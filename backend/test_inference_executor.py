@@ -0,0 +1,154 @@
+"""
+Unit Tests for the dedicated /triage inference executor.
+
+Run: pytest test_inference_executor.py -v
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+
+import joblib
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.dummy import DummyClassifier
+
+import api
+from inference_executor import ExecutorBusy, InferenceExecutor
+from triage_pipeline import make_feature_frame
+
+
+ARGS = ("ear pain", 30, False, False, 2)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """A tiny fitted classifier that always predicts ENT, saved like triage_model.pkl."""
+    features = pd.concat([make_feature_frame(*ARGS), make_feature_frame("cough", 40, True, False, 3)])
+    model = DummyClassifier(strategy="constant", constant="ENT").fit(features, ["ENT", "GP"])
+    path = tmp_path / "model.pkl"
+    joblib.dump(model, path)
+    return str(path)
+
+
+def submit(executor, *args):
+    return asyncio.run(executor.submit(*(args or ARGS)))
+
+
+@contextmanager
+def saturated(executor):
+    """Keep one call blocked in the executor (from another thread) for the duration."""
+    release = threading.Event()
+    executor._fn = lambda *args: release.wait(5)
+    holder = threading.Thread(target=submit, args=(executor,))
+    holder.start()
+    try:
+        while executor.in_flight == 0:
+            time.sleep(0.005)
+        yield
+    finally:
+        release.set()
+        holder.join()
+
+
+class TestModes:
+    """Test suite for thread and process executors."""
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_inference_runs(self, model_path, mode):
+        """Test that both modes return the combined prediction and stage timings."""
+        executor = InferenceExecutor(joblib.load(model_path), model_path, mode=mode, max_workers=1)
+        try:
+            (specialty, confidence, reason), timings = submit(executor)
+        finally:
+            executor.shutdown()
+        assert specialty == "ENT" and confidence == 1.0
+        assert {"feature_prep", "vectorize", "classify", "rules"} <= set(timings)
+        assert executor.stats()["completed"] == 1
+
+    def test_unknown_mode(self, model_path):
+        """Test that a typo in TRIAGE_EXECUTOR fails loudly."""
+        with pytest.raises(ValueError):
+            InferenceExecutor(None, model_path, mode="fiber")
+
+
+class TestCounters:
+    """Test suite for the executor's completed/errors/rejected counters."""
+
+    def test_failed_inference_counts_as_error(self, model_path):
+        """Test that a call that raised is not counted as completed."""
+        executor = InferenceExecutor(DummyClassifier(), model_path, max_workers=1)  # not fitted
+        try:
+            with pytest.raises(Exception):
+                submit(executor)
+        finally:
+            executor.shutdown()
+        stats = executor.stats()
+        assert (stats["completed"], stats["errors"], stats["in_flight"]) == (0, 1, 0)
+
+    def test_full_queue_rejects(self, model_path):
+        """Test that calls beyond max_workers + max_queue raise ExecutorBusy."""
+        executor = InferenceExecutor(joblib.load(model_path), model_path, max_workers=1, max_queue=0)
+        try:
+            with saturated(executor), pytest.raises(ExecutorBusy):
+                submit(executor)
+        finally:
+            executor.shutdown()
+        assert executor.stats()["rejected"] == 1
+
+
+class TestBusyResponse:
+    """Test suite for /triage when the executor is saturated."""
+
+    def test_busy_executor_is_503_with_retry_after(self, monkeypatch, model_path):
+        """Test that ExecutorBusy becomes a 503 carrying Retry-After."""
+        executor = InferenceExecutor(joblib.load(model_path), model_path, max_workers=1, max_queue=0)
+        monkeypatch.setattr(api, "model", object())
+        monkeypatch.setattr(api, "inference_executor", executor)
+        api.triage_cache.clear()
+        try:
+            with saturated(executor):
+                response = TestClient(api.app).post("/triage", json={
+                    "symptoms_text": "sore throat", "age": 25, "fever": True, "chest_pain": False,
+                    "duration_days": 1
+                })
+        finally:
+            executor.shutdown()
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+
+class TestCancellation:
+    """Test suite for in_flight accounting when the awaiting request goes away."""
+
+    def test_cancelled_call_keeps_its_slot_until_the_pool_is_done(self, model_path):
+        """Test that cancelling a running call holds in_flight, and cancelling a queued one frees it."""
+        executor = InferenceExecutor(joblib.load(model_path), model_path, max_workers=1, max_queue=1)
+        release = threading.Event()
+        executor._fn = lambda *args: release.wait(5)
+
+        async def cancel_both():
+            running = asyncio.ensure_future(executor.submit(*ARGS))
+            queued = asyncio.ensure_future(executor.submit(*ARGS))
+            await asyncio.sleep(0.05)
+            assert executor.in_flight == 2
+            for task in (queued, running):
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        try:
+            asyncio.run(cancel_both())
+            # The queued call never started; the running one is still in the pool
+            assert executor.stats()["in_flight"] == 1
+            release.set()
+            deadline = time.monotonic() + 5
+            while executor.in_flight and time.monotonic() < deadline:
+                time.sleep(0.005)
+        finally:
+            release.set()
+            executor.shutdown()
+        stats = executor.stats()
+        assert (stats["in_flight"], stats["completed"], stats["errors"]) == (0, 1, 1)
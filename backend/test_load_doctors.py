@@ -0,0 +1,132 @@
+"""
+Unit Tests for the doctor directory bulk loader.
+
+Run: pytest test_load_doctors.py -v
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.pool import StaticPool
+
+from app import load_doctors
+from app.database import Base
+from app.models import Doctor
+
+
+def write_directory(tmp_path, records, name="doctors.json"):
+    path = tmp_path / name
+    if name.endswith(".ndjson"):
+        path.write_text("\n".join(json.dumps(r) for r in records))
+    else:
+        path.write_text(json.dumps(records))
+    return str(path)
+
+
+def directory(n, start=1, with_id=True):
+    records = []
+    for i in range(start, start + n):
+        record = {"name": f"Dr. {i}", "specialty": "ENT", "city": "Pune", "pincode": 411001,
+                  "lat": 18.5 + i / 1000, "lng": 73.8}
+        if with_id:
+            record["id"] = i
+        records.append(record)
+    return records
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    monkeypatch.setattr(load_doctors, "engine", engine)
+    return engine
+
+
+def count(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(Doctor.__table__)).scalar()
+
+
+def index_names(engine):
+    with engine.connect() as conn:
+        return {r[0] for r in conn.execute(text("SELECT name FROM sqlite_master WHERE type='index'"))}
+
+
+class TestLoad:
+    """Test suite for load_doctors.load."""
+
+    def test_reload_into_existing_database(self, engine, tmp_path):
+        """Test that loading twice (with --replace) works once the expression index exists."""
+        Base.metadata.create_all(bind=engine)
+        path = write_directory(tmp_path, directory(5))
+        assert load_doctors.load(path) == 5
+        assert load_doctors.load(path, replace=True) == 5
+        assert count(engine) == 5
+        assert "ix_doctors_specialty_lat_lng" in index_names(engine)
+
+    def test_later_batch_without_ids(self, engine, tmp_path):
+        """Test that records without an id after a batch with ids get table-assigned ids."""
+        records = directory(3) + directory(4, start=100, with_id=False)
+        path = write_directory(tmp_path, records, "doctors.ndjson")
+        assert load_doctors.load(path, batch_size=2) == 7
+        with engine.connect() as conn:
+            ids = sorted(r[0] for r in conn.execute(select(Doctor.id)))
+        assert ids[:3] == [1, 2, 3]
+        assert len(set(ids)) == 7
+
+    def test_mixed_batch(self, engine, tmp_path):
+        """Test that a single batch mixing records with and without ids loads."""
+        records = directory(2, with_id=False) + directory(2, start=50)
+        path = write_directory(tmp_path, records)
+        assert load_doctors.load(path, batch_size=10) == 4
+        assert count(engine) == 4
+
+    def test_failed_replace_keeps_previous_directory(self, engine, tmp_path):
+        """Test that --replace failing midway leaves the old directory in place."""
+        load_doctors.load(write_directory(tmp_path, directory(5)))
+        bad = directory(3, start=10) + directory(1, start=10)  # duplicate id in a later batch
+        with pytest.raises(Exception):
+            load_doctors.load(write_directory(tmp_path, bad, "bad.json"), batch_size=2, replace=True)
+        assert count(engine) == 5
+        with engine.connect() as conn:
+            assert conn.execute(select(func.min(Doctor.id))).scalar() == 1
+        assert "ix_doctors_specialty_lat_lng" in index_names(engine)
+
+    def test_replace_keeps_links(self, engine, tmp_path):
+        """Test that links to doctor accounts survive --replace for ids loaded again."""
+        records = directory(3)
+        records[0]["user_id"] = 42
+        path = write_directory(tmp_path, records)
+        load_doctors.load(path)
+        load_doctors.load(write_directory(tmp_path, directory(3), "again.json"), replace=True)
+        with engine.connect() as conn:
+            assert conn.execute(select(Doctor.user_id).where(Doctor.id == 1)).scalar() == 42
+
+    def test_existing_ids_are_updated(self, engine, tmp_path):
+        """Test that a load without --replace updates entries whose id is already in the table."""
+        records = directory(5)
+        records[2]["user_id"] = 42
+        load_doctors.load(write_directory(tmp_path, records))
+        update = directory(5, start=3)  # ids 3-7: three existing, two new
+        for record in update:
+            record["name"] += " (moved)"
+        update.append(dict(update[0], name="Dr. 3 (moved again)"))  # repeated within the chunk
+        assert load_doctors.load(write_directory(tmp_path, update, "update.json"), batch_size=10) == 6
+        assert count(engine) == 7
+        with engine.connect() as conn:
+            assert conn.execute(select(Doctor.name, Doctor.user_id).where(Doctor.id == 3)).one() == \
+                ("Dr. 3 (moved again)", 42)
+            assert conn.execute(select(Doctor.name).where(Doctor.id == 1)).scalar() == "Dr. 1"
+
+    def test_failed_load_restores_indexes(self, engine, tmp_path, monkeypatch):
+        """Test that a load failing partway still leaves the indexes in place."""
+        load_doctors.load(write_directory(tmp_path, directory(2)))
+
+        def broken(conn, rows):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(load_doctors, "insert_executemany", broken)
+        with pytest.raises(RuntimeError):
+            load_doctors.load(write_directory(tmp_path, directory(3, start=10), "more.json"))
+        assert count(engine) == 2
+        assert "ix_doctors_specialty_lat_lng" in index_names(engine)
@@ -0,0 +1,95 @@
+"""
+Unit Tests for the /api/symptom-recommendations response cache.
+
+Run: pytest test_recommendation_cache.py -v
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+import geohash
+from result_cache import TTLCache
+
+
+ANSWERS = {
+    "q1": "Chest / breathing / heart", "q2": "Sharp / stabbing", "q3": "No",
+    "q4": "No", "q5": "No", "q6": "No", "q7": "No", "q8": "No", "q9": "No", "q10": "No",
+}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TTLCache(maxsize=16, ttl=60)
+    monkeypatch.setattr(api, "recommendation_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def coarse_cells(monkeypatch):
+    """~5 km cells, so one cell spans many candidate doctors."""
+    monkeypatch.setattr(api, "SYMPTOM_CACHE_GEOHASH_PRECISION", 5)
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.app)
+
+
+class TestGeohash:
+    """Test suite for geohash snapping."""
+
+    def test_known_value(self):
+        """Test a reference geohash."""
+        assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_centre_is_inside_cell(self):
+        """Test that decoding returns a point inside the encoded cell."""
+        cell = geohash.encode(19.076, 72.8777, 6)
+        lat, lng = geohash.decode(cell)
+        min_lat, min_lng, max_lat, max_lng = geohash.bounds(cell)
+        assert min_lat <= 19.076 <= max_lat and min_lng <= 72.8777 <= max_lng
+        assert geohash.encode(lat, lng, 6) == cell
+
+
+class TestRecommendationCache:
+    """Test suite for caching recommendations per answers and location cell."""
+
+    def post(self, client, lat, lng, answers=ANSWERS):
+        return client.post("/api/symptom-recommendations",
+                           json={"answers": answers, "patientLocation": {"lat": lat, "lng": lng}})
+
+    def test_neighbours_share_an_entry(self, client, cache):
+        """Test that two patients in the same cell share one cache entry."""
+        first = self.post(client, 19.07600, 72.87770)
+        second = self.post(client, 19.07610, 72.87775)
+        assert first.status_code == second.status_code == 200
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_cached_responses_use_the_patients_own_location(self, client, cache, coarse_cells):
+        """Test that every point of a cell gets the ranking and distances of an uncached lookup."""
+        min_lat, min_lng, max_lat, max_lng = geohash.bounds(geohash.encode(19.076, 72.8777, 5))
+        rng = random.Random(7)
+        points = [(min_lat, min_lng), (max_lat - 1e-9, max_lng - 1e-9)]
+        points += [(rng.uniform(min_lat, max_lat), rng.uniform(min_lng, max_lng)) for _ in range(20)]
+        for lat, lng in points:
+            for answers in (ANSWERS, {**ANSWERS, "q1": "Skin"}):
+                response = self.post(client, lat, lng, answers=answers)
+                assert response.json() == api.build_recommendations(answers, lat, lng)
+        assert cache.misses == 2
+
+    def test_different_cells_and_answers_miss(self, client, cache):
+        """Test that another neighbourhood or answer set is computed separately."""
+        self.post(client, 19.076, 72.8777)
+        self.post(client, 28.6139, 77.2090)
+        self.post(client, 19.076, 72.8777, answers={**ANSWERS, "q1": "Skin"})
+        assert cache.hits == 0 and cache.misses == 3
+
+    def test_directory_reload_invalidates(self, client, cache):
+        """Test that swapping the doctor directory drops cached responses."""
+        self.post(client, 19.076, 72.8777)
+        api.doctor_directory.check(force=True)
+        self.post(client, 19.076, 72.8777)
+        assert cache.misses == 2
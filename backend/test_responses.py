@@ -0,0 +1,87 @@
+"""
+Unit Tests for the fast JSON response class and response compression.
+
+Run: pytest test_responses.py -v
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app import compression, responses
+from app.compression import CompressionMiddleware
+from app.responses import DEFAULT_RESPONSE_CLASS, FastJSONResponse
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+demo = FastAPI(default_response_class=DEFAULT_RESPONSE_CLASS)
+demo.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+@demo.get("/small")
+def small():
+    return {"ok": True}
+
+
+@demo.get("/large")
+def large():
+    return {"doctors": [{"name": f"Dr. {i}", "specialty": "Cardiology", "city": "Pune"} for i in range(100)]}
+
+
+@demo.get("/item", response_model=Item)
+def item():
+    return {"id": 1, "name": "x", "extra": "dropped"}
+
+
+class TestFastJSONResponse:
+    """Test suite for FastJSONResponse."""
+
+    def test_renders_same_json_as_stdlib(self):
+        """Test that the selected renderer and stdlib agree on the decoded value."""
+        payload = {"a": [1, 2.5, None, "é"], "b": {"nested": True}}
+        assert json.loads(FastJSONResponse(payload).body) == payload
+        assert json.loads(responses.dumps_stdlib(payload)) == payload
+
+    @pytest.mark.skipif(responses.orjson is None, reason="orjson not installed")
+    def test_orjson_accepts_numpy_and_int_keys(self):
+        """Test that orjson rendering handles numpy values and non-str keys."""
+        import numpy as np
+        assert json.loads(responses.dumps_orjson({1: np.float64(0.5), "v": np.array([1, 2])})) == {"1": 0.5, "v": [1, 2]}
+
+    def test_response_model_routes_still_filter(self):
+        """Test that routes with a response_model keep their validation."""
+        response = TestClient(demo).get("/item")
+        assert response.json() == {"id": 1, "name": "x"}
+
+
+class TestCompressionMiddleware:
+    """Test suite for CompressionMiddleware."""
+
+    def test_large_bodies_are_gzipped(self):
+        """Test that bodies above the threshold are gzip encoded."""
+        response = TestClient(demo).get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["doctors"]) == 100
+
+    def test_small_bodies_are_not_compressed(self):
+        """Test that bodies below the threshold go out as-is."""
+        response = TestClient(demo).get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_identity_when_not_accepted(self):
+        """Test that clients not accepting gzip get plain bodies."""
+        response = TestClient(demo).get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_brotli_preferred_when_available(self):
+        """Test that br is used only when the brotli package is installed."""
+        response = TestClient(demo).get("/large", headers={"Accept-Encoding": "gzip, br"})
+        expected = "br" if compression.brotli is not None else "gzip"
+        assert response.headers["content-encoding"] == expected
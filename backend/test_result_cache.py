@@ -0,0 +1,65 @@
+"""
+Unit Tests for the LRU/TTL result cache.
+
+Run: pytest test_result_cache.py -v
+"""
+
+from result_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache eviction, expiry and invalidation."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        assert cache.get('k') is None
+        cache.set('k', 1)
+        assert cache.get('k') == 1
+        stats = cache.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.stats()['evictions'] == 1
+
+    def test_entries_expire(self):
+        """Test that entries older than the TTL are treated as misses."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.set('k', 1)
+        clock.now = 9.9
+        assert cache.get('k') == 1
+        clock.now = 10.0
+        assert cache.get('k') is None
+
+    def test_version_change_clears(self):
+        """Test that a new model version invalidates every entry."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set_version('v1')
+        cache.set('k', 1)
+        cache.set_version('v1')
+        assert cache.get('k') == 1
+        cache.set_version('v2')
+        assert cache.get('k') is None
+
+    def test_disabled_cache(self):
+        """Test that maxsize=0 disables caching."""
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set('k', 1)
+        assert cache.get('k') is None
@@ -0,0 +1,39 @@
+"""
+Unit Tests for request severity scoring.
+
+Run: pytest test_severity.py -v
+"""
+
+from app import severity
+
+
+MILD = ['Head / neurological', 'Dull / aching', 'No', 'No', 'No', 'No', 'No', 'No', 'No', 'No']
+
+
+class TestSeverity:
+    """Test suite for the server-side port of calculateSeverity()."""
+
+    def test_mild_answers(self):
+        """Test that answers without red flags score Low."""
+        assert severity.score(MILD) == 0
+        assert severity.level(0) == 'Low'
+
+    def test_red_flags_add_up(self):
+        """Test the same weights and thresholds as the frontend."""
+        answers = list(MILD)
+        answers[5] = 'Yes — severe or sudden'
+        answers[1] = 'Sharp / stabbing'
+        assert severity.score(answers) == 5
+        assert severity.level(5) == 'High'
+        answers[0] = 'Chest / breathing / heart'
+        assert severity.level(severity.score(answers)) == 'Critical'
+
+    def test_triage_flags(self):
+        """Test that chest pain and fever from /triage raise the score."""
+        assert severity.score(MILD, chest_pain=True, fever=True) == 3
+        assert severity.level(3) == 'Moderate'
+
+    def test_short_or_missing_answers(self):
+        """Test that incomplete answer lists are scored without errors."""
+        assert severity.score(None) == 0
+        assert severity.score(['Chest / breathing / heart']) == 1
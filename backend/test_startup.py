@@ -0,0 +1,83 @@
+"""
+Unit Tests for lifespan startup and the per-phase startup report.
+
+Run: pytest test_startup.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+import api
+from app.models import User
+from app.startup import StartupReport
+
+
+class TestStartupReport:
+    """Test suite for StartupReport."""
+
+    def test_phases_are_recorded_in_order(self):
+        """Test that import and lifespan phases are timed and totalled."""
+        report = StartupReport("demo")
+        report.imported()
+        with report.phase("schema"):
+            pass
+        with report.phase("models"):
+            pass
+        report.finish()
+        data = report.as_dict()
+        assert data["ready"] is True
+        assert list(data["phases_ms"]) == ["import", "schema", "models"]
+        assert data["total_ms"] == round(report.total() * 1000, 3)
+
+    def test_failed_phase_is_still_timed(self):
+        """Test that a phase raising an exception is recorded before it propagates."""
+        report = StartupReport("demo")
+        try:
+            with report.phase("schema"):
+                raise RuntimeError("db down")
+        except RuntimeError:
+            pass
+        assert "schema" in report.phases
+        assert report.ready is False
+
+
+class TestApiLifespan:
+    """Test suite for the api:app lifespan."""
+
+    def test_importing_api_skips_heavy_modules(self):
+        """Test that sklearn/pandas, google-auth and the app database/auth stack are loaded only when needed."""
+        code = ("import sys, api; print(sorted(m for m in ('sklearn', 'pandas', 'joblib', 'google.oauth2', "
+                "'sqlalchemy', 'jose', 'passlib') if m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_lifespan_reports_every_phase(self):
+        """Test that the startup endpoint lists the lifespan phases."""
+        api.app.dependency_overrides[api.require_admin] = lambda: User(username="admin", role="admin")
+        try:
+            with TestClient(api.app) as client:
+                data = client.get("/api/admin/startup").json()
+        finally:
+            api.app.dependency_overrides.clear()
+        assert data["ready"] is True
+        assert {"import", "schema", "models", "doctor_directory"} <= set(data["phases_ms"])
+
+
+class TestApiAdminAuth:
+    """Test suite for authentication on api:app's /api/admin endpoints."""
+
+    def test_admin_endpoints_require_a_token(self):
+        """Test that every admin endpoint answers 401 without a bearer token."""
+        client = TestClient(api.app)
+        for method, path in [
+            ("GET", "/api/admin/admission"),
+            ("GET", "/api/admin/directory"),
+            ("GET", "/api/admin/startup"),
+            ("POST", "/api/admin/directory/reload"),
+            ("POST", "/api/admin/model/reload"),
+        ]:
+            assert client.request(method, path).status_code == 401, path
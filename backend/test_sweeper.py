@@ -0,0 +1,72 @@
+"""
+Unit Tests for the stale request / past appointment sweeper.
+
+Run: pytest test_sweeper.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Appointment, AppointmentArchive, TriageRequest
+from app.sweeper import Sweeper
+
+
+NOW = datetime(2030, 1, 10, 12, 0)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for i, (status, age) in enumerate([("new", 100), ("claimed", 100), ("viewed", 100), ("booked", 100),
+                                       ("new", 1), ("pending", 80)]):
+        session.add(TriageRequest(id=i + 1, symptom=f"s{i}", specialty="ENT", status=status,
+                                  created_at=NOW - timedelta(hours=age)))
+    for i, (status, ended) in enumerate([("CONFIRMED", 3), ("CONFIRMED", -2), ("PENDING", 3),
+                                         ("CANCELLED", 24 * 40), ("CONFIRMED", 24 * 40)]):
+        end = NOW - timedelta(hours=ended)
+        session.add(Appointment(id=i + 1, doctor_id=1, patient_id=2, status=status,
+                                start_time=end - timedelta(minutes=30), end_time=end))
+    session.commit()
+    session.close()
+    return engine
+
+
+def statuses(engine, model):
+    session = sessionmaker(bind=engine)()
+    try:
+        return [r.status for r in session.query(model).order_by(model.id)]
+    finally:
+        session.close()
+
+
+class TestSweeper:
+    """Test suite for Sweeper.run_once."""
+
+    def test_retires_stale_rows_in_batches(self, engine):
+        """Test that stale requests expire and ended appointments are closed, batch by batch."""
+        sweeper = Sweeper(engine=engine, batch_size=1, clock=lambda: NOW)
+        result = sweeper.run_once()
+        assert result == {"requests_expired": 4, "appointments_completed": 2,
+                          "appointments_expired": 1, "appointments_archived": 0}
+        assert statuses(engine, TriageRequest) == ["expired", "expired", "expired", "booked", "new", "expired"]
+        assert statuses(engine, Appointment) == ["COMPLETED", "CONFIRMED", "EXPIRED", "CANCELLED", "COMPLETED"]
+
+    def test_second_sweep_is_a_no_op(self, engine):
+        """Test that sweeping again changes nothing."""
+        sweeper = Sweeper(engine=engine, clock=lambda: NOW)
+        sweeper.run_once()
+        assert not any(sweeper.run_once().values())
+
+    def test_archive_moves_old_finished_appointments(self, engine):
+        """Test that finished appointments past the archive cutoff move to the cold table."""
+        sweeper = Sweeper(engine=engine, batch_size=1, archive_after=timedelta(days=30), clock=lambda: NOW)
+        assert sweeper.run_once()["appointments_archived"] == 2
+        assert statuses(engine, Appointment) == ["COMPLETED", "CONFIRMED", "EXPIRED"]
+        assert sorted(statuses(engine, AppointmentArchive)) == ["CANCELLED", "COMPLETED"]
@@ -0,0 +1,137 @@
+"""
+Unit Tests for the compact MCQ symptom classifier engine.
+
+Run: pytest test_symptom_model.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import api
+from symptom_model import SPECIALTY_NAMES, SymptomModel, QUESTIONS, load_symptom_model
+
+BACKEND = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module")
+def trained_model(tmp_path_factory):
+    """The MCQ model as train_symptom_model.py builds it from symptom_dataset.csv."""
+    out = tmp_path_factory.mktemp("symptom") / "symptom_model.json"
+    subprocess.run([sys.executable, "train_symptom_model.py", "--out", str(out)],
+                   cwd=BACKEND, capture_output=True, check=True)
+    return load_symptom_model(str(out))
+
+
+def make_spec():
+    """Three-disease model where q1='a' strongly favours FLU and q1='b' favours MI."""
+    weights = {q: {'a': [0.0] * 3, 'b': [0.0] * 3, 'c': [0.0] * 3} for q in QUESTIONS}
+    weights['q1'] = {'a': [4.0, -4.0, -4.0], 'b': [-4.0, 4.0, -4.0], 'c': [0.0, 0.0, 0.0]}
+    return {
+        "diseases": ["VIR_FLU", "AC_MI", "MIGRAINE"],
+        "disease_names": {"VIR_FLU": "Viral Influenza", "AC_MI": "Acute Myocardial Infarction"},
+        "disease_specialties": {"VIR_FLU": ["GP", "PULM"], "AC_MI": ["ER", "CARDIO"], "MIGRAINE": ["NEURO", "GP"]},
+        "intercept": [0.0, 0.0, 0.0],
+        "weights": weights
+    }
+
+
+class TestSymptomModel:
+    """Test suite for the JSON-weight inference engine."""
+
+    def test_probabilities_sum_to_one(self):
+        """Test that disease probabilities form a distribution."""
+        model = SymptomModel(make_spec())
+        probs = model.disease_probabilities({'q1': 'a', 'q2': 'b'})
+        assert sum(probs) == pytest.approx(1.0)
+
+    def test_top_disease_and_specialties(self):
+        """Test that specialty probabilities roll up from disease probabilities."""
+        model = SymptomModel(make_spec())
+        result = model.predict({'q1': 'b'})
+        assert result['diseases'][0][0] == 'AC_MI'
+        names = [name for name, _ in result['specialties']]
+        assert set(names[:2]) == {'GP', 'Cardiology'}
+        total = dict(result['specialties'])
+        assert total['Cardiology'] == pytest.approx(result['diseases'][0][2])
+
+    def test_unknown_answers_are_ignored(self):
+        """Test that missing or invalid options fall back to the intercept."""
+        model = SymptomModel(make_spec())
+        probs = model.disease_probabilities({'q1': 'z'})
+        assert probs == pytest.approx([1 / 3] * 3)
+
+
+class TestRecommendSpecialties:
+    """Test suite for model/rules selection in the recommendations endpoint."""
+
+    def test_falls_back_to_rules_without_model(self, monkeypatch):
+        """Test that the deterministic mapper is used when no model is loaded."""
+        monkeypatch.setattr(api, 'symptom_model', None)
+        specialties, source, diseases = api.recommend_specialties({'q1': 'b', 'q6': 'a'})
+        assert source == 'rules'
+        assert 'Cardiology' in specialties
+        assert diseases == []
+
+    def test_uses_confident_model(self, monkeypatch):
+        """Test that a confident model prediction is preferred over the mapper."""
+        monkeypatch.setattr(api, 'symptom_model', SymptomModel(make_spec()))
+        specialties, source, diseases = api.recommend_specialties({'q1': 'a'})
+        assert source == 'model'
+        assert specialties == ['GP']
+        assert diseases[0]['code'] == 'VIR_FLU'
+
+    def test_low_confidence_model_falls_back(self, monkeypatch):
+        """Test that an unsure model defers to the mapper."""
+        monkeypatch.setattr(api, 'symptom_model', SymptomModel(make_spec()))
+        _, source, _ = api.recommend_specialties({'q1': 'c'})
+        assert source == 'rules'
+
+
+class TestDefaultRecommendations:
+    """Test suite for recommendations as served with the default configuration."""
+
+    UNAMBIGUOUS = [
+        ({'q10': 'a'}, 'Obstetrics/Gynecology'),    # pregnancy
+        ({'q1': 'c', 'q8': 'a'}, 'Orthopedics'),    # fracture
+        ({'q9': 'a'}, 'Psychiatry'),                # severe mental health
+    ]
+
+    @staticmethod
+    def answers(overrides):
+        answers = {q: 'c' for q in QUESTIONS}
+        answers.update(overrides)
+        return answers
+
+    def test_model_is_off_by_default(self, monkeypatch):
+        """Test that load_models() leaves the codebook-encoded model unloaded."""
+        monkeypatch.setattr(api, 'symptom_model', None)
+        monkeypatch.setattr(api, 'model', object())  # skip the triage pickle
+        monkeypatch.setattr(api, 'inference_executor', object())
+        assert api.SYMPTOM_MODEL_ENABLED is False
+        api.load_models()
+        assert api.symptom_model is None
+
+    @pytest.mark.parametrize("overrides,expected", UNAMBIGUOUS)
+    def test_unambiguous_answers_match_mapper(self, monkeypatch, overrides, expected):
+        """Test that clear-cut answers get the mapper's specialty."""
+        monkeypatch.setattr(api, 'symptom_model', None)
+        answers = self.answers(overrides)
+        specialties, source, _ = api.recommend_specialties(answers)
+        assert specialties == api.map_answers_to_specialties(answers)
+        assert expected in specialties
+
+    @pytest.mark.parametrize("overrides,expected", UNAMBIGUOUS)
+    def test_enabled_model_does_not_override_red_flags(self, monkeypatch, trained_model, overrides, expected):
+        """Test that with the trained model loaded, clear-cut answers still get their specialty."""
+        monkeypatch.setattr(api, 'symptom_model', trained_model)
+        specialties, source, _ = api.recommend_specialties(self.answers(overrides))
+        assert source == 'rules'
+        assert expected in specialties
+
+    def test_model_specialties_exist_in_directory(self):
+        """Test that every specialty the model can predict has doctors to show."""
+        store = api.get_doctor_store()
+        for name in set(SPECIALTY_NAMES.values()) - {'GP'}:
+            assert len(store.indices_for_specialty(api.SPECIALTY_ALIASES.get(name, name))), name
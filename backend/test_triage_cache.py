@@ -0,0 +1,78 @@
+"""
+Unit Tests for the /triage result cache and model reloads.
+
+Run: pytest test_triage_cache.py -v
+"""
+
+import joblib
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+
+class RecordingExecutor:
+    """Stands in for InferenceExecutor; records what inference was asked to run on."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def submit(self, *args):
+        self.calls.append(args)
+        return ("ENT", 0.9, f"ML Prediction for {args[0]}"), {}
+
+    def shutdown(self, wait=True, cancel_futures=True):
+        pass
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = RecordingExecutor()
+    monkeypatch.setattr(api, "model", object())
+    monkeypatch.setattr(api, "inference_executor", executor)
+    api.triage_cache.clear()
+    yield executor
+    api.triage_cache.clear()
+
+
+def triage(client, text):
+    return client.post("/triage", json={
+        "symptoms_text": text, "age": 30, "fever": False, "chest_pain": False, "duration_days": 2
+    })
+
+
+class TestTriageCache:
+    """Test suite for caching /triage results by normalized input."""
+
+    def test_inference_runs_on_the_normalized_text(self, executor):
+        """Test that the cached result is computed from the cache key's text."""
+        client = TestClient(api.app)
+        first = triage(client, "  Ear   PAIN ")
+        second = triage(client, "ear pain")
+        assert first.status_code == 200
+        assert executor.calls == [("ear pain", 30, False, False, 2)]
+        assert first.json() == second.json()
+
+
+class TestReloadModel:
+    """Test suite for api.reload_model."""
+
+    def test_changed_model_file_invalidates_the_cache(self, executor, monkeypatch, tmp_path):
+        """Test that loading a changed model file bumps model_version and empties the cache."""
+        path = tmp_path / "model.pkl"
+        joblib.dump({"weights": [1]}, path)
+        monkeypatch.setattr(api, "MODEL_PATH", str(path))
+        monkeypatch.setattr(api, "model_version", api.file_version(str(path)))
+        api.triage_cache.set_version(api.model_version)
+        api.triage_cache.set(("ear pain", 30, False, False, 2), ("ENT", 0.9, "cached"))
+
+        assert api.reload_model() is False  # unchanged file
+        assert api.triage_cache.stats()["size"] == 1
+
+        joblib.dump({"weights": [2]}, path)
+        assert api.reload_model() is True
+        assert api.model == {"weights": [2]}
+        assert api.triage_cache.version == api.model_version == api.file_version(str(path))
+        assert api.triage_cache.stats()["size"] == 0
+        assert api.inference_executor is not executor
+        api.inference_executor.shutdown()
@@ -0,0 +1,101 @@
+"""
+Unit Tests for the hashing-vectorizer + SGD triage model and its partial_fit streamer.
+
+Run: pytest test_triage_pipeline.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import joblib
+import pandas as pd
+import pytest
+
+from triage_pipeline import (
+    build_pipeline, make_feature_frame, partial_fit_batches, prepare_training_frame, supports_partial_fit
+)
+
+
+BACKEND = os.path.dirname(os.path.abspath(__file__))
+CLASSES = ["Cardiology", "Dermatology", "ENT"]
+PHRASES = {
+    "Cardiology": "crushing chest pain radiating to left arm",
+    "Dermatology": "itchy red rash spreading on skin",
+    "ENT": "ear pain and blocked ear with ringing",
+}
+
+
+def outcomes(specialties, repeat=10):
+    """Labelled rows in triage_dataset.csv layout."""
+    rows = []
+    for i in range(repeat):
+        for specialty in specialties:
+            rows.append({
+                "id": len(rows) + 1, "symptoms_text": PHRASES.get(specialty, "vague tiredness"),
+                "age": 30 + i, "fever": "no", "chest_pain": "yes" if specialty == "Cardiology" else "no",
+                "duration_days": 1 + i % 3, "specialty": specialty,
+            })
+    return pd.DataFrame(rows)
+
+
+def predict(model, specialty):
+    return model.predict(make_feature_frame(PHRASES[specialty], 40, False, specialty == "Cardiology", 2))[0]
+
+
+class TestHashingPipeline:
+    """Test suite for build_pipeline('hashing') and partial_fit_batches."""
+
+    def test_two_streamed_batches(self):
+        """Test that two batches fold into one model that knows every class."""
+        model = build_pipeline("hashing")
+        assert supports_partial_fit(model)
+        first = prepare_training_frame(outcomes(["Cardiology", "ENT"]))
+        second = prepare_training_frame(outcomes(["Dermatology", "ENT"]))
+
+        rows = partial_fit_batches(model, iter([first, second]), classes=CLASSES)
+        assert rows == len(first[1]) + len(second[1])
+        assert list(model.named_steps["classifier"].classes_) == CLASSES
+        # Dermatology was only in the second batch
+        for specialty in CLASSES:
+            assert predict(model, specialty) == specialty
+
+    def test_first_batch_needs_classes(self):
+        """Test that an untrained classifier refuses a batch without the full label set."""
+        with pytest.raises(ValueError):
+            partial_fit_batches(build_pipeline("hashing"), iter([prepare_training_frame(outcomes(["ENT"]))]))
+
+    def test_tfidf_model_is_not_incremental(self):
+        """Test that the RandomForest pipeline is rejected by the streamer."""
+        model = build_pipeline("tfidf")
+        assert not supports_partial_fit(model)
+        with pytest.raises(ValueError):
+            partial_fit_batches(model, iter([]))
+
+
+class TestUpdateScript:
+    """Test suite for update_triage_model.py."""
+
+    def test_streams_outcomes_into_saved_model(self, tmp_path):
+        """Test that the script updates a saved model in batches and skips unknown specialties."""
+        model = build_pipeline("hashing")
+        partial_fit_batches(model, iter([prepare_training_frame(outcomes(["Cardiology", "ENT"]))]),
+                            classes=CLASSES)
+        model_path = tmp_path / "model.pkl"
+        joblib.dump(model, model_path)
+        data = tmp_path / "new_outcomes.csv"
+        outcomes(["Dermatology", "ENT", "Neurology"], repeat=30).to_csv(data, index=False)
+        out = tmp_path / "updated.pkl"
+
+        result = subprocess.run(
+            [sys.executable, "update_triage_model.py", str(data), "--model", str(model_path),
+             "--out", str(out), "--batch-size", "12"],
+            cwd=BACKEND, capture_output=True, text=True, check=True
+        )
+        assert "Model updated with 60 rows." in result.stdout
+        assert "Skipping" in result.stdout
+
+        updated = joblib.load(out)
+        assert list(updated.named_steps["classifier"].classes_) == CLASSES
+        assert predict(updated, "Dermatology") == "Dermatology"
+        assert predict(updated, "Cardiology") == "Cardiology"
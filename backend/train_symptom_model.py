@@ -0,0 +1,75 @@
+"""
+Train the MCQ disease/specialty classifier on symptom_dataset.csv.
+
+The 10 answers are one-hot encoded (3 options each) and fed to a multinomial
+logistic regression over `top_disease_code`. The fitted weights are exported
+as a small JSON table that symptom_model.py scores without sklearn, so the
+API only needs a few dictionary lookups per prediction.
+
+Run: python train_symptom_model.py [--data symptom_dataset.csv] [--out symptom_model.json]
+"""
+import argparse
+import json
+from collections import Counter
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder
+from symptom_model import OPTIONS, QUESTIONS
+
+parser = argparse.ArgumentParser(description="Train the MCQ symptom classifier")
+parser.add_argument("--data", default="symptom_dataset.csv")
+parser.add_argument("--codebook", default="codebook.json")
+parser.add_argument("--out", default="symptom_model.json")
+args = parser.parse_args()
+
+# 1. Load Data
+df = pd.read_csv(args.data)
+with open(args.codebook) as f:
+    codebook = json.load(f)
+
+# 2. Features and Target
+# Only q1-q10 are used: they are the only inputs /api/symptom-recommendations receives.
+encoder = OneHotEncoder(categories=[list(OPTIONS)] * len(QUESTIONS), handle_unknown='ignore')
+X = encoder.fit_transform(df[QUESTIONS])
+y = df['top_disease_code']
+
+# Specialties are a fixed function of the disease in this dataset, so the
+# engine derives specialty probabilities by summing disease probabilities.
+disease_specialties = {}
+for code, group in df.groupby('top_disease_code'):
+    most_common = Counter(group['specialties']).most_common(1)[0][0]
+    disease_specialties[code] = most_common.split(';')
+
+# 3. Hold-out accuracy
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+clf = LogisticRegression(max_iter=2000)
+clf.fit(X_train, y_train)
+print(f"Hold-out accuracy: {clf.score(X_test, y_test):.3f}")
+
+# 4. Train on everything
+print("Training model...")
+clf = LogisticRegression(max_iter=2000)
+clf.fit(X, y)
+print("Model training complete.")
+
+# 5. Export weights: weights[question][option] -> one float per disease
+weights = {}
+for q_idx, question in enumerate(QUESTIONS):
+    weights[question] = {}
+    for o_idx, option in enumerate(OPTIONS):
+        col = q_idx * len(OPTIONS) + o_idx
+        weights[question][option] = [round(float(w), 6) for w in clf.coef_[:, col]]
+
+model = {
+    "version": 1,
+    "diseases": list(clf.classes_),
+    "disease_names": {c: codebook['diseases'].get(c, c) for c in clf.classes_},
+    "disease_specialties": {c: disease_specialties[c] for c in clf.classes_},
+    "intercept": [round(float(b), 6) for b in clf.intercept_],
+    "weights": weights
+}
+
+with open(args.out, "w") as f:
+    json.dump(model, f, separators=(",", ":"))
+print(f"Model saved as '{args.out}'")
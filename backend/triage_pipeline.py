@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+
+# Shared feature layout for training, incremental updates and the /triage endpoint.
+TEXT_COLUMN = "symptoms_text"
+NUMERIC_COLUMNS = ["age", "fever", "chest_pain", "duration_days"]
+FEATURE_COLUMNS = [TEXT_COLUMN] + NUMERIC_COLUMNS
+TARGET_COLUMN = "specialty"
+
+VECTORIZER_MODES = ("tfidf", "hashing")
+
+# Fixed width of the hashed text space. 2**18 columns keeps the sparse
+# matrices small while making collisions rare for short symptom phrases.
+HASHING_FEATURES = 2 ** 18
+
+
+def make_feature_frame(symptoms_text, age, fever, chest_pain, duration_days):
+    """
+    Build the single-row DataFrame the pipeline expects from one /triage input.
+    ColumnTransformer selects columns by name, so a plain dict is not accepted.
+    """
+    return pd.DataFrame({
+        "symptoms_text": [symptoms_text],
+        "age": [age],
+        "fever": [1 if fever else 0],
+        "chest_pain": [1 if chest_pain else 0],
+        "duration_days": [duration_days]
+    })
+
+
+def prepare_training_frame(df):
+    """
+    Map the yes/no CSV columns to the 0/1 values the API sends and return (X, y).
+    """
+    df = df.copy()
+    df['fever'] = df['fever'].apply(lambda x: 1 if x == 'yes' else 0)
+    df['chest_pain'] = df['chest_pain'].apply(lambda x: 1 if x == 'yes' else 0)
+    return df[FEATURE_COLUMNS], df[TARGET_COLUMN]
+
+
+def build_pipeline(mode="tfidf"):
+    """
+    Build the untrained triage pipeline.
+
+    - tfidf:   TF-IDF vocabulary + RandomForest (the original full-retrain model).
+    - hashing: stateless HashingVectorizer + SGD logistic regression. The text
+               transform has no vocabulary, so the pickle size does not grow with
+               the corpus, and the classifier supports partial_fit for
+               incremental updates (see update_triage_model.py).
+    """
+    if mode == "tfidf":
+        preprocessor = ColumnTransformer(
+            transformers=[
+                ('text', TfidfVectorizer(stop_words='english'), TEXT_COLUMN),
+                ('num', 'passthrough', NUMERIC_COLUMNS)
+            ]
+        )
+        classifier = RandomForestClassifier(n_estimators=100, random_state=42)
+    elif mode == "hashing":
+        preprocessor = ColumnTransformer(
+            transformers=[
+                ('text', HashingVectorizer(
+                    n_features=HASHING_FEATURES,
+                    stop_words='english',
+                    alternate_sign=False,
+                    norm='l2'
+                ), TEXT_COLUMN),
+                # log1p keeps age/duration on the same scale as the hashed text
+                # without a fitted scaler, so the transform stays stateless.
+                ('num', FunctionTransformer(np.log1p), NUMERIC_COLUMNS)
+            ]
+        )
+        classifier = SGDClassifier(loss='log_loss', alpha=1e-4, random_state=42)
+    else:
+        raise ValueError(f"Unknown vectorizer mode '{mode}', expected one of {VECTORIZER_MODES}")
+
+    return Pipeline([
+        ('preprocessor', preprocessor),
+        ('classifier', classifier)
+    ])
+
+
+def supports_partial_fit(model):
+    """True if the pipeline was built in hashing mode and can be updated incrementally."""
+    return hasattr(model.named_steps['classifier'], 'partial_fit')
+
+
+def partial_fit_batches(model, batches, classes=None):
+    """
+    Fold mini-batches of labelled rows into a hashing-mode pipeline.
+
+    `batches` is an iterable of (X, y) pairs as returned by prepare_training_frame.
+    The preprocessor is stateless, so fitting it on the first batch only records
+    the input columns; the classifier is then updated in place with partial_fit.
+    `classes` must list every specialty the model may ever predict the first time
+    an untrained classifier is updated.
+    Returns the number of rows consumed.
+    """
+    if not supports_partial_fit(model):
+        raise ValueError("Model does not support incremental updates; retrain it with the hashing vectorizer")
+
+    preprocessor = model.named_steps['preprocessor']
+    classifier = model.named_steps['classifier']
+
+    rows = 0
+    for X, y in batches:
+        if not hasattr(preprocessor, 'transformers_'):
+            preprocessor.fit(X)
+        Xt = preprocessor.transform(X)
+        if hasattr(classifier, 'classes_'):
+            classifier.partial_fit(Xt, y)
+        else:
+            if classes is None:
+                raise ValueError("classes are required for the first partial_fit call")
+            classifier.partial_fit(Xt, y, classes=classes)
+        rows += len(y)
+    return rows
@@ -0,0 +1,52 @@
+"""
+Fold newly labelled triage outcomes into an existing hashing-mode model.
+
+The CSV uses the same columns as triage_dataset.csv and is streamed in
+mini-batches, so arbitrarily large outcome logs can be applied without
+loading them into memory or retraining from scratch.
+
+Run: python update_triage_model.py new_outcomes.csv --batch-size 5000
+"""
+import argparse
+import pandas as pd
+import joblib
+from triage_pipeline import partial_fit_batches, prepare_training_frame, supports_partial_fit
+
+parser = argparse.ArgumentParser(description="Incrementally update a hashing-mode triage model")
+parser.add_argument("data", help="CSV of labelled outcomes (triage_dataset.csv layout)")
+parser.add_argument("--model", default="triage_model.pkl")
+parser.add_argument("--out", default=None, help="Where to save the updated model (defaults to --model)")
+parser.add_argument("--batch-size", type=int, default=5000)
+args = parser.parse_args()
+
+model = joblib.load(args.model)
+if not supports_partial_fit(model):
+    raise SystemExit(
+        f"{args.model} was not trained with --vectorizer hashing; "
+        "retrain it with train_triage_model.py --vectorizer hashing first"
+    )
+
+classes = model.named_steps['classifier'].classes_
+known = set(classes)
+
+
+def batches():
+    for chunk in pd.read_csv(args.data, chunksize=args.batch_size):
+        X, y = prepare_training_frame(chunk)
+        # SGDClassifier cannot grow its label set after the first fit; rows for
+        # unseen specialties need a full retrain, so skip them here.
+        mask = y.isin(known)
+        skipped = int((~mask).sum())
+        if skipped:
+            print(f"Skipping {skipped} rows with specialties unknown to the model")
+        if mask.any():
+            yield X[mask], y[mask]
+
+
+print("Updating model...")
+rows = partial_fit_batches(model, batches(), classes=classes)
+print(f"Model updated with {rows} rows.")
+
+out = args.out or args.model
+joblib.dump(model, out)
+print(f"Model saved as '{out}'")
@@ -13,6 +13,15 @@ call venv\Scripts\activate
 echo Installing requirements...
 pip install -r requirements.txt
 
+if not exist "triage_model.pkl" (
+    echo Training triage model...
+    python train_triage_model.py
+)
+if not exist "symptom_model.json" (
+    echo Training symptom model...
+    python train_symptom_model.py
+)
+
 echo Starting server...
 set DATABASE_URL=sqlite:///./triage.db
 set SECRET_KEY=dev_secret_key_123